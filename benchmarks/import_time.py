@@ -0,0 +1,49 @@
+"""Benchmark script measuring the time needed to import polyhex.
+
+Each import runs in a fresh interpreter, as in a generation worker. The script reports the median time of the imports, and the optional dependencies they loaded.
+It fails if an import loads an optional dependency, or if the median time exceeds the budget, so that it can guard against regressions.
+Run it with `python benchmarks/import_time.py [statement] [n_runs] [budget_seconds]`, the statement defaulting to each of the `GUARDED_STATEMENTS`.
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+
+from polyhex.utilities.lazy import OPTIONAL_DEPENDENCIES
+
+# Imports that must not load any optional dependency: the package, and the generation workers
+GUARDED_STATEMENTS = ("import polyhex", "import polyhex.datasets.farm")
+
+# Measured in the child interpreter, to leave out its own start-up time
+CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+seconds = time.perf_counter() - start
+loaded = sorted({{name.split('.')[0] for name in sys.modules}} & set({dependencies!r}))
+print(json.dumps({{"seconds": seconds, "loaded": loaded}}))
+"""
+
+
+def time_import(statement: str) -> dict:
+    """Runs `statement` in a fresh interpreter and returns its duration and the optional dependencies it loaded"""
+    script = CHILD_SCRIPT.format(statement=statement, dependencies=sorted(OPTIONAL_DEPENDENCIES))
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    STATEMENTS = (sys.argv[1],) if len(sys.argv) > 1 else GUARDED_STATEMENTS
+    N_RUNS = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    BUDGET = float(sys.argv[3]) if len(sys.argv) > 3 else 1.0
+    failed = False
+    for statement in STATEMENTS:
+        runs = [time_import(statement) for _ in range(N_RUNS)]
+        median = statistics.median(run["seconds"] for run in runs)
+        loaded = sorted({name for run in runs for name in run["loaded"]})
+        print(f"{statement}: {median * 1000:.0f} ms (median of {N_RUNS} runs)")
+        print(f"Optional dependencies loaded: {', '.join(loaded) if loaded else 'none'}")
+        failed |= bool(loaded) or median > BUDGET
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,47 @@
+"""Benchmark script measuring the memory used per hexagon.
+
+It reports the bytes allocated per ``Hexagon``, before and after the creation of its centre, 6 vertices and 6 edges, which are created on first access, and per cell of a ``HexagonStore``.
+Run it with `python benchmarks/memory_per_hexagon.py [n_hexagons]`.
+"""
+
+import sys
+import tracemalloc
+
+import numpy as np
+
+from polyhex.objects.hexagons import Hexagon
+
+
+def bytes_per_object(factory, n: int) -> float:
+    """Returns the bytes allocated per object by `n` calls to `factory`, the objects being kept alive"""
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objects = [factory(index) for index in range(n)]
+    stop, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(objects) == n
+    return (stop - start) / n
+
+
+if __name__ == "__main__":
+    N_HEXAGONS = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    # Warm-up, so that the shared assets and the lazily imported modules are not counted
+    Hexagon()
+    hexagon_bytes = bytes_per_object(lambda index: Hexagon(hex_coord=(index, 0)), N_HEXAGONS)
+    print(f"Hexagon: {hexagon_bytes:.0f} bytes per hexagon")
+
+    def full_hexagon(index: int) -> Hexagon:
+        hexagon = Hexagon(hex_coord=(index, 0))
+        _ = hexagon.centre, hexagon.edges_list
+        return hexagon
+
+    full_bytes = bytes_per_object(full_hexagon, N_HEXAGONS)
+    print(f"Hexagon with its centre, vertices and edges: {full_bytes:.0f} bytes per hexagon")
+    try:
+        from polyhex.objects.stores import HexagonStore
+    except ImportError:
+        pass
+    else:
+        coordinates = np.stack([np.arange(N_HEXAGONS), np.zeros(N_HEXAGONS, dtype=int)], axis=1)
+        store = HexagonStore.from_coordinates(coordinates)
+        print(f"HexagonStore: {store.nbytes() / len(store):.0f} bytes per hexagon")
@@ -9,7 +9,6 @@ hypergraph = {
     "HexagonBorderGraph": HexagonBorderGraph(),
 }
 
-# The spiral creation requires to record the HexagonBorderGraph
 p = Polyhex.create_spiral(3, hypergraph)
 
 p.draw(hypergraph, save_path="spiral")
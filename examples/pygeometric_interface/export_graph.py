@@ -10,7 +10,6 @@ hypergraph = {
     "HexagonBorderGraph": HexagonBorderGraph(),
 }
 
-# The spiral creation requires to record the HexagonBorderGraph
 p = Polyhex.create_spiral(3, hypergraph)
 
 exporter = PyGExporter()
@@ -0,0 +1,23 @@
+"""Example script to export many polyhexes to a single collated PyGeometric object"""
+
+from polyhex.objects import Polyhex
+from polyhex.objects.exporters import PyGExporter
+from polyhex.objects.graphs import HexagonGraph, HexagonBorderGraph
+
+# Creating the hypergraphs
+hypergraphs = []
+for radius in range(1, 5):
+    hypergraph = {
+        "HexagonGraph": HexagonGraph(),
+        "HexagonBorderGraph": HexagonBorderGraph(),
+    }
+    Polyhex.create_spiral(radius, hypergraph)
+    hypergraphs.append(hypergraph)
+
+exporter = PyGExporter()
+
+# The graphs of each name are concatenated, `batch` and `ptr` map the nodes to their polyhex
+pyg_batch = exporter.export_many(hypergraphs)
+
+print(pyg_batch)
+print(pyg_batch["HexagonGraph"].ptr)
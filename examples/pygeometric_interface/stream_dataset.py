@@ -0,0 +1,15 @@
+"""Example script to stream polyhexes to a PyTorch DataLoader"""
+
+from torch.utils.data import DataLoader
+
+from polyhex.datasets import GenerationRecipe, PolyhexStream
+
+# Polyhexes of 5 to 29 hexagons, the samples only depend on the seed and on their index
+recipe = GenerationRecipe("number", sizes=range(5, 30), seed=0)
+
+dataset = PolyhexStream(recipe, num_samples=1000)
+
+loader = DataLoader(dataset, batch_size=None, num_workers=2)
+
+for pyg_heterodata in loader:
+    print(pyg_heterodata["HexagonGraph"].num_nodes)
@@ -1,5 +1,23 @@
 from .objects import *
+from .objects import _LAZY_ATTRIBUTES as _LAZY_OBJECTS
+from polyhex.utilities.lazy import lazy_attributes
 
 __all__ = ()
 
-__all__ += objects.__all__
\ No newline at end of file
+__all__ += objects.__all__
+
+# The datasets depend on torch, and the lazy attributes of ``polyhex.objects`` on matplotlib or torch: they are imported on first access
+_LAZY_ATTRIBUTES = {name: ".objects" for name in _LAZY_OBJECTS if name != "exporters"}
+_LAZY_ATTRIBUTES.update(
+    {
+        name: ".datasets"
+        for name in (
+            "GenerationRecipe", "iter_polyhexes", "iter_exported", "PolyhexStream",
+            "generate_coordinates", "rebuild_polyhex", "generate_polyhexes", "generate_exported",
+            "ShardWriter", "write_shards", "MemmapGraphDataset",
+        )
+    }
+)
+_LAZY_ATTRIBUTES["datasets"] = ".datasets"
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES, globals())
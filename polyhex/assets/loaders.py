@@ -1,8 +1,32 @@
+"""Loaders for the Polyhex assets.
+
+The asset files are parsed once per process and shared by every object that uses them.
+The shared tables are read-only, which is what makes sharing them safe.
+"""
+
+# pylint: disable=line-too-long
+
 from importlib.resources import files
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Tuple
 import json
 from pathlib import Path
 
+ASSET_CATEGORIES: Tuple[str] = ("render", "compatibility", "encoding")
+
+_ASSET_REGISTRY: Dict[str, "AssetTable"] = {}
+
+
 def load_assets(assets_file_name : str):
+    """Parses an asset file and returns a fresh, mutable, dictionnary.
+
+    Args:
+        assets_file_name (str): name of the asset file in the `polyhex.assets` package.
+
+    Returns:
+        dict: the parsed assets
+    """
     path = Path(files("polyhex.assets").joinpath(assets_file_name))
     assert path.is_file(), f"There is no asset file at {path} for the asset file with name {assets_file_name}"
     file_extension = assets_file_name.split('.')[-1]
@@ -10,4 +34,129 @@ def load_assets(assets_file_name : str):
         with path.open("r", encoding="utf-8") as f:
             return dict(json.load(f))
     else:
-        raise NotImplementedError(f'load_assets is only implemented for json files, got {file_extension}.')
\ No newline at end of file
+        raise NotImplementedError(f'load_assets is only implemented for json files, got {file_extension}.')
+
+
+def _thaw(value):
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _freeze(value):
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class AssetTable(Mapping):
+    """Read-only view on an assets dictionnary.
+
+    It behaves like the dictionnary it is built from (``assets["render"]``, ``"encoding" in assets``...) and additionally pre-resolves the assets of each object name.
+    For instance, ``table.sections["HexagonVertex"]["render"]`` is ``table["render"]["HexagonVertex"]``.
+
+    Args:
+        assets (Dict): the assets dictionnary, as returned by ``load_assets``.
+        source (str, optional): name of the asset file the table was loaded from. Defaults to None.
+    """
+
+    def __init__(self, assets: Dict, source: str = None):
+        self._assets = _freeze(assets)
+        self.source = source
+        names = {
+            name
+            for category in ASSET_CATEGORIES
+            for name in self._assets.get(category, {})
+        }
+        self.sections = MappingProxyType(
+            {
+                name: MappingProxyType(
+                    {
+                        category: self._assets[category][name]
+                        for category in ASSET_CATEGORIES
+                        if category in self._assets and name in self._assets[category]
+                    }
+                )
+                for name in names
+            }
+        )
+
+    def __getitem__(self, key):
+        return self._assets[key]
+
+    def __iter__(self):
+        return iter(self._assets)
+
+    def __len__(self):
+        return len(self._assets)
+
+    def __repr__(self):
+        return f"AssetTable(source={self.source})"
+
+    def to_dict(self) -> Dict:
+        """Returns a mutable copy of the assets, with dictionnaries and lists as in the output of ``load_assets``
+
+        Returns:
+            Dict: the assets dictionnary
+        """
+        return _thaw(self._assets)
+
+    def __reduce__(self):
+        # Tables loaded from a file are re-shared from the registry when unpickled
+        if self.source is not None:
+            return (get_assets, (self.source,))
+        return (AssetTable, (self.to_dict(),))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def get_assets(assets_file_name: str = "default_assets.json") -> AssetTable:
+    """Returns the shared ``AssetTable`` of an asset file.
+
+    The file is parsed on the first call only, the following calls return the same object until ``clear_assets_cache`` is called.
+
+    Args:
+        assets_file_name (str, optional): name of the asset file. Defaults to "default_assets.json".
+
+    Returns:
+        AssetTable: the shared, read-only, assets
+    """
+    table = _ASSET_REGISTRY.get(assets_file_name)
+    if table is None:
+        table = AssetTable(load_assets(assets_file_name), source=assets_file_name)
+        _ASSET_REGISTRY[assets_file_name] = table
+    return table
+
+
+def as_asset_table(assets) -> AssetTable:
+    """Converts assets to an ``AssetTable``, leaving ``AssetTable`` objects untouched.
+
+    Args:
+        assets (Dict | AssetTable): the assets to convert.
+
+    Returns:
+        AssetTable: the read-only assets
+    """
+    if isinstance(assets, AssetTable):
+        return assets
+    return AssetTable(assets)
+
+
+def clear_assets_cache(assets_file_name: str = None):
+    """Invalidates the cached asset tables so that the next ``get_assets`` call re-reads the file.
+
+    Args:
+        assets_file_name (str, optional): asset file to invalidate. Defaults to None, which invalidates all the files.
+    """
+    if assets_file_name is None:
+        _ASSET_REGISTRY.clear()
+    else:
+        _ASSET_REGISTRY.pop(assets_file_name, None)
@@ -0,0 +1,21 @@
+from polyhex.utilities.lazy import lazy_attributes
+
+# The datasets are imported on first access: the generation of the samples only needs numpy, the exports and the PyTorch datasets need torch and torch_geometric
+_LAZY_ATTRIBUTES = {
+    "GenerationRecipe": ".streaming",
+    "iter_polyhexes": ".streaming",
+    "iter_exported": ".streaming",
+    "PolyhexStream": ".stream_dataset",
+    "generate_coordinates": ".farm",
+    "rebuild_polyhex": ".farm",
+    "generate_polyhexes": ".farm",
+    "generate_exported": ".farm",
+    "ShardWriter": ".shards",
+    "write_shards": ".shards",
+    "MemmapGraphDataset": ".shards",
+}
+
+__all__ = ()
+__all__ += tuple(_LAZY_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES, globals())
@@ -0,0 +1,174 @@
+"""Module for the parallel generation of polyhexes.
+
+The samples of a ``GenerationRecipe`` are created in a pool of processes.
+The workers do not send back the polyhexes, which are large and slow to pickle, but compact NumPy payloads:
+    -> ``generate_exported`` creates and exports the samples in the workers, which send back the (x, edge_index, edge_attr, y) arrays of each graph, see ``PyGExporter.export_arrays``, <br>
+    -> ``generate_coordinates`` sends back the (N, 2) array of the coordinates of the hexagons, in the order in which they were appended. ``generate_polyhexes`` rebuilds the polyhexes and their graphs from them in the main process, with the ``BulkBuilder``. <br>
+The jobs are submitted as the results are consumed, with a bounded number of jobs in flight, so that the memory of the main process stays flat however many samples are generated.
+
+Each sample uses the random generator of its own child of the recipe's ``SeedSequence`` (see ``GenerationRecipe.random_generator``), so the samples do not depend on the number of workers, nor on the scheduling of the jobs.
+"""
+
+# pylint: disable=line-too-long
+# pylint: disable=import-outside-toplevel
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from polyhex.objects.polyhexes import Polyhex
+from polyhex.datasets.streaming import GenerationRecipe
+
+if TYPE_CHECKING:
+    from polyhex.objects.exporters import PyGExporter
+
+__all__ = ("generate_coordinates", "rebuild_polyhex", "generate_polyhexes", "generate_exported")
+
+
+def _create_coordinates(recipe: GenerationRecipe, index: int) -> np.ndarray:
+    """Worker job: creates the `index`-th sample of the recipe and returns the coordinates of its hexagons"""
+    # Only the graphs the creation method needs are recorded in the workers
+    graphs = ("HexagonGraph", "HexagonBorderGraph") if recipe.method == "number" else ("HexagonGraph",)
+    _, hypergraph = replace(recipe, graphs=graphs).create(index)
+    return np.array(list(hypergraph["HexagonGraph"].nodes), dtype=np.int32).reshape(-1, 2)
+
+
+def _create_arrays(recipe: GenerationRecipe, exporter: "PyGExporter", index: int) -> Dict[str, Tuple[np.ndarray]]:
+    """Worker job: creates and exports the `index`-th sample of the recipe"""
+    _, hypergraph = recipe.create(index)
+    return exporter.export_arrays(hypergraph)
+
+
+def _run_chunk(job: Callable, indices: Sequence[int]) -> List:
+    """Worker job: runs `job` on a chunk of indices"""
+    return [job(index) for index in indices]
+
+
+def _bounded_map(
+    job: Callable, indices: range, max_workers: int, chunksize: int, max_pending: int
+) -> Iterator:
+    """Runs `job` on the indices in a process pool and yields the results in order.
+
+    Unlike ``ProcessPoolExecutor.map``, which submits all the chunks up front, at most `max_pending` chunks are submitted and not yet consumed.
+    The chunks still pending are cancelled if the iteration stops early.
+    """
+    if max_pending is None:
+        max_pending = 2 * (max_workers or os.cpu_count() or 1)
+    chunks = (indices[start : start + chunksize] for start in range(0, len(indices), chunksize))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        try:
+            for chunk in chunks:
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+                pending.append(executor.submit(_run_chunk, job, chunk))
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def generate_coordinates(
+    recipe: GenerationRecipe,
+    start: int,
+    stop: int,
+    max_workers: int = None,
+    chunksize: int = 16,
+    max_pending: int = None,
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """Creates the samples `start` to `stop` of a recipe in a process pool
+
+    Note:
+        The recipe is sent to the workers, so its `sizes` must be picklable: use a sequence or a module-level function rather than a lambda.
+
+    Args:
+        recipe (GenerationRecipe): the generation recipe
+        start (int): index of the first sample
+        stop (int): index after the last sample
+        max_workers (int, optional): the number of processes. Defaults to None, i.e to the number of processors.
+        chunksize (int, optional): the number of samples sent to a worker at once. Defaults to 16.
+        max_pending (int, optional): the maximum number of chunks submitted and not yet consumed. Defaults to None, i.e to twice the number of processes.
+
+    Yields:
+        Tuple[int, np.ndarray]: the index of the sample and the (N, 2) int32 array of the coordinates of its hexagons, in order
+    """
+    indices = range(start, stop)
+    yield from zip(
+        indices,
+        _bounded_map(partial(_create_coordinates, recipe), indices, max_workers, chunksize, max_pending),
+    )
+
+
+def rebuild_polyhex(recipe: GenerationRecipe, coordinates: np.ndarray) -> Tuple[Polyhex, Dict]:
+    """Rebuilds a polyhex, and the graphs of the recipe, from the coordinates of its hexagons
+
+    Args:
+        recipe (GenerationRecipe): the generation recipe
+        coordinates (np.ndarray): the (N, 2) array of the coordinates of the hexagons, as returned by ``generate_coordinates``
+
+    Returns:
+        Tuple[Polyhex, Dict]: the polyhex and its hypergraph
+    """
+    hypergraph = recipe.hypergraph()
+    polyhex = Polyhex.create_from_coordinates(coordinates.astype(np.int64), hypergraph)
+    return polyhex, hypergraph
+
+
+def generate_polyhexes(
+    recipe: GenerationRecipe, start: int, stop: int, **kwargs
+) -> Iterator[Tuple[int, Polyhex, Dict]]:
+    """Creates the samples `start` to `stop` of a recipe in a process pool and rebuilds them in the main process
+
+    Args:
+        recipe (GenerationRecipe): the generation recipe
+        start (int): index of the first sample
+        stop (int): index after the last sample
+        kwargs: the keyword arguments of ``generate_coordinates``
+
+    Yields:
+        Tuple[int, Polyhex, Dict]: the index of the sample, its polyhex and its hypergraph
+    """
+    for index, coordinates in generate_coordinates(recipe, start, stop, **kwargs):
+        polyhex, hypergraph = rebuild_polyhex(recipe, coordinates)
+        yield index, polyhex, hypergraph
+
+
+def generate_exported(
+    recipe: GenerationRecipe,
+    start: int,
+    stop: int,
+    exporter: "PyGExporter" = None,
+    max_workers: int = None,
+    chunksize: int = 16,
+    max_pending: int = None,
+):
+    """Creates and exports the samples `start` to `stop` of a recipe in a process pool
+
+    The workers send back the exported arrays of the samples, which are only wrapped into tensors in the main process.
+
+    Args:
+        recipe (GenerationRecipe): the generation recipe
+        start (int): index of the first sample
+        stop (int): index after the last sample
+        exporter (PyGExporter, optional): the exporter, sent to the workers. Defaults to None, i.e to a ``PyGExporter``.
+        max_workers (int, optional): the number of processes. Defaults to None, i.e to the number of processors.
+        chunksize (int, optional): the number of samples sent to a worker at once. Defaults to 16.
+        max_pending (int, optional): the maximum number of chunks submitted and not yet consumed. Defaults to None, i.e to twice the number of processes.
+
+    Yields:
+        HeteroData: the exported graphs of each sample
+    """
+    if exporter is None:
+        # The exporters depend on torch, which ``generate_coordinates`` and ``generate_polyhexes`` do not need
+        from polyhex.objects.exporters import PyGExporter
+
+        exporter = PyGExporter()
+    job = partial(_create_arrays, recipe, exporter)
+    for arrays in _bounded_map(job, range(start, stop), max_workers, chunksize, max_pending):
+        yield exporter.from_arrays(arrays)
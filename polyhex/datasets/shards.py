@@ -0,0 +1,205 @@
+"""Module for the on-disk, memory-mapped, datasets of exported polyhexes.
+
+A dataset is a directory of shards. Each shard holds, for each graph name, the concatenation of the `x`, `edge_index`, `edge_attr` and `y` arrays of its samples, as `.npy` files, and the `node_ptr` and `edge_ptr` offset tables of the samples.
+The edge indices are stored relative to their sample, so that reading a sample is a slice of each array.
+The arrays are memory-mapped when read: the samples are zero-copy views on the page cache, shared by all the processes reading the dataset.
+"""
+
+# pylint: disable=line-too-long
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+import numpy as np
+import torch
+from torch.utils.data import Dataset
+from torch_geometric.data import Data, HeteroData
+
+__all__ = ("ShardWriter", "write_shards", "MemmapGraphDataset")
+
+INDEX_FILE = "index.json"
+ATTRIBUTES = ("x", "edge_index", "edge_attr", "y")
+
+
+def _graph_names(sample: HeteroData) -> List[str]:
+    # ``PyGExporter.export_graphs`` stores one ``Data`` object per graph name
+    return [name for name in sample.keys() if isinstance(sample[name], Data)]
+
+
+class ShardWriter:
+    """Writes exported polyhexes to a sharded dataset directory.
+
+    Args:
+        directory (str | Path): the directory of the dataset. It is created if needed.
+        shard_size (int, optional): the number of samples per shard. Defaults to 10000.
+
+    Use it as a context manager, or call ``close`` to write the last shard and the index of the dataset.
+    """
+
+    def __init__(self, directory: str | Path, shard_size: int = 10000):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.shard_size = shard_size
+        self.graph_names: List[str] = None
+        self.attributes: Dict[str, List[str]] = None
+        self.shard_lengths: List[int] = []
+        self._buffer: Dict[str, Dict[str, List[np.ndarray]]] = {}
+        self._n_buffered = 0
+
+    def add(self, sample: HeteroData):
+        """Adds a sample, as returned by ``PyGExporter.export_graphs``, to the dataset
+
+        Args:
+            sample (HeteroData): the exported graphs of a polyhex. All the samples must have the same graphs.
+        """
+        graph_names = _graph_names(sample)
+        if self.graph_names is None:
+            self.graph_names = graph_names
+            self.attributes = {
+                name: [attribute for attribute in ATTRIBUTES if getattr(sample[name], attribute, None) is not None]
+                for name in self.graph_names
+            }
+            self._reset_buffer()
+        assert (
+            graph_names == self.graph_names
+        ), f"All the samples must have the graphs {self.graph_names}, got {graph_names}"
+        for name in self.graph_names:
+            for attribute in self.attributes[name]:
+                self._buffer[name][attribute].append(getattr(sample[name], attribute).numpy())
+        self._n_buffered += 1
+        if self._n_buffered == self.shard_size:
+            self._flush()
+
+    def extend(self, samples: Iterable[HeteroData]):
+        """Adds samples to the dataset
+
+        Args:
+            samples (Iterable[HeteroData]): the exported graphs of the polyhexes
+        """
+        for sample in samples:
+            self.add(sample)
+
+    def _reset_buffer(self):
+        self._buffer = {
+            name: {attribute: [] for attribute in self.attributes[name]}
+            for name in self.graph_names
+        }
+        self._n_buffered = 0
+
+    def _flush(self):
+        if self._n_buffered == 0:
+            return
+        shard = self.directory / f"shard-{len(self.shard_lengths):05d}"
+        shard.mkdir(exist_ok=True)
+        for name in self.graph_names:
+            arrays = self._buffer[name]
+            node_counts = [len(x) for x in arrays["x"]]
+            edge_counts = [edge_index.shape[1] for edge_index in arrays["edge_index"]]
+            np.save(shard / f"{name}.node_ptr.npy", np.concatenate([[0], np.cumsum(node_counts)]).astype(np.int64))
+            np.save(shard / f"{name}.edge_ptr.npy", np.concatenate([[0], np.cumsum(edge_counts)]).astype(np.int64))
+            for attribute, parts in arrays.items():
+                axis = 1 if attribute == "edge_index" else 0
+                np.save(shard / f"{name}.{attribute}.npy", np.concatenate(parts, axis=axis))
+        self.shard_lengths.append(self._n_buffered)
+        self._reset_buffer()
+
+    def close(self):
+        """Writes the last shard and the index of the dataset"""
+        if self.graph_names is not None:
+            self._flush()
+        index = {
+            "graph_names": self.graph_names or [],
+            "attributes": self.attributes or {},
+            "shard_lengths": self.shard_lengths,
+        }
+        with (self.directory / INDEX_FILE).open("w", encoding="utf-8") as f:
+            json.dump(index, f)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_shards(directory: str | Path, samples: Iterable[HeteroData], shard_size: int = 10000) -> Path:
+    """Writes exported polyhexes to a sharded dataset directory
+
+    Args:
+        directory (str | Path): the directory of the dataset
+        samples (Iterable[HeteroData]): the exported graphs of the polyhexes, for instance from ``iter_exported``
+        shard_size (int, optional): the number of samples per shard. Defaults to 10000.
+
+    Returns:
+        Path: the directory of the dataset
+    """
+    with ShardWriter(directory, shard_size) as writer:
+        writer.extend(samples)
+    return writer.directory
+
+
+class MemmapGraphDataset(Dataset):
+    """Map-style dataset reading a sharded dataset directory through memory maps.
+
+    The shards are opened lazily, in the process that reads them: the dataset can be sent to ``DataLoader`` workers, which then share the page cache.
+    The tensors of a sample are zero-copy views on the memory maps. The maps are opened copy-on-write: writing to a tensor does not modify the files.
+
+    Args:
+        directory (str | Path): the directory of the dataset, written by ``ShardWriter``.
+    """
+
+    def __init__(self, directory: str | Path):
+        super().__init__()
+        self.directory = Path(directory)
+        with (self.directory / INDEX_FILE).open("r", encoding="utf-8") as f:
+            index = json.load(f)
+        self.graph_names: List[str] = index["graph_names"]
+        self.attributes: Dict[str, List[str]] = index["attributes"]
+        self.shard_offsets = np.concatenate([[0], np.cumsum(index["shard_lengths"])]).astype(np.int64)
+        self._shards: Dict[int, Dict] = {}
+
+    def __len__(self):
+        return int(self.shard_offsets[-1])
+
+    def _shard(self, shard_index: int) -> Dict:
+        if shard_index not in self._shards:
+            shard = self.directory / f"shard-{shard_index:05d}"
+            self._shards[shard_index] = {
+                name: {
+                    array: np.load(shard / f"{name}.{array}.npy", mmap_mode="c")
+                    for array in ["node_ptr", "edge_ptr"] + self.attributes[name]
+                }
+                for name in self.graph_names
+            }
+        return self._shards[shard_index]
+
+    def __getitem__(self, index: int) -> HeteroData:
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"Index {index} out of range for a dataset of {len(self)} samples")
+        index = index % len(self)
+        shard_index = int(np.searchsorted(self.shard_offsets, index, side="right")) - 1
+        position = index - int(self.shard_offsets[shard_index])
+        shard = self._shard(shard_index)
+        return_graph = HeteroData()
+        for name in self.graph_names:
+            arrays = shard[name]
+            nodes = slice(int(arrays["node_ptr"][position]), int(arrays["node_ptr"][position + 1]))
+            edges = slice(int(arrays["edge_ptr"][position]), int(arrays["edge_ptr"][position + 1]))
+            tensors = {}
+            for attribute in self.attributes[name]:
+                if attribute == "edge_index":
+                    view = arrays[attribute][:, edges]
+                elif attribute == "edge_attr":
+                    view = arrays[attribute][edges]
+                else:
+                    view = arrays[attribute][nodes]
+                tensors[attribute] = torch.from_numpy(view)
+            return_graph[name] = Data(**tensors, num_nodes=nodes.stop - nodes.start)
+        return return_graph
+
+    def __getstate__(self):
+        # The memory maps are not sent to the other processes, they are reopened there
+        state = self.__dict__.copy()
+        state["_shards"] = {}
+        return state
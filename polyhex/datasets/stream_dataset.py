@@ -0,0 +1,43 @@
+"""Module for the PyTorch dataset of the streamed polyhexes.
+
+The ``PolyhexStream`` wraps ``iter_exported`` into a torch ``IterableDataset``, which shares the samples of a ``GenerationRecipe`` between the ``DataLoader`` workers.
+It lives apart from ``polyhex.datasets.streaming`` so that the generation of the samples does not import torch.
+"""
+
+# pylint: disable=line-too-long
+
+from torch.utils.data import IterableDataset, get_worker_info
+
+from polyhex.datasets.streaming import GenerationRecipe, iter_exported
+
+__all__ = ("PolyhexStream",)
+
+
+class PolyhexStream(IterableDataset):
+    """Iterable dataset of exported polyhexes.
+
+    The samples are created on the fly from the recipe. When the dataset is read by several ``DataLoader`` workers, worker `k` out of `n` generates the samples k, k+n, k+2n...
+    As each sample only depends on the recipe's seed and on its index, the dataset holds the same samples whatever the number of workers.
+
+    Args:
+        recipe (GenerationRecipe): the generation recipe
+        num_samples (int, optional): the number of samples. Defaults to None, i.e an unbounded stream.
+        start (int, optional): index of the first sample. Defaults to 0.
+    """
+
+    def __init__(self, recipe: GenerationRecipe, num_samples: int = None, start: int = 0):
+        super().__init__()
+        self.recipe = recipe
+        self.num_samples = num_samples
+        self.start = start
+
+    def __iter__(self):
+        worker_info = get_worker_info()
+        worker_id, num_workers = (0, 1) if worker_info is None else (worker_info.id, worker_info.num_workers)
+        stop = None if self.num_samples is None else self.start + self.num_samples
+        return iter_exported(self.recipe, self.start + worker_id, stop, num_workers)
+
+    def __len__(self):
+        if self.num_samples is None:
+            raise TypeError("An unbounded PolyhexStream has no length")
+        return self.num_samples
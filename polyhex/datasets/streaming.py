@@ -0,0 +1,169 @@
+"""Module for the streaming generation of polyhex datasets.
+
+A ``GenerationRecipe`` describes how to create the i-th sample of a dataset: the creation method, the distribution of the sizes and the seed.
+The i-th sample only depends on the seed and on i, so that the samples can be generated in any order, by any number of workers, and always be the same.
+The samples are created one at a time and only the exported graphs are kept, so that the memory stays flat however many samples are generated.
+The module does not depend on torch, which is only imported to export the samples. See ``polyhex.datasets.stream_dataset`` for the PyTorch dataset of the samples.
+"""
+
+# pylint: disable=line-too-long
+# pylint: disable=import-outside-toplevel
+
+from dataclasses import dataclass, field
+from itertools import count
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, Sequence, Tuple
+
+import numpy as np
+
+from polyhex.objects import graphs as graphs_module
+from polyhex.objects.polyhexes import Polyhex
+
+if TYPE_CHECKING:
+    from polyhex.objects.exporters import PyGExporter
+
+__all__ = ("GenerationRecipe", "iter_polyhexes", "iter_exported")
+
+CREATION_METHODS: Tuple[str] = ("number", "spiral", "tiling")
+
+
+@dataclass(frozen=True)
+class GenerationRecipe:
+    """Recipe for the generation of polyhexes.
+
+    Args:
+        method (str): The creation method. It can be `number` (``Polyhex.create_from_number``), `spiral` (``Polyhex.create_spiral``) or `tiling` (``Polyhex.create_tiling``).
+        sizes (Sequence[int] | Callable): The distribution of the sizes: the number of hexagons for `number`, the radius for `spiral` and the (n, m) dimensions for `tiling`.
+            An int, or a (n, m) tuple of ints for `tiling`, is used for all the samples. Any other sequence, tuples included, is sampled uniformly: (5, 10, 20) for `number`, or ((4, 4), (8, 6)) for `tiling`. A callable is called with the random generator of the sample and returns the size.
+        seed (int): The seed of the dataset. Defaults to 0.
+        graphs (Tuple[str]): The names of the graphs to record, from ``polyhex.objects.graphs``. Defaults to ("HexagonGraph", "HexagonBorderGraph").
+        method_kwargs (Dict): Extra keyword arguments of the creation method, for instance {"name": "rectangular", "offset": "odd-r"} for `tiling`. Defaults to {}.
+    """
+
+    method: str
+    sizes: Sequence | Callable | int
+    seed: int = 0
+    graphs: Tuple[str] = ("HexagonGraph", "HexagonBorderGraph")
+    method_kwargs: Dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        assert (
+            self.method in CREATION_METHODS
+        ), f"The creation method can only be one of {CREATION_METHODS}, got {self.method}"
+        for name in self.graphs:
+            assert hasattr(graphs_module, name), f"There is no graph named {name} in polyhex.objects.graphs"
+
+    def random_generator(self, index: int) -> np.random.Generator:
+        """Returns the random generator of the `index`-th sample.
+
+        It is the generator of the `index`-th child of the seed's ``SeedSequence``, so it does not depend on the samples generated before.
+        """
+        return np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(index,)))
+
+    def _is_fixed_size(self) -> bool:
+        # An int, or the (n, m) tuple of a tiling, is used for all the samples. Any other sequence, tuples included, is sampled.
+        if isinstance(self.sizes, (int, np.integer)):
+            return True
+        return (
+            self.method == "tiling"
+            and isinstance(self.sizes, tuple)
+            and len(self.sizes) == 2
+            and all(isinstance(dimension, (int, np.integer)) for dimension in self.sizes)
+        )
+
+    def sample_size(self, random_generator: np.random.Generator):
+        """Draws a size from the size distribution"""
+        if callable(self.sizes):
+            size = self.sizes(random_generator)
+        elif self._is_fixed_size():
+            size = self.sizes
+        else:
+            size = self.sizes[random_generator.integers(len(self.sizes))]
+        if isinstance(size, tuple):
+            return tuple(int(dimension) for dimension in size)
+        return int(size)
+
+    def hypergraph(self) -> Dict:
+        """Returns a fresh hypergraph with the graphs of the recipe"""
+        return {name: getattr(graphs_module, name)() for name in self.graphs}
+
+    def create(self, index: int):
+        """Creates the `index`-th sample of the recipe
+
+        Args:
+            index (int): the index of the sample
+
+        Returns:
+            Tuple[Polyhex, Dict]: the polyhex and its hypergraph
+        """
+        random_generator = self.random_generator(index)
+        size = self.sample_size(random_generator)
+        hypergraph = self.hypergraph()
+        if self.method == "number":
+            polyhex = Polyhex.create_from_number(
+                size, hypergraph, random_generator=random_generator, **self.method_kwargs
+            )
+        elif self.method == "spiral":
+            polyhex = Polyhex.create_spiral(size, hypergraph, **self.method_kwargs)
+        else:
+            n, m = size if isinstance(size, tuple) else (size, size)
+            kwargs = dict(self.method_kwargs)
+            polyhex = Polyhex.create_tiling(n, m, kwargs.pop("name", "rectangular"), hypergraph, **kwargs)
+        return polyhex, hypergraph
+
+
+def _indices(start: int, stop: int | None, step: int) -> Iterable[int]:
+    if stop is None:
+        return count(start, step)
+    return range(start, stop, step)
+
+
+def iter_polyhexes(
+    recipe: GenerationRecipe, start: int = 0, stop: int = None, step: int = 1
+) -> Iterator[Tuple[int, Polyhex, Dict]]:
+    """Lazily creates the samples of a recipe
+
+    Args:
+        recipe (GenerationRecipe): the generation recipe
+        start (int, optional): index of the first sample. Defaults to 0.
+        stop (int, optional): index after the last sample. Defaults to None, i.e an unbounded stream.
+        step (int, optional): step between the sample indices. Defaults to 1.
+
+    Yields:
+        Tuple[int, Polyhex, Dict]: the index of the sample, its polyhex and its hypergraph
+    """
+    for index in _indices(start, stop, step):
+        polyhex, hypergraph = recipe.create(index)
+        yield index, polyhex, hypergraph
+
+
+def iter_exported(
+    recipe: GenerationRecipe,
+    start: int = 0,
+    stop: int = None,
+    step: int = 1,
+    exporter: "PyGExporter" = None,
+):
+    """Lazily creates and exports the samples of a recipe.
+
+    Only the exported graphs are yielded: the polyhex and its graphs are released before the next sample is created.
+
+    Args:
+        recipe (GenerationRecipe): the generation recipe
+        start (int, optional): index of the first sample. Defaults to 0.
+        stop (int, optional): index after the last sample. Defaults to None, i.e an unbounded stream.
+        step (int, optional): step between the sample indices. Defaults to 1.
+        exporter (PyGExporter, optional): the exporter. Defaults to None, i.e to a ``PyGExporter``.
+
+    Yields:
+        HeteroData: the exported graphs of each sample
+    """
+    if exporter is None:
+        # The exporters depend on torch, which the creation of the samples does not need
+        from polyhex.objects.exporters import PyGExporter
+
+        exporter = PyGExporter()
+    for index in _indices(start, stop, step):
+        _, hypergraph = recipe.create(index)
+        exported = exporter.export_graphs(hypergraph)
+        del hypergraph
+        yield exported
@@ -1,14 +1,37 @@
-from .exporters import *
 from .nodes import * 
 from .edges import *
+from .geometry import *
+from .distances import *
 from .hexagons import *
 from .polyhexes import *
+from .builders import *
+from .spatial import *
+from .stores import *
 from .graphs import *
+from .serialization import *
+from polyhex.utilities.lazy import lazy_attributes
 
 __all__ = ()
-__all__ += exporters.__all__
 __all__ += nodes.__all__
 __all__ += edges.__all__
+__all__ += geometry.__all__
+__all__ += distances.__all__
 __all__ += hexagons.__all__
 __all__ += polyhexes.__all__
-__all__ += graphs.__all__
\ No newline at end of file
+__all__ += builders.__all__
+__all__ += spatial.__all__
+__all__ += stores.__all__
+__all__ += graphs.__all__
+__all__ += serialization.__all__
+
+# The rendering and the exporters depend on matplotlib and torch: they are imported on first access, and left out of ``__all__`` so that a star import does not load them
+_LAZY_ATTRIBUTES = {
+    "exporters": ".exporters",
+    "PyGExporter": ".exporters",
+    "IncrementalPyGExporter": ".exporters",
+    "GridExporter": ".exporters",
+    "BatchedRenderer": ".rendering",
+    "Rasterizer": ".rasterizer",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES, globals())
@@ -0,0 +1,306 @@
+"""Module for the bulk construction of the graphs of a polyhex.
+
+Instead of appending the hexagons one by one, the ``BulkBuilder`` computes the geometry of all the hexagons at once, from a (N, 2) array of axial coordinates:
+the centres, the deduplicated vertices and edges, their adjencies and the borders of the polyhex are computed with array operations, and the graphs are then filled in a single pass.
+"""
+
+# pylint: disable=line-too-long
+
+from functools import cached_property
+from typing import Dict, List
+
+import numpy as np
+
+from polyhex.objects.decorators import (
+    hex_coord_system_dependent,
+    top_dependent,
+    vertex_orientation_dependent,
+)
+from polyhex.objects.geometry import (
+    HEXAGON_NEIGHBOUR_OFFSETS,
+    VERTEX_NEIGHBOUR_OFFSETS,
+    VERTEX_OFFSETS,
+    centres,
+    edge_key,
+)
+from polyhex.objects.hexagons import Hexagon, BorderHexagon
+from polyhex.utilities import pack_coordinates
+
+__all__ = ("BulkBuilder",)
+
+
+def _lookup(sorted_codes: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Returns the positions of `codes` in `sorted_codes`, -1 for the codes that are absent"""
+    if len(sorted_codes) == 0:
+        return np.full(codes.shape, -1, dtype=np.int64)
+    positions = np.minimum(np.searchsorted(sorted_codes, codes), len(sorted_codes) - 1)
+    return np.where(sorted_codes[positions] == codes, positions, -1)
+
+
+def _unique_in_order(codes: np.ndarray):
+    """Deduplicates `codes`, numbering the unique codes in the order of their first appearance.
+
+    Returns:
+        sorted_codes (np.ndarray): the unique codes, sorted
+        rank (np.ndarray): the number of each sorted code
+        first (np.ndarray): for each number, the position of the first appearance of its code in `codes`
+        ids (np.ndarray): for each code in `codes`, its number
+        counts (np.ndarray): for each number, the number of appearances of its code
+    """
+    sorted_codes, first, inverse, counts = np.unique(
+        codes, return_index=True, return_inverse=True, return_counts=True
+    )
+    order = np.argsort(first, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return sorted_codes, rank, first[order], rank[inverse.reshape(-1)], counts[order]
+
+
+def _ordered_pairs(first: np.ndarray, second: np.ndarray):
+    """Keeps each (first, second) pair once, in the order in which the nodes would have been connected one by one.
+
+    The candidate pairs are listed node by node, each node listing its neighbours in the order of its adjency.
+    When appended one by one, a node is connected to the neighbours that were appended before it, in the order of its adjency: these are the kept pairs, in the order of the candidates.
+    """
+    mask = (second >= 0) & (second < first)
+    return first[mask], second[mask]
+
+
+class _Lattice:
+    """Array representation of the geometry of a set of pointy top, clockwise, axial hexagons.
+
+    The attributes are computed on first access only, so that a graph that is not recorded costs nothing.
+    All the nodes are numbered in the order in which they would have been appended one by one.
+    """
+
+    def __init__(self, coordinates: np.ndarray):
+        self.coordinates = coordinates
+
+    ######### Hexagons #########
+    @cached_property
+    def _hexagon_codes(self):
+        codes = pack_coordinates(self.coordinates[:, 0], self.coordinates[:, 1])
+        sorter = np.argsort(codes, kind="stable")
+        sorted_codes = codes[sorter]
+        if np.any(sorted_codes[1:] == sorted_codes[:-1]):
+            raise RuntimeError(
+                "Several hexagons have the same coordinates, the hexagons of a polyhex cannot overlap"
+            )
+        return sorted_codes, sorter
+
+    @cached_property
+    def _neighbour_coordinates(self):
+        return self.coordinates[:, None, :] + HEXAGON_NEIGHBOUR_OFFSETS
+
+    @cached_property
+    def _neighbour_positions(self):
+        sorted_codes, _ = self._hexagon_codes
+        neighbours = self._neighbour_coordinates
+        return _lookup(
+            sorted_codes, pack_coordinates(neighbours[..., 0], neighbours[..., 1])
+        )
+
+    @cached_property
+    def hexagon_pairs(self):
+        """Pairs of indices of neighbouring hexagons"""
+        _, sorter = self._hexagon_codes
+        positions = self._neighbour_positions
+        first = np.repeat(np.arange(len(self.coordinates)), 6)
+        second = np.where(positions >= 0, sorter[positions], -1).reshape(-1)
+        return _ordered_pairs(first, second)
+
+    ######### Hexagon border #########
+    @cached_property
+    def _border(self):
+        outside = (self._neighbour_positions < 0).reshape(-1)
+        coordinates = self._neighbour_coordinates.reshape(-1, 2)[outside]
+        codes = pack_coordinates(coordinates[:, 0], coordinates[:, 1])
+        sorted_codes, rank, first, _, _ = _unique_in_order(codes)
+        return sorted_codes, rank, coordinates[first]
+
+    @cached_property
+    def border_coordinates(self):
+        """Coordinates of the hexagons on the border of the polyhex"""
+        return self._border[2]
+
+    @cached_property
+    def border_pairs(self):
+        """Pairs of indices of neighbouring border hexagons"""
+        sorted_codes, rank, coordinates = self._border
+        neighbours = coordinates[:, None, :] + HEXAGON_NEIGHBOUR_OFFSETS
+        positions = _lookup(
+            sorted_codes, pack_coordinates(neighbours[..., 0], neighbours[..., 1])
+        )
+        first = np.repeat(np.arange(len(coordinates)), 6)
+        second = np.where(positions >= 0, rank[positions], -1).reshape(-1)
+        return _ordered_pairs(first, second)
+
+    ######### Vertices #########
+    @cached_property
+    def _vertices(self):
+        vertices = (centres(self.coordinates)[:, None, :] + VERTEX_OFFSETS).reshape(-1, 2)
+        codes = pack_coordinates(vertices[:, 0], vertices[:, 1])
+        sorted_codes, rank, first, ids, _ = _unique_in_order(codes)
+        return sorted_codes, rank, first, ids, vertices[first]
+
+    @cached_property
+    def vertex_sources(self):
+        """For each vertex, the flat index (6 * hexagon index + vertex index) of its first appearance"""
+        return self._vertices[2]
+
+    @cached_property
+    def vertex_neighbours(self):
+        """(V, 3) array of the indices of the neighbouring vertices, -1 when they are not in the polyhex"""
+        sorted_codes, rank, first, _, vertices = self._vertices
+        # The offsets only depend on the index of the vertex in its hexagon
+        offsets = VERTEX_NEIGHBOUR_OFFSETS[first % 6]
+        neighbours = vertices[:, None, :] + offsets
+        positions = _lookup(
+            sorted_codes, pack_coordinates(neighbours[..., 0], neighbours[..., 1])
+        )
+        return np.where(positions >= 0, rank[positions], -1)
+
+    @cached_property
+    def vertex_pairs(self):
+        """Pairs of indices of neighbouring vertices"""
+        neighbours = self.vertex_neighbours
+        first = np.repeat(np.arange(len(neighbours)), 3)
+        second = neighbours.reshape(-1)
+        return _ordered_pairs(first, second)
+
+    ######### Edges #########
+    @cached_property
+    def _edges(self):
+        vertex_ids = self._vertices[3].reshape(-1, 6)
+        starts = vertex_ids.reshape(-1)
+        ends = np.roll(vertex_ids, -1, axis=1).reshape(-1)
+        # The edges are deduplicated by their canonical ids
+        vertices = self._vertices[4]
+        codes = edge_key(vertices[starts, 0], vertices[starts, 1], vertices[ends, 0], vertices[ends, 1])
+        sorted_codes, rank, first, _, counts = _unique_in_order(codes)
+        return sorted_codes, rank, first, counts, starts[first], ends[first]
+
+    @cached_property
+    def edge_sources(self):
+        """For each edge, the flat index (6 * hexagon index + edge index) of its first appearance"""
+        return self._edges[2]
+
+    @cached_property
+    def edge_is_border(self):
+        """For each edge, whether it belongs to a single hexagon"""
+        return self._edges[3] == 1
+
+    @cached_property
+    def edge_pairs(self):
+        """Pairs of indices of neighbouring edges, i.e. of edges that share a vertex"""
+        sorted_codes, rank, _, _, starts, ends = self._edges
+        vertices = self._vertices[4]
+        neighbours = self.vertex_neighbours
+        edge_ids = np.arange(len(starts))
+        second = []
+        for root, other in ((starts, ends), (ends, starts)):
+            candidates = neighbours[root]
+            # The absent candidates (-1) get a wrong id, they are masked below
+            codes = edge_key(
+                vertices[root, 0][:, None], vertices[root, 1][:, None], vertices[candidates, 0], vertices[candidates, 1]
+            )
+            positions = _lookup(sorted_codes, codes)
+            valid = (candidates >= 0) & (candidates != other[:, None]) & (positions >= 0)
+            second.append(np.where(valid, rank[positions], -1))
+        # The adjency of an edge lists the neighbours of its start, then the neighbours of its end
+        second = np.concatenate(second, axis=1).reshape(-1)
+        return _ordered_pairs(np.repeat(edge_ids, 6), second)
+
+
+class BulkBuilder:
+    """
+    BulkBuilder class: fills the graphs of a polyhex from an array of coordinates in a single pass.
+
+    Args:
+        polyhex (Polyhex): the polyhex, which defines the layout (top, vertex orientation...) of the hexagons.
+    """
+
+    def __init__(self, polyhex):
+        self.polyhex = polyhex
+        self.hex_coord_system = polyhex.hex_coord_system
+        self.top = polyhex.top
+        self.vertex_orientation = polyhex.vertex_orientation
+
+    @staticmethod
+    def _connexions(keys: List, pairs):
+        first, second = pairs
+        return [(keys[a], keys[b]) for a, b in zip(first.tolist(), second.tolist())]
+
+    @staticmethod
+    def _sources(hexagons: List[Hexagon], sources: np.ndarray, method: str):
+        # Only the nodes kept by the graph are created, see ``Hexagon.vertex`` and ``Hexagon.edge``
+        return [
+            getattr(hexagons[source // 6], method)(source % 6)
+            for source in sources.tolist()
+        ]
+
+    def _fill(self, graph, hexagons: List[Hexagon], lattice: _Lattice):
+        if graph.name == "HexagonGraph":
+            keys = [hexagon.spatial_key for hexagon in hexagons]
+            graph.extend(keys, hexagons, self._connexions(keys, lattice.hexagon_pairs))
+        elif graph.name == "VertexGraph":
+            nodes = self._sources(hexagons, lattice.vertex_sources, "vertex")
+            keys = [node.key for node in nodes]
+            graph.extend(keys, nodes, self._connexions(keys, lattice.vertex_pairs))
+        elif graph.name == "EdgeGraph":
+            nodes = self._sources(hexagons, lattice.edge_sources, "edge")
+            keys = [node.key for node in nodes]
+            graph.extend(keys, nodes, self._connexions(keys, lattice.edge_pairs))
+        elif graph.name == "EdgeBorderGraph":
+            border = lattice.edge_is_border
+            # Renumber the border edges, so that the pairs index the border edges only
+            border_ids = np.cumsum(border) - 1
+            first, second = lattice.edge_pairs
+            kept = border[first] & border[second]
+            nodes = self._sources(hexagons, lattice.edge_sources[border], "edge")
+            keys = [node.key for node in nodes]
+            graph.extend(
+                keys,
+                nodes,
+                self._connexions(keys, (border_ids[first[kept]], border_ids[second[kept]])),
+            )
+        elif graph.name == "HexagonBorderGraph":
+            keys = list(map(tuple, lattice.border_coordinates.tolist()))
+            nodes = [BorderHexagon(key, self.polyhex) for key in keys]
+            graph.extend(keys, nodes, self._connexions(keys, lattice.border_pairs))
+        else:
+            # Graphs without a bulk construction are appended one hexagon at a time
+            for hexagon in hexagons:
+                graph.append(hexagon)
+
+    @hex_coord_system_dependent
+    @top_dependent
+    @vertex_orientation_dependent
+    def build(self, coordinates: np.ndarray, hypergraph: Dict, hexagons: List[Hexagon] = None):
+        """Fills the empty graphs of the hypergraph with the hexagons at the given coordinates
+
+        Args:
+            coordinates (np.ndarray): (N, 2) array of the axial coordinates of the hexagons
+            hypergraph (Dict): Graphs to be recorded. They must be empty.
+            hexagons (List[Hexagon], optional): the hexagons at the given coordinates. Defaults to None, in which case placeholder hexagons are created. Only the vertices and edges kept by the recorded graphs are then created, see ``Hexagon.vertex`` and ``Hexagon.edge``.
+
+        Raises:
+            RuntimeError: A RuntimeError is raised when several hexagons have the same coordinates.
+
+        Returns:
+            List[Hexagon]: the hexagons of the polyhex
+        """
+        coordinates = np.asarray(coordinates, dtype=np.int64).reshape(-1, 2)
+        lattice = _Lattice(coordinates)
+        # Checks that the hexagons do not overlap, whatever the graphs recorded
+        _ = lattice.hexagon_pairs
+        if hexagons is None:
+            hexagons = [
+                self.polyhex.placeholder_hex(hex_coord=coord)
+                for coord in map(tuple, coordinates.tolist())
+            ]
+        assert len(hexagons) == len(coordinates)
+        for graph in hypergraph.values():
+            assert graph.n_nodes == 0, f"The bulk construction requires empty graphs, but {graph.name} has {graph.n_nodes} nodes."
+            self._fill(graph, hexagons, lattice)
+        return hexagons
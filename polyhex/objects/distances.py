@@ -0,0 +1,236 @@
+"""Module for the distances between hexagons.
+
+The hexagons are given by their axial coordinates (q, r). Three distances are offered:
+    -> `hex`: the number of steps between the hexagons on the lattice, i.e the cube distance (|dq| + |dr| + |dq + dr|) / 2, <br>
+    -> `display`: the euclidian distance between the centres of the hexagons in display space, as in ``Node.display_coordinates``, <br>
+    -> `euclidian`: the euclidian distance between the axial coordinates, as in ``Hexagon.distance``. <br>
+
+Each distance has a scalar fast path, for a pair of hexagons, which only uses the ``math`` module, and a batched NumPy variant.
+The all-pairs and k-nearest computations take a whole ``HexagonGraph``.
+"""
+
+# pylint: disable=line-too-long
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+__all__ = (
+    "DISTANCE_KWDS",
+    "euclidean",
+    "hex_distance",
+    "display_distance",
+    "hexagon_distance",
+    "display_coordinates",
+    "batch_distances",
+    "pairwise_distances",
+    "graph_coordinates",
+    "all_pairs_distances",
+    "k_nearest",
+)
+
+DISTANCE_KWDS: Tuple[str] = ("hex", "display", "euclidian")
+# Maximum number of pairs of a chunk of a brute-force distance computation, such as the k-nearest hexagons or the nearest vertices of ``SpatialIndex``
+CHUNK_PAIRS = 1 << 22
+
+
+def _check_kwd(kwd: str):
+    if kwd not in DISTANCE_KWDS:
+        raise NotImplementedError(f"The distance is only implemented for the {DISTANCE_KWDS} keywords. Got {kwd}")
+
+
+######### Scalar fast paths #########
+def euclidean(coordinates, other_coordinates) -> float:
+    """Euclidian distance between two points, with ``math.dist`` rather than array conversions
+
+    Args:
+        coordinates (Tuple[float]): the coordinates of the first point
+        other_coordinates (Tuple[float]): the coordinates of the second point
+
+    Returns:
+        float: the distance
+    """
+    return math.dist(coordinates, other_coordinates)
+
+
+def hex_distance(hex_coord: Tuple[int], other_hex_coord: Tuple[int]) -> int:
+    """Number of steps between two hexagons on the lattice
+
+    Args:
+        hex_coord (Tuple[int]): the axial coordinates of the first hexagon
+        other_hex_coord (Tuple[int]): the axial coordinates of the second hexagon
+
+    Returns:
+        int: the cube distance between the hexagons
+    """
+    delta_q = hex_coord[0] - other_hex_coord[0]
+    delta_r = hex_coord[1] - other_hex_coord[1]
+    return (abs(delta_q) + abs(delta_r) + abs(delta_q + delta_r)) // 2
+
+
+def display_distance(hex_coord: Tuple[int], other_hex_coord: Tuple[int], radius: int | float = 1) -> float:
+    """Euclidian distance between the centres of two hexagons, in display space
+
+    Args:
+        hex_coord (Tuple[int]): the axial coordinates of the first hexagon
+        other_hex_coord (Tuple[int]): the axial coordinates of the second hexagon
+        radius (int | float, optional): the radius of the hexagons. Defaults to 1.
+
+    Returns:
+        float: the distance
+    """
+    delta_q = hex_coord[0] - other_hex_coord[0]
+    delta_r = hex_coord[1] - other_hex_coord[1]
+    # Cartesian grid (2q + r, -3r), scaled into display coordinates
+    return math.hypot((2 * delta_q + delta_r) * radius * math.sqrt(3) / 2, -3 * delta_r / (radius * 2))
+
+
+def hexagon_distance(hex_coord: Tuple[int], other_hex_coord: Tuple[int], kwd: str = "euclidian", radius: int | float = 1):
+    """Distance between two hexagons, for any of the ``DISTANCE_KWDS``
+
+    Args:
+        hex_coord (Tuple[int]): the axial coordinates of the first hexagon
+        other_hex_coord (Tuple[int]): the axial coordinates of the second hexagon
+        kwd (str, optional): Identifier of the distance, `hex`, `display` or `euclidian`. Defaults to "euclidian".
+        radius (int | float, optional): the radius of the hexagons, for the `display` distance. Defaults to 1.
+
+    Raises:
+        NotImplementedError: the distance keyword is unknown
+
+    Returns:
+        int | float: the distance
+    """
+    if kwd == "euclidian":
+        return math.dist(hex_coord, other_hex_coord)
+    if kwd == "hex":
+        return hex_distance(hex_coord, other_hex_coord)
+    if kwd == "display":
+        return display_distance(hex_coord, other_hex_coord, radius)
+    raise NotImplementedError(f"The distance is only implemented for the {DISTANCE_KWDS} keywords. Got {kwd}")
+
+
+######### Batched variants #########
+def display_coordinates(hex_coords: np.ndarray, radius: int | float = 1) -> np.ndarray:
+    """Display coordinates of the centres of hexagons
+
+    Args:
+        hex_coords (np.ndarray): (..., 2) array of axial coordinates
+        radius (int | float, optional): the radius of the hexagons. Defaults to 1.
+
+    Returns:
+        np.ndarray: (..., 2) float64 array of display coordinates
+    """
+    hex_coords = np.asarray(hex_coords, dtype=np.float64)
+    q, r = hex_coords[..., 0], hex_coords[..., 1]
+    return np.stack([(2 * q + r) * (radius * math.sqrt(3) / 2), -3 * r / (radius * 2)], axis=-1)
+
+
+def batch_distances(hex_coords: np.ndarray, other_hex_coords: np.ndarray, kwd: str = "hex", radius: int | float = 1) -> np.ndarray:
+    """Element-wise distances between hexagons
+
+    Args:
+        hex_coords (np.ndarray): (..., 2) array of axial coordinates
+        other_hex_coords (np.ndarray): (..., 2) array of axial coordinates, broadcastable with `hex_coords`
+        kwd (str, optional): Identifier of the distance, `hex`, `display` or `euclidian`. Defaults to "hex".
+        radius (int | float, optional): the radius of the hexagons, for the `display` distance. Defaults to 1.
+
+    Raises:
+        NotImplementedError: the distance keyword is unknown
+
+    Returns:
+        np.ndarray: the int64 `hex` distances, or the float64 `display` and `euclidian` distances, with the broadcast shape of the inputs without their last axis
+    """
+    _check_kwd(kwd)
+    if kwd == "hex":
+        delta = np.asarray(hex_coords, dtype=np.int64) - np.asarray(other_hex_coords, dtype=np.int64)
+        return (np.abs(delta[..., 0]) + np.abs(delta[..., 1]) + np.abs(delta[..., 0] + delta[..., 1])) // 2
+    if kwd == "display":
+        hex_coords, other_hex_coords = display_coordinates(hex_coords, radius), display_coordinates(other_hex_coords, radius)
+    delta = np.asarray(hex_coords, dtype=np.float64) - np.asarray(other_hex_coords, dtype=np.float64)
+    return np.hypot(delta[..., 0], delta[..., 1])
+
+
+def pairwise_distances(hex_coords: np.ndarray, other_hex_coords: np.ndarray = None, kwd: str = "hex", radius: int | float = 1) -> np.ndarray:
+    """Distances between all the pairs of hexagons of two sets
+
+    Args:
+        hex_coords (np.ndarray): (N, 2) array of axial coordinates
+        other_hex_coords (np.ndarray, optional): (M, 2) array of axial coordinates. Defaults to None, i.e to `hex_coords`.
+        kwd (str, optional): Identifier of the distance, `hex`, `display` or `euclidian`. Defaults to "hex".
+        radius (int | float, optional): the radius of the hexagons, for the `display` distance. Defaults to 1.
+
+    Returns:
+        np.ndarray: (N, M) array of distances
+    """
+    hex_coords = np.asarray(hex_coords).reshape(-1, 2)
+    other_hex_coords = hex_coords if other_hex_coords is None else np.asarray(other_hex_coords).reshape(-1, 2)
+    return batch_distances(hex_coords[:, None, :], other_hex_coords[None, :, :], kwd, radius)
+
+
+######### Graphs #########
+def graph_coordinates(graph) -> np.ndarray:
+    """Axial coordinates of the hexagons of a ``HexagonGraph``
+
+    Args:
+        graph (HexagonGraph): the graph, keyed by the axial coordinates of its hexagons
+
+    Returns:
+        np.ndarray: (N, 2) int64 array of the coordinates, in the order of the `nodes` dictionnary, which is the order of the node indices of a compact graph
+    """
+    return np.array(list(graph.nodes), dtype=np.int64).reshape(-1, 2)
+
+
+def _radius(graph) -> int | float:
+    return next(iter(graph.nodes.values())).radius if graph.nodes else 1
+
+
+def all_pairs_distances(graph, kwd: str = "hex") -> np.ndarray:
+    """Distances between all the pairs of hexagons of a ``HexagonGraph``
+
+    Args:
+        graph (HexagonGraph): the graph
+        kwd (str, optional): Identifier of the distance, `hex`, `display` or `euclidian`. Defaults to "hex".
+
+    Returns:
+        np.ndarray: (N, N) array of distances, with the hexagons in the order of ``graph_coordinates``
+    """
+    return pairwise_distances(graph_coordinates(graph), kwd=kwd, radius=_radius(graph))
+
+
+def k_nearest(graph, k: int, kwd: str = "hex") -> Tuple[np.ndarray, np.ndarray]:
+    """The k nearest hexagons of each hexagon of a ``HexagonGraph``, the hexagon itself excluded
+
+    The distances are computed by chunks of rows, so that the memory does not grow as N².
+    Among hexagons at the same distance, the ones with the smallest positions come first; the choice among the hexagons tied at the k-th distance is not specified.
+
+    Args:
+        graph (HexagonGraph): the graph
+        k (int): the number of neighbours. It is capped to N - 1.
+        kwd (str, optional): Identifier of the distance, `hex`, `display` or `euclidian`. Defaults to "hex".
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: the (N, k) positions of the nearest hexagons, in the order of ``graph_coordinates``, and the (N, k) distances, sorted by increasing distance
+    """
+    _check_kwd(kwd)
+    coordinates = graph_coordinates(graph)
+    n_hexagons = len(coordinates)
+    k = max(min(k, n_hexagons - 1), 0)
+    positions = np.zeros((n_hexagons, k), dtype=np.int64)
+    nearest = np.zeros((n_hexagons, k), dtype=np.int64 if kwd == "hex" else np.float64)
+    if k == 0:
+        return positions, nearest
+    radius = _radius(graph)
+    chunk = max(CHUNK_PAIRS // n_hexagons, 1)
+    for start in range(0, n_hexagons, chunk):
+        stop = min(start + chunk, n_hexagons)
+        rows = np.arange(stop - start)
+        block = pairwise_distances(coordinates[start:stop], coordinates, kwd, radius).astype(np.float64)
+        # A hexagon is not its own neighbour
+        block[rows, np.arange(start, stop)] = np.inf
+        candidates = np.argpartition(block, k - 1, axis=1)[:, :k]
+        candidate_distances = block[rows[:, None], candidates]
+        order = np.lexsort((candidates, candidate_distances), axis=1)
+        positions[start:stop] = np.take_along_axis(candidates, order, axis=1)
+        nearest[start:stop] = np.take_along_axis(candidate_distances, order, axis=1)
+    return positions, nearest
@@ -2,23 +2,30 @@
 
 # pylint: disable=line-too-long
 # pylint: disable=too-many-instance-attributes
+# pylint: disable=import-outside-toplevel
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, ClassVar
 
-import matplotlib.pyplot as plt
 from numpy.typing import ArrayLike
-from matplotlib.artist import Artist
 
 from polyhex.objects.nodes import HexagonVertex
 from polyhex.objects.hexagons import Hexagon
+from polyhex.objects.geometry import edge_key
+
+if TYPE_CHECKING:
+    from matplotlib.artist import Artist
 
 __all__ = ("HexagonEdge",)
 
 
-@dataclass
+@dataclass(slots=True)
 class HexagonEdge:
     """HexagonEdge class.
 
+    Edges are slotted: the layout and the assets are read from their hexagon, the integer key is computed once, at creation, and the spatial and feature keys on access.
+    The integer `key` packs the sum of the cartesian coordinates of the two vertices, i.e twice the middle of the edge, which is unique to the edge and does not depend on its direction. It is used for the equality and the hashing.
+
     Args:
         hexagon (Hexagon) : the hexagon to which the edge's belong
         start (HexagonVertex) : the start vertex
@@ -34,16 +41,43 @@ class HexagonEdge:
     end: HexagonVertex
     index: int
     feature: ArrayLike = "placeholder"
+    key: int = field(init=False, default=None)
+    token: str = field(init=False, default="placeholder")
+    name: ClassVar[str] = "HexagonEdge"
 
     def __post_init__(self):
-        self.spatial_key = frozenset((self.start.spatial_key, self.end.spatial_key))
-        self.feature_key = frozenset((self.spatial_key, self.feature))
-        self.name = "HexagonEdge"
-        self.render_assets = self.hexagon.assets["render"][self.name]
-        self.compat_assets = self.hexagon.assets["compatibility"][self.name]
-        self.encoding_assets = self.hexagon.assets["encoding"][self.name]
+        # Canonical id of the edge, the key of the edge graphs
+        self.key = edge_key(self.start.x, self.start.y, self.end.x, self.end.y)
 
-        self.token = "placeholder"
+    @property
+    def spatial_key(self) -> frozenset:
+        """The spatial key of the edge, the frozenset of the spatial keys of its two vertices. It is computed on access, the graphs are keyed by `key`."""
+        return frozenset((self.start.spatial_key, self.end.spatial_key))
+
+    @property
+    def feature_key(self) -> frozenset:
+        """Combines the spatial key and the feature of the edge"""
+        return frozenset((self.spatial_key, self.feature))
+
+    @property
+    def assets(self):
+        """The assets table shared by all the hexagons"""
+        return self.hexagon.assets
+
+    @property
+    def render_assets(self):
+        """The rendering assets of the edge, shared with all the edges."""
+        return self.assets.sections[self.name]["render"]
+
+    @property
+    def compat_assets(self):
+        """The token compatibility assets of the edge, shared with all the edges."""
+        return self.assets.sections[self.name]["compatibility"]
+
+    @property
+    def encoding_assets(self):
+        """The encoding assets of the edge, shared with all the edges."""
+        return self.assets.sections[self.name]["encoding"]
 
     @property
     def encoding(self):
@@ -63,6 +97,9 @@ class HexagonEdge:
         Args:
             save (bool, optional): _description_. Defaults to True.
         """
+        # matplotlib is an optional dependency, only imported for rendering
+        import matplotlib.pyplot as plt
+
         fig = plt.figure(figsize=(2, 2))
         axes = fig.gca()
         axes.axis("off")
@@ -107,6 +144,8 @@ class HexagonEdge:
         Returns:
             axes (Artist): matplotlib.Artist on which the edge was rendered
         """
+        from matplotlib.patches import Polygon
+
         triangle = [
             self.start.display_coordinates,
             self.end.display_coordinates,
@@ -114,12 +153,12 @@ class HexagonEdge:
         ]
         render_params = self.render_assets["feature"][self.token]
         if not kwargs:
-            axes.add_patch(plt.Polygon(xy=triangle, **render_params["triangle"]))
+            axes.add_patch(Polygon(xy=triangle, **render_params["triangle"]))
         else:
-            axes.add_patch(plt.Polygon(xy=triangle, **render_params["triangle"]))
+            axes.add_patch(Polygon(xy=triangle, **render_params["triangle"]))
         return axes
 
-    def render(self, axes: Artist, **kwargs):
+    def render(self, axes: "Artist", **kwargs):
         """The `render` method is a public method.
         It is used for display and differs from ``draw`` as it requires a matplotlib.axe and returns a matplotlib.axe
         Args:
@@ -158,7 +197,16 @@ class HexagonEdge:
 
     ### __dunder__ nethods ###
     def __eq__(self, other):
-        return isinstance(other, HexagonEdge) and self.feature_key == other.feature_key
+        # Same position and same feature, as the feature_key
+        return (
+            isinstance(other, HexagonEdge)
+            and self.key == other.key
+            and self.feature == other.feature
+        )
+
+    def __hash__(self):
+        # The edges that only differ by their feature share the same hash
+        return hash(self.key)
 
     def __str__(self):
         return f"Edge: {self.start} -> {self.end} \n"
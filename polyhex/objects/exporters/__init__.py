@@ -1,4 +1,13 @@
-from .pyg_exporter import *
+from polyhex.utilities.lazy import lazy_attributes
+
+# The exporters depend on torch and torch_geometric: they are imported on first access
+_LAZY_ATTRIBUTES = {
+    "PyGExporter": ".pyg_exporter",
+    "IncrementalPyGExporter": ".incremental_exporter",
+    "GridExporter": ".grid_exporter",
+}
 
 __all__ = ()
-__all__ += pyg_exporter.__all__
\ No newline at end of file
+__all__ += tuple(_LAZY_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES, globals())
@@ -0,0 +1,139 @@
+"""
+Module that defines the export of polyhexes to dense axial-grid tensors, for convolutional models
+"""
+# pylint: disable=line-too-long
+from typing import Iterable, List, Tuple
+
+import numpy as np
+import torch
+from polyhex.objects.stores import COLUMN_NAMES, HexagonStore
+
+__all__ = ('GridExporter',)
+
+
+def _channel_names(occupancy: bool) -> List[str]:
+    names = ["occupancy"] if occupancy else []
+    names += ["centre_feature", "centre_token"]
+    for prefix in ("vertex", "edge"):
+        for kind in ("feature", "token"):
+            names += [f"{prefix}_{kind}_{index}" for index in range(6)]
+    return names
+
+
+class GridExporter:
+    """
+    GridExporter class: interface between `polyhex` boards and dense (C, H, W) tensors.
+
+    A hexagon with axial coordinates (q, r) is written in the cell [r - r_min, q - q_min] of the grid: the six neighbours of a hexagon are its neighbours in the grid, but for the two cells of the (1, 1) and (-1, -1) diagonals.
+    The channels are the encodings of the ``encoding`` assets, see ``channel_names``:
+        an optional occupancy channel, 1 for the cells of the board and 0 elsewhere,
+        the feature and token of the centre,
+        the features of the 6 vertices, then their tokens, in the order of the vertices of the hexagons,
+        the features of the 6 edges, then their tokens.
+    The border hexagons are not exported.
+
+    Args:
+        occupancy (bool, optional): whether to export the occupancy channel. Defaults to True.
+        dtype (torch.dtype, optional): the dtype of the exported tensors, which must have a NumPy equivalent. Defaults to torch.float32.
+    """
+    def __init__(self, occupancy: bool = True, dtype: torch.dtype = torch.float32):
+        self.occupancy = occupancy
+        self.dtype = dtype
+        # The grids are written through NumPy views on the tensors
+        self.numpy_dtype = torch.zeros(0, dtype=dtype).numpy().dtype
+        self.channel_names = _channel_names(occupancy)
+
+    @property
+    def n_channels(self) -> int:
+        """The number of channels of the exported tensors"""
+        return len(self.channel_names)
+
+    @staticmethod
+    def _store(board) -> HexagonStore:
+        """The columns of a board, given as a store or as a hypergraph recording a ``HexagonGraph``"""
+        if isinstance(board, HexagonStore):
+            return board
+        assert "HexagonGraph" in board, "The hypergraph must record a HexagonGraph to be exported as a grid"
+        return HexagonStore.from_hexagons(board["HexagonGraph"].nodes.values())
+
+    def _values(self, store: HexagonStore) -> np.ndarray:
+        """(N, C) array of the channels of the hexagons of a store"""
+        # The layout of the store was checked when it was created
+        tables = {
+            (prefix, kind): store.encoding_table(name, kind)
+            for prefix, name in COLUMN_NAMES.items()
+            for kind in ("feature", "token")
+        }
+        values = np.empty((len(store), self.n_channels), dtype=self.numpy_dtype)
+        channel = 0
+        if self.occupancy:
+            values[:, 0] = 1
+            channel = 1
+        # The encoding tables are gathered straight into the channels, in the order of ``channel_names``
+        for prefix, width in (("centre", 1), ("vertex", 6), ("edge", 6)):
+            for kind in ("feature", "token"):
+                values[:, channel : channel + width] = tables[(prefix, kind)][getattr(store, f"{prefix}_{kind}")].reshape(-1, width)
+                channel += width
+        return values
+
+    @staticmethod
+    def _frame(coordinates: np.ndarray, origin: Tuple[int], shape: Tuple[int]) -> Tuple[Tuple[int], Tuple[int]]:
+        """The (q_min, r_min) origin and the (H, W) shape of the grid, defaulting to the bounding box of the coordinates"""
+        if origin is None:
+            origin = tuple(int(value) for value in coordinates.min(axis=0)) if len(coordinates) else (0, 0)
+        if shape is None:
+            if len(coordinates):
+                q_max, r_max = coordinates.max(axis=0)
+                shape = (int(r_max) - origin[1] + 1, int(q_max) - origin[0] + 1)
+            else:
+                shape = (0, 0)
+        return origin, shape
+
+    @staticmethod
+    def _scatter(grid: np.ndarray, values: np.ndarray, coordinates: np.ndarray, origin: Tuple[int], shape: Tuple[int]):
+        """Writes the (N, C) values of the hexagons in their cells of a (C, H, W) grid, dropping the hexagons outside of the grid"""
+        rows = coordinates[:, 1] - origin[1]
+        cols = coordinates[:, 0] - origin[0]
+        inside = (rows >= 0) & (rows < shape[0]) & (cols >= 0) & (cols < shape[1])
+        if not inside.all():
+            rows, cols, values = rows[inside], cols[inside], values[inside]
+        # Vectorized scatter on the flattened cells, which is much faster in NumPy than with the advanced indexing of torch
+        grid.reshape(len(grid), -1)[:, rows * shape[1] + cols] = values.T
+
+    def export_polyhex(self, board, origin: Tuple[int] = None, shape: Tuple[int] = None) -> torch.Tensor:
+        """Exports a board to a dense axial grid
+
+        Args:
+            board (Dict | HexagonStore): the hypergraph of a polyhex, which must record a ``HexagonGraph``, or the store of its hexagons
+            origin (Tuple[int], optional): the (q, r) coordinates of the hexagon in the cell [0, 0] of the grid. Defaults to None, i.e to the minimum coordinates of the hexagons.
+            shape (Tuple[int], optional): the (H, W) shape of the grid. Defaults to None, i.e to the shape of the bounding box of the hexagons. The hexagons outside of the grid are not exported.
+
+        Returns:
+            torch.Tensor: the (C, H, W) tensor of the board
+        """
+        store = self._store(board)
+        values = self._values(store)
+        coordinates = store.coordinates.astype(np.int64)
+        origin, shape = self._frame(coordinates, origin, shape)
+        grid = torch.zeros((self.n_channels,) + tuple(shape), dtype=self.dtype)
+        self._scatter(grid.numpy(), values, coordinates, origin, shape)
+        return grid
+
+    def export_polyhexes(self, boards: Iterable, origin: Tuple[int] = None, shape: Tuple[int] = None) -> torch.Tensor:
+        """Exports boards to a batch of dense axial grids, sharing the same frame
+
+        Args:
+            boards (Iterable[Dict | HexagonStore]): the boards, see ``export_polyhex``
+            origin (Tuple[int], optional): the (q, r) coordinates of the hexagon in the cell [0, 0] of the grids. Defaults to None, i.e to the minimum coordinates of the hexagons of all the boards.
+            shape (Tuple[int], optional): the (H, W) shape of the grids. Defaults to None, i.e to the shape of the bounding box of the hexagons of all the boards.
+
+        Returns:
+            torch.Tensor: the (B, C, H, W) tensor of the boards
+        """
+        stores = [self._store(board) for board in boards]
+        coordinates = [store.coordinates.astype(np.int64).reshape(-1, 2) for store in stores]
+        origin, shape = self._frame(np.concatenate(coordinates) if coordinates else np.zeros((0, 2), dtype=np.int64), origin, shape)
+        grids = torch.zeros((len(stores), self.n_channels) + tuple(shape), dtype=self.dtype)
+        for grid, store, board_coordinates in zip(grids.numpy(), stores, coordinates):
+            self._scatter(grid, self._values(store), board_coordinates, origin, shape)
+        return grids
@@ -0,0 +1,237 @@
+"""
+Module that defines the incremental export of polyhex graphs to a PyGeometric Hetero Data object
+"""
+# pylint: disable=line-too-long
+from typing import Dict, List, Tuple
+from weakref import WeakKeyDictionary
+
+import numpy as np
+import torch
+from torch_geometric.data import HeteroData, Data
+from polyhex.objects.distances import euclidean
+from polyhex.objects.graphs import Graph, GraphChanges
+from polyhex.objects.exporters.pyg_exporter import PyGExporter
+
+__all__ = ('IncrementalPyGExporter',)
+
+
+class _ExportedGraph:
+    """Tensors of an exported graph, indexed by the node indices of the graph, with a spare capacity"""
+
+    def __init__(self, distance_kwd: str, record_y: bool):
+        self.distance_kwd = distance_kwd
+        self.record_y = record_y
+        self.reset()
+
+    def reset(self):
+        """Drops the exported tensors"""
+        # The node features get the dtype and shape of the first written node
+        self.x = np.zeros((0, 2), dtype=np.int64)
+        self.y = np.zeros((0, 2), dtype=np.int64)
+        self.has_features = False
+        self.node_mask = np.zeros(0, dtype=bool)
+        self.edge_index = np.zeros((2, 0), dtype=np.int64)
+        self.edge_attr = np.zeros(0, dtype=np.float64 if self.distance_kwd == "euclidian" else np.int64)
+        self.n_indices = 0
+        self.n_edges = 0
+        # Column of each directed connexion (key, other_key), and connexion of each column
+        self.edge_positions: Dict[Tuple, int] = {}
+        self.edge_keys: List[Tuple] = []
+        # Changes the graph recorded into after the last checkpoint of this export, see ``Graph.changes``
+        self.changes: GraphChanges = None
+
+    ######### Nodes #########
+    def _reserve_nodes(self, n_indices: int):
+        if n_indices <= len(self.x):
+            return
+        capacity = max(n_indices, 2 * len(self.x))
+        for name in ("x", "y", "node_mask"):
+            array = getattr(self, name)
+            grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[: len(array)] = array
+            setattr(self, name, grown)
+
+    def write_node(self, index: int, node):
+        feature = np.asarray(node.encoding)
+        if not self.has_features:
+            self.x = np.zeros((len(self.x),) + feature.shape, dtype=feature.dtype)
+            self.has_features = True
+        self._reserve_nodes(index + 1)
+        self.x[index] = feature
+        if self.record_y:
+            self.y[index] = (node.x, node.y)
+        self.node_mask[index] = True
+        self.n_indices = max(self.n_indices, index + 1)
+
+    def erase_node(self, index: int):
+        self.node_mask[index] = False
+
+    ######### Edges #########
+    def _reserve_edges(self, n_edges: int):
+        if n_edges <= self.edge_index.shape[1]:
+            return
+        capacity = max(n_edges, 2 * self.edge_index.shape[1])
+        edge_index = np.zeros((2, capacity), dtype=np.int64)
+        edge_index[:, : self.n_edges] = self.edge_index[:, : self.n_edges]
+        edge_attr = np.zeros(capacity, dtype=self.edge_attr.dtype)
+        edge_attr[: self.n_edges] = self.edge_attr[: self.n_edges]
+        self.edge_index, self.edge_attr = edge_index, edge_attr
+
+    def _distance(self, node, other_node):
+        if self.distance_kwd == "euclidian":
+            return euclidean(node.spatial_key, other_node.spatial_key)
+        # Path distance between edges: 1 if they share a vertex, 0 otherwise
+        ends = {node.start.feature_key, node.end.feature_key}
+        return int(other_node.start.feature_key in ends or other_node.end.feature_key in ends)
+
+    def append_connexion(self, graph: Graph, key, other_key):
+        """Appends the two directed columns of a connexion"""
+        self._reserve_edges(self.n_edges + 2)
+        distance = self._distance(graph.nodes[key], graph.nodes[other_key])
+        for source, target in ((key, other_key), (other_key, key)):
+            self.edge_index[0, self.n_edges] = graph.node_to_index[source]
+            self.edge_index[1, self.n_edges] = graph.node_to_index[target]
+            self.edge_attr[self.n_edges] = distance
+            self.edge_positions[(source, target)] = self.n_edges
+            self.edge_keys.append((source, target))
+            self.n_edges += 1
+
+    def remove_connexion(self, key, other_key):
+        """Removes the two directed columns of a connexion, by moving the last columns in their place"""
+        for pair in ((key, other_key), (other_key, key)):
+            position = self.edge_positions.pop(pair)
+            last = self.n_edges - 1
+            last_pair = self.edge_keys.pop()
+            if position != last:
+                self.edge_index[:, position] = self.edge_index[:, last]
+                self.edge_attr[position] = self.edge_attr[last]
+                self.edge_keys[position] = last_pair
+                self.edge_positions[last_pair] = position
+            self.n_edges = last
+
+    ######### Updates #########
+    def rebuild(self, graph: Graph):
+        """Exports the whole graph, with its current node indices"""
+        self.reset()
+        for key, node in graph.nodes.items():
+            self.write_node(graph.node_to_index[key], node)
+        for key in graph.nodes:
+            for other_key in graph.weights[key]:
+                if (key, other_key) not in self.edge_positions:
+                    self.append_connexion(graph, key, other_key)
+        self.n_indices = graph.index_capacity
+
+    def update(self, graph: Graph, changes: GraphChanges):
+        """Applies the changes of the graph since the last update"""
+        for key, other_key in changes.disconnected.values():
+            self.remove_connexion(key, other_key)
+        for index in changes.removed_nodes.values():
+            self.erase_node(index)
+        for key in changes.added_nodes:
+            self.write_node(graph.node_to_index[key], graph.nodes[key])
+        for key, other_key in changes.connected.values():
+            self.append_connexion(graph, key, other_key)
+        self.n_indices = graph.index_capacity
+
+    def to_data(self) -> Data:
+        """Wraps the live part of the buffers into a Data object, without copying them"""
+        # The removed nodes with the last indices may never have been written
+        self._reserve_nodes(self.n_indices)
+        nodes = slice(0, self.n_indices)
+        return Data(
+            x=torch.from_numpy(self.x[nodes]),
+            edge_index=torch.from_numpy(self.edge_index[:, : self.n_edges]),
+            edge_attr=torch.from_numpy(self.edge_attr[: self.n_edges]),
+            node_mask=torch.from_numpy(self.node_mask[nodes]),
+            num_nodes=self.n_indices,
+            y=torch.from_numpy(self.y[nodes]) if self.record_y else None,
+        )
+
+
+class IncrementalPyGExporter(PyGExporter):
+    """
+    IncrementalPyGExporter class: exporter that keeps the tensors of the graphs it exported, and only applies the changes of the graphs since their last export.
+
+    The first export of a graph starts tracking its changes (see ``Graph.track_changes``) and exports it entirely. The next exports only write the rows of the added nodes and append or remove the columns of the changed connexions, so that their cost is proportional to the number of changes rather than to the size of the graph.
+    Unlike ``PyGExporter``, the graphs are not compacted:
+        the rows of x and y are the node indices of the graph, the rows of the removed nodes being kept until their index is recycled,
+        node_mask tells which rows are live nodes,
+        the columns of edge_index are not ordered, as a removed connexion is replaced by the last column.
+    A ``Graph.compact`` call between two exports triggers a full export of the graph.
+
+    Note:
+        The tensors of the exported Data objects are views on buffers that are updated in place: an exported Data object is only valid until the next export of the same graph.
+        The features of the nodes are only read when the nodes are added, see ``refresh_nodes`` for the nodes whose tokens change.
+        The exporter only keeps weak references to the graphs: the tensors of a graph are dropped when the graph is garbage collected, or by ``forget``.
+        Several exporters, or other consumers of the changes, can share a graph: an exporter exports the whole graph again when the changes were checkpointed by someone else since its last export, see ``Graph.changes``.
+    """
+    def __init__(self):
+        super().__init__()
+        # Exported tensors, by graph. The graphs are weakly referenced: their tensors are dropped when they are garbage collected.
+        self._exported: WeakKeyDictionary = WeakKeyDictionary()
+
+    def _is_exported(self, graph: Graph) -> bool:
+        # The graphs hash and compare by identity
+        return graph in self._exported
+
+    def export_graph(self, graph: Graph):
+        """Exports a graph, applying its changes since its last export to the previously exported tensors
+
+        Args:
+            graph (Graph): Graph object. It must have a `name`, a number of nodes `n_nodes`, and `nodes`, `weights`, `node_to_index` dicts.
+
+        Raises:
+            NotImplementedError: there is no export for the name of the graph, see ``PyGExporter.export_graph``.
+
+        Returns:
+            Data: A PyGeometric Data object (https://pytorch-geometric.readthedocs.io/en/latest/generated/torch_geometric.data.Data.html) with an additional `node_mask` tensor
+        """
+        if not self._is_exported(graph):
+            distance_kwd, record_y = self._export_settings(graph.name)
+            self._exported[graph] = _ExportedGraph(distance_kwd, record_y)
+        exported = self._exported[graph]
+        graph.track_changes()
+        # The changes were not tracked since the last export, or were checkpointed by another consumer of the graph
+        stale = graph.changes is not exported.changes
+        changes = graph.checkpoint()
+        if stale or changes.reset:
+            exported.rebuild(graph)
+        else:
+            exported.update(graph, changes)
+        exported.changes = graph.changes
+        return exported.to_data()
+
+    def refresh_nodes(self, graph: Graph, keys):
+        """Rewrites the exported features of some nodes, for instance after a change of their tokens
+
+        Args:
+            graph (Graph): a graph exported by this exporter
+            keys (Iterable): the keys of the nodes to rewrite
+        """
+        assert self._is_exported(graph), f"The {graph.name} was not exported by this exporter"
+        exported = self._exported[graph]
+        for key in keys:
+            exported.write_node(graph.node_to_index[key], graph.nodes[key])
+
+    def forget(self, graph: Graph):
+        """Drops the exported tensors of a graph and stops tracking its changes
+
+        Args:
+            graph (Graph): a graph exported by this exporter
+        """
+        self._exported.pop(graph, None)
+        graph.stop_tracking()
+
+    def export_graphs(self, graphs: Dict[str, Graph]):
+        """Exports a dict of Graphs, see ``export_graph``
+
+        Args:
+            graphs (Dict[str, Graph]): A dictionnary holding the graphs
+
+        Returns:
+            HeteroData: A PyGeometric HeteroData object (https://pytorch-geometric.readthedocs.io/en/latest/generated/torch_geometric.data.HeteroData.html)
+        """
+        return_graph = HeteroData()
+        for name, graph in graphs.items():
+            return_graph[name] = self.export_graph(graph)
+        return return_graph
@@ -2,8 +2,10 @@
 Module that defines the export of polyhex graphs to a PyGeometric Hetero Data object
 """
 # pylint: disable=line-too-long
-from typing import Dict
+from itertools import chain
+from typing import Dict, Iterable, List, Tuple
 
+import numpy as np
 import torch
 from torch_geometric.data import HeteroData, Data
 from polyhex.objects.graphs import Graph
@@ -18,39 +20,145 @@ class PyGExporter:
     def __init__(self):
         pass
 
+    @staticmethod
+    def _feature_layout(graph: Graph):
+        """Shape and dtype of the node features of a graph, read from the encoding of its first node"""
+        if not graph.nodes:
+            return (2,), np.dtype(np.int64)
+        feature = np.asarray(next(iter(graph.nodes.values())).encoding)
+        return feature.shape, feature.dtype
+
+    @staticmethod
+    def _write_nodes(graph: Graph, x: np.ndarray, y: np.ndarray):
+        """Writes the node features into `x` and, if `y` is not None, the cartesian coordinates of the nodes into `y`, in the order of the `nodes` dictionnary"""
+        nodes = graph.nodes.values()
+        x[...] = np.fromiter(
+            chain.from_iterable(node.encoding for node in nodes), dtype=x.dtype, count=x.size
+        ).reshape(x.shape)
+        if y is not None:
+            y[...] = np.fromiter(
+                chain.from_iterable((node.x, node.y) for node in nodes), dtype=np.int64, count=y.size
+            ).reshape(y.shape)
+
+    @staticmethod
+    def _write_edge_index(graph: Graph, edge_index: np.ndarray):
+        """Writes the (2, n_edges) connexions of a compact graph into `edge_index`, in the order of the `weights` dictionnaries"""
+        counts = np.fromiter(
+            (len(graph.weights[key]) for key in graph.nodes),
+            dtype=np.int64,
+            count=graph.n_nodes,
+        )
+        node_to_index = graph.node_to_index
+        edge_index[1] = np.fromiter(
+            (
+                node_to_index[neighbour_key]
+                for key in graph.nodes
+                for neighbour_key in graph.weights[key]
+            ),
+            dtype=np.int64,
+            count=edge_index.shape[1],
+        )
+        # The graph is compact: the index of a node is its position in the `nodes` dictionnary
+        edge_index[0] = np.repeat(np.arange(graph.n_nodes, dtype=np.int64), counts)
+
+    @staticmethod
+    def _euclidian_distances(graph: Graph, edge_index: np.ndarray, out: np.ndarray):
+        """Writes the euclidian distances between the spatial keys of the connected nodes into `out`"""
+        # The vertex graphs are keyed by ids: the spatial keys are read from the nodes
+        keys = np.fromiter(
+            chain.from_iterable(node.spatial_key for node in graph.nodes.values()),
+            dtype=np.float64,
+            count=2 * graph.n_nodes,
+        ).reshape(-1, 2)
+        deltas = keys[edge_index[0]]
+        deltas -= keys[edge_index[1]]
+        deltas *= deltas
+        np.sqrt(deltas.sum(axis=1), out=out)
+
+    @staticmethod
+    def _path_distances(graph: Graph, edge_index: np.ndarray, out: np.ndarray):
+        """Writes the path distances between connected edges into `out`: 1 if they share a vertex, 0 otherwise"""
+        # The vertices are numbered by their `feature_key`, which is how they compare
+        vertex_ids = {}
+        ends = np.fromiter(
+            (
+                vertex_ids.setdefault(vertex.feature_key, len(vertex_ids))
+                for edge in graph.nodes.values()
+                for vertex in (edge.start, edge.end)
+            ),
+            dtype=np.int64,
+            count=2 * graph.n_nodes,
+        ).reshape(-1, 2)
+        first, second = ends[edge_index[0]], ends[edge_index[1]]
+        out[...] = (first[:, :, None] == second[:, None, :]).any(axis=(1, 2))
+
+    def _write_graph(self, graph: Graph, distance_kwd: str, x: np.ndarray, edge_index: np.ndarray, edge_attr: np.ndarray, y: np.ndarray, offset: int = 0):
+        """Writes the arrays of a compact graph into the given buffers, its node indices being shifted by `offset` in `edge_index`"""
+        self._write_edge_index(graph, edge_index)
+        if distance_kwd == "euclidian":
+            self._euclidian_distances(graph, edge_index, edge_attr)
+        else:
+            self._path_distances(graph, edge_index, edge_attr)
+        if offset:
+            edge_index += offset
+        self._write_nodes(graph, x, y)
+
+    @staticmethod
+    def _check_distance(distance_kwd: str):
+        if distance_kwd not in ("euclidian", "path"):
+            raise NotImplementedError(
+                f"The export is only implemented for the `euclidian` and `path` distances, got {distance_kwd}"
+            )
+
+    @staticmethod
+    def _allocate(n_nodes: int, n_edges: int, feature_shape: Tuple[int], feature_dtype, distance_kwd: str, record_y: bool):
+        """Allocates the uninitialised x, edge_index, edge_attr and y arrays of a graph, or of a batch of graphs"""
+        return (
+            np.empty((n_nodes,) + tuple(feature_shape), dtype=feature_dtype),
+            np.empty((2, n_edges), dtype=np.int64),
+            np.empty(n_edges, dtype=np.float64 if distance_kwd == "euclidian" else np.int64),
+            np.empty((n_nodes, 2), dtype=np.int64) if record_y else None,
+        )
+
+    def _export_arrays(self, graph: Graph, distance_kwd: str, record_y: bool):
+        """Compacts the graph and returns its x, edge_index, edge_attr and y arrays, see ``template_exporter``"""
+        self._check_distance(distance_kwd)
+        graph.compact()
+        arrays = self._allocate(
+            graph.n_nodes, sum(map(len, graph.weights.values())), *self._feature_layout(graph), distance_kwd, record_y
+        )
+        self._write_graph(graph, distance_kwd, *arrays)
+        return arrays
+
     def template_exporter(self, graph: Graph, distance_kwd: str, record_y=False):
         """Template function to export a graph to PyG
 
+        Note:
+            The graph is compacted before the export, so that the node indices are the rows of the exported node features.
+            The node features and the connexions are collected once, the distances are then computed for all the connexions in a single array operation.
+
         Args:
             graph (Graph): Graph object. It must have `nodes`, `weights` and `node_to_index` dicts.
-            distance_kwd (str): the string identifier of the distance function.
-            record_y (bool, optional): Whether or not to record the spatial position of the nodes. As it is ambiguous for the edges, it is not a default parameter of the template. Defaults to False.
+            distance_kwd (str): the string identifier of the distance function. It can be `euclidian` or `path`.
+            record_y (bool, optional): Whether or not to record the spatial position of the nodes, as a (num_nodes, 2) tensor. As it is ambiguous for the edges, it is not a default parameter of the template. Defaults to False.
+
+        Raises:
+            NotImplementedError: the distance is neither `euclidian` nor `path`.
 
         Returns:
             Data: A PyGeometric Data object (https://pytorch-geometric.readthedocs.io/en/latest/generated/torch_geometric.data.Data.html)
         """
-        ### Defining graph attributes
-        x = []
-        edge_index = [[], []]
-        edge_attr = []
-        y = [] if record_y else None
-        ### Appending graph attributes
-        for key, node in graph.nodes.items():
-            x.append(node.encoding)
-            if y is not None:
-                y.append([node.x, node.y])
-            for neighbour in graph.weights[key]:
-                # start node for the edge
-                edge_index[0].append(graph.node_to_index[key])
-                # End node for the edge
-                edge_index[1].append(graph.node_to_index[neighbour.spatial_key])
-                edge_attr.append(node.distance(neighbour, kwd=distance_kwd))
+        return self._to_data(*self._export_arrays(graph, distance_kwd, record_y))
+
+    @staticmethod
+    def _to_data(x: np.ndarray, edge_index: np.ndarray, edge_attr: np.ndarray, y: np.ndarray):
+        """Wraps the exported arrays of a graph into a Data object, without copying them"""
         return Data(
-            x=torch.tensor(x),
-            edge_index=torch.tensor(edge_index),
-            edge_attr=torch.tensor(edge_attr),
-            num_nodes=graph.n_nodes,
-            y=y,
+            x=torch.from_numpy(x),
+            edge_index=torch.from_numpy(edge_index),
+            edge_attr=torch.from_numpy(edge_attr),
+            num_nodes=len(x),
+            y=None if y is None else torch.from_numpy(y),
         )
 
     def export_graph(self, graph: Graph):
@@ -65,15 +173,19 @@ class PyGExporter:
         Returns:
             Data: A PyGeometric Data object (https://pytorch-geometric.readthedocs.io/en/latest/generated/torch_geometric.data.Data.html)
         """
-        if graph.name in ["VertexGraph", "HexagonGraph", "HexagonBorderGraph"]:
-            return self.template_exporter(
-                graph, distance_kwd="euclidian", record_y=True
-            )
-        if graph.name in ["EdgeGraph", "EdgeBorderGraph"]:
-            return self.template_exporter(graph, distance_kwd="path")
+        distance_kwd, record_y = self._export_settings(graph.name)
+        return self.template_exporter(graph, distance_kwd=distance_kwd, record_y=record_y)
+
+    @staticmethod
+    def _export_settings(name: str):
+        """Returns the (distance_kwd, record_y) export settings of the graphs with the given name"""
+        if name in ["VertexGraph", "HexagonGraph", "HexagonBorderGraph"]:
+            return "euclidian", True
+        if name in ["EdgeGraph", "EdgeBorderGraph"]:
+            return "path", False
 
         raise NotImplementedError(
-            f"`export_graph` method not implemented for {graph.name}"
+            f"`export_graph` method not implemented for {name}"
         )
 
     def export_graphs(self, graphs: Dict[str, Graph]):
@@ -89,3 +201,99 @@ class PyGExporter:
         for name, graph in graphs.items():
             return_graph[name] = self.export_graph(graph)
         return return_graph
+
+    def export_arrays(self, graphs: Dict[str, Graph]) -> Dict[str, Tuple[np.ndarray]]:
+        """Exports a dict of Graphs to NumPy arrays, which are much cheaper to pickle than the graphs or the tensors
+
+        Args:
+            graphs (Dict[str, Graph]): A dictionnary holding the graphs
+
+        Returns:
+            Dict[str, Tuple[np.ndarray]]: the (x, edge_index, edge_attr, y) arrays of each graph, y being None for the edge graphs. ``from_arrays`` turns them into the output of ``export_graphs``.
+        """
+        return {
+            name: self._export_arrays(graph, *self._export_settings(graph.name))
+            for name, graph in graphs.items()
+        }
+
+    def from_arrays(self, arrays: Dict[str, Tuple[np.ndarray]]):
+        """Wraps the arrays returned by ``export_arrays`` into a HeteroData object, without copying them
+
+        Args:
+            arrays (Dict[str, Tuple[np.ndarray]]): the (x, edge_index, edge_attr, y) arrays of each graph
+
+        Returns:
+            HeteroData: A PyGeometric HeteroData object (https://pytorch-geometric.readthedocs.io/en/latest/generated/torch_geometric.data.HeteroData.html)
+        """
+        return_graph = HeteroData()
+        for name, graph_arrays in arrays.items():
+            return_graph[name] = self._to_data(*graph_arrays)
+        return return_graph
+
+    def export_many(self, hypergraphs: Iterable[Dict[str, Graph]]):
+        """Exports many dicts of Graphs into a single collated HeteroData object
+
+        For each graph name, the graphs of all the hypergraphs are written into one set of preallocated tensors, laid out as a PyG ``Batch``:
+            x, edge_attr and y are the concatenation of the tensors of each graph,
+            edge_index is the concatenation of the connexions of each graph, offset by the number of nodes of the previous graphs,
+            batch maps each node to the position of its hypergraph in `hypergraphs`,
+            ptr (of size len(hypergraphs) + 1) holds the index of the first node of each hypergraph.
+        A hypergraph without a graph of a given name contributes an empty graph to it.
+
+        Args:
+            hypergraphs (Iterable[Dict[str, Graph]]): The dictionnaries holding the graphs.
+
+        Returns:
+            HeteroData: A PyGeometric HeteroData object (https://pytorch-geometric.readthedocs.io/en/latest/generated/torch_geometric.data.HeteroData.html)
+        """
+        hypergraphs = list(hypergraphs)
+        names = list(dict.fromkeys(name for graphs in hypergraphs for name in graphs))
+        return_graph = HeteroData()
+        for name in names:
+            return_graph[name] = self._export_batch(
+                name, [graphs.get(name) for graphs in hypergraphs]
+            )
+        return return_graph
+
+    def _export_batch(self, name: str, graphs: List[Graph]):
+        """Exports the graphs with the given name into preallocated, concatenated tensors, see ``export_many``"""
+        distance_kwd, record_y = self._export_settings(name)
+        self._check_distance(distance_kwd)
+        node_counts = np.zeros(len(graphs), dtype=np.int64)
+        edge_counts = np.zeros(len(graphs), dtype=np.int64)
+        for position, graph in enumerate(graphs):
+            if graph is not None:
+                graph.compact()
+                node_counts[position] = graph.n_nodes
+                edge_counts[position] = sum(map(len, graph.weights.values()))
+        ptr = np.concatenate([[0], np.cumsum(node_counts)])
+        edge_ptr = np.concatenate([[0], np.cumsum(edge_counts)])
+
+        # Single allocation per tensor, the node features have the layout of the first non empty graph
+        first = next((graph for graph in graphs if graph is not None and graph.n_nodes), None)
+        feature_layout = self._feature_layout(first) if first is not None else ((2,), np.dtype(np.int64))
+        x, edge_index, edge_attr, y = self._allocate(ptr[-1], edge_ptr[-1], *feature_layout, distance_kwd, record_y)
+        for position, graph in enumerate(graphs):
+            if not node_counts[position]:
+                continue
+            # Each graph is written straight into its slice of the batch tensors
+            nodes = slice(ptr[position], ptr[position + 1])
+            edges = slice(edge_ptr[position], edge_ptr[position + 1])
+            self._write_graph(
+                graph,
+                distance_kwd,
+                x[nodes],
+                edge_index[:, edges],
+                edge_attr[edges],
+                None if y is None else y[nodes],
+                offset=ptr[position],
+            )
+        return Data(
+            x=torch.from_numpy(x),
+            edge_index=torch.from_numpy(edge_index),
+            edge_attr=torch.from_numpy(edge_attr),
+            y=None if y is None else torch.from_numpy(y),
+            batch=torch.from_numpy(np.repeat(np.arange(len(graphs), dtype=np.int64), node_counts)),
+            ptr=torch.from_numpy(ptr),
+            num_nodes=int(ptr[-1]),
+        )
@@ -0,0 +1,265 @@
+"""Module for the precomputed geometry of the hexagons.
+
+The geometry of a hexagon only depends on its layout, i.e on its (hex_coord_system, top, vertex_orientation) combination.
+All the offsets a hexagon needs (its vertices, its neighbouring hexagons, the vertices and edges adjacent to its vertices and edges) are computed once per layout and shared by all the hexagons, so that creating a hexagon or querying its adjency is a table lookup.
+
+The vertices and the edges also have canonical integer ids, derived from their position on the cartesian grid:
+    -> the id of a vertex packs its (x, y) coordinates, <br>
+    -> the id of an edge packs the sum of the coordinates of its two vertices, i.e twice its middle, which is unique to the edge and does not depend on its direction. <br>
+They are the keys of the ``VertexGraph``, ``EdgeGraph`` and ``EdgeBorderGraph``.
+"""
+
+# pylint: disable=line-too-long
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from polyhex.utilities import pack_coordinates
+
+__all__ = ("HexagonGeometry", "get_geometry", "vertex_key", "edge_key", "to_vertex_key", "to_edge_key", "centres")
+
+# Pointy top, axial ordering blablabla
+ADJENCY_TO_ROTATIONS_FUNCTIONS = {
+    # Edge index : N rotations of the neighbour hexagon to math edges.
+    # Example: consider a hexagon at (q,r) with a pointy top and clockwise vertex ordering and its first neighbour, at position (q+1, r-1). In order to match the first edge of (q,r) to the first edge of (q+1, r-1), the latter has to be rotated 3 times
+    0: [3, 2, 1, 0, 5, 4],
+    1: [4, 3, 2, 1, 0, 5],
+    2: [5, 4, 3, 2, 1, 0],
+    3: [0, 5, 4, 3, 2, 1],
+    4: [1, 0, 5, 4, 3, 2],
+    5: [2, 1, 0, 5, 4, 3],
+}
+
+
+def vertex_key(x, y):
+    """Canonical id of the vertex at (x, y). It works on python integers and on numpy int64 arrays alike.
+
+    Args:
+        x (int | np.ndarray): first cartesian coordinates
+        y (int | np.ndarray): second cartesian coordinates
+
+    Returns:
+        int | np.ndarray: the ids of the vertices
+    """
+    return pack_coordinates(x, y)
+
+
+def edge_key(start_x, start_y, end_x, end_y):
+    """Canonical id of the edge between the vertices at (start_x, start_y) and (end_x, end_y). It works on python integers and on numpy int64 arrays alike.
+
+    Args:
+        start_x (int | np.ndarray): first cartesian coordinates of the start vertices
+        start_y (int | np.ndarray): second cartesian coordinates of the start vertices
+        end_x (int | np.ndarray): first cartesian coordinates of the end vertices
+        end_y (int | np.ndarray): second cartesian coordinates of the end vertices
+
+    Returns:
+        int | np.ndarray: the ids of the edges
+    """
+    return pack_coordinates(start_x + end_x, start_y + end_y)
+
+
+def to_vertex_key(key) -> int:
+    """Translates a vertex, or its (x, y) spatial key, into its canonical id. Ids are returned as is.
+
+    Args:
+        key (int | Tuple[int] | HexagonVertex): the vertex, its spatial key or its id
+
+    Returns:
+        int: the id of the vertex
+    """
+    if isinstance(key, tuple):
+        return vertex_key(*key)
+    return getattr(key, "key", key)
+
+
+def to_edge_key(key) -> int:
+    """Translates an edge, or its frozenset spatial key, into its canonical id. Ids are returned as is.
+
+    Args:
+        key (int | frozenset | HexagonEdge): the edge, its spatial key or its id
+
+    Returns:
+        int: the id of the edge
+    """
+    if isinstance(key, frozenset):
+        (start_x, start_y), (end_x, end_y) = key
+        return edge_key(start_x, start_y, end_x, end_y)
+    return getattr(key, "key", key)
+
+
+def _edge_adjency_offsets(vertex_offsets, vertex_adjency_offsets):
+    """Computes, for each edge, the offsets from the hexagon's centre of the 4 edges sharing one of its vertices.
+
+    The edges are listed in the order of ``Hexagon.get_edge_adjency``: the neighbours of the edge's start, then the neighbours of its end.
+    """
+    table = []
+    for index in range(6):
+        start, end = index, (index + 1) % 6
+        edge = {vertex_offsets[start], vertex_offsets[end]}
+        adjency = []
+        for root in (start, end):
+            root_x, root_y = vertex_offsets[root]
+            for delta_x, delta_y in vertex_adjency_offsets[root]:
+                candidate = (root_x + delta_x, root_y + delta_y)
+                if {vertex_offsets[root], candidate} != edge:
+                    adjency.append((vertex_offsets[root], candidate))
+        assert len(adjency) == 4
+        table.append(tuple(adjency))
+    return tuple(table)
+
+
+@dataclass(frozen=True)
+class HexagonGeometry:
+    """Precomputed offsets of a hexagon layout.
+
+    The hex coordinates are (q, r) and the cartesian coordinates are (x, y), on the integer grid used by the ``Hexagon`` class.
+
+    Arguments:
+        hex_coord_system (str) : The hexagonal coordinate system of the layout.
+        top (str) : The top of the hexagons of the layout.
+        vertex_orientation (str) : The vertex orientation of the layout.
+        cartesian (Tuple[Tuple[int]]) : The (2, 2) matrix mapping the hex coordinates to the cartesian coordinates of the centre: x = a*q + b*r, y = c*q + d*r.
+        neighbour_offsets (Tuple[Tuple[int]]) : The hex coordinates offsets of the 6 neighbouring hexagons.
+        vertex_offsets (Tuple[Tuple[int]]) : The cartesian offsets of the 6 vertices from the centre.
+        vertex_adjency_offsets (Tuple[Tuple[Tuple[int]]]) : For each vertex index, the cartesian offsets of its 3 neighbouring vertices from the vertex.
+        edge_adjency_offsets (Tuple[Tuple[Tuple[Tuple[int]]]]) : For each edge index, the cartesian offsets from the centre of the two vertices of its 4 neighbouring edges.
+        edge_rotations (Tuple[Tuple[int]]) : For each edge index, the number of rotations of the neighbour hexagon to match edges.
+    """
+
+    hex_coord_system: str
+    top: str
+    vertex_orientation: str
+    cartesian: Tuple[Tuple[int]]
+    neighbour_offsets: Tuple[Tuple[int]]
+    vertex_offsets: Tuple[Tuple[int]]
+    vertex_adjency_offsets: Tuple[Tuple[Tuple[int]]]
+    edge_adjency_offsets: Tuple[Tuple[Tuple[Tuple[int]]]]
+    edge_rotations: Tuple[Tuple[int]]
+
+    @property
+    def layout(self) -> Tuple[str]:
+        """The (hex_coord_system, top, vertex_orientation) key of the geometry"""
+        return (self.hex_coord_system, self.top, self.vertex_orientation)
+
+    def to_cartesian(self, q: int, r: int) -> Tuple[int]:
+        """Returns the cartesian coordinates of the centre of the hexagon at (q, r)"""
+        (a, b), (c, d) = self.cartesian
+        return (a * q + b * r, c * q + d * r)
+
+    def neighbours(self, q: int, r: int) -> List[Tuple[int]]:
+        """Returns the hex coordinates of the 6 neighbours of the hexagon at (q, r)"""
+        return [(q + delta_q, r + delta_r) for delta_q, delta_r in self.neighbour_offsets]
+
+    def vertices(self, x: int, y: int) -> List[Tuple[int]]:
+        """Returns the cartesian coordinates of the 6 vertices of the hexagon centred at (x, y)"""
+        return [(x + delta_x, y + delta_y) for delta_x, delta_y in self.vertex_offsets]
+
+    def vertex_adjency(self, x: int, y: int, index: int) -> List[Tuple[int]]:
+        """Returns the cartesian coordinates of the 3 neighbours of the vertex at (x, y), of index `index` in its hexagon"""
+        return [
+            (x + delta_x, y + delta_y)
+            for delta_x, delta_y in self.vertex_adjency_offsets[index]
+        ]
+
+    def edge_adjency(self, x: int, y: int, index: int) -> List[frozenset]:
+        """Returns the spatial keys of the 4 neighbours of the edge of index `index` of the hexagon centred at (x, y)"""
+        return [
+            frozenset(((x + start_x, y + start_y), (x + end_x, y + end_y)))
+            for (start_x, start_y), (end_x, end_y) in self.edge_adjency_offsets[index]
+        ]
+
+    def vertex_adjency_keys(self, x: int, y: int, index: int) -> List[int]:
+        """Returns the ids of the 3 neighbours of the vertex at (x, y), of index `index` in its hexagon"""
+        return [
+            vertex_key(x + delta_x, y + delta_y)
+            for delta_x, delta_y in self.vertex_adjency_offsets[index]
+        ]
+
+    def edge_adjency_keys(self, x: int, y: int, index: int) -> List[int]:
+        """Returns the ids of the 4 neighbours of the edge of index `index` of the hexagon centred at (x, y)"""
+        return [
+            edge_key(x + start_x, y + start_y, x + end_x, y + end_y)
+            for (start_x, start_y), (end_x, end_y) in self.edge_adjency_offsets[index]
+        ]
+
+    def __reduce__(self):
+        # The geometries are shared: unpickling returns the table of the layout
+        return (get_geometry, self.layout)
+
+
+def _pointy_axial_clockwise() -> HexagonGeometry:
+    vertex_offsets = ((0, 2), (1, 1), (1, -1), (0, -2), (-1, -1), (-1, 1))
+    # The vertices with an even index point up, the ones with an odd index point down
+    vertex_adjency_offsets = tuple(
+        ((0, 2), (1, -1), (-1, -1)) if index % 2 == 0 else ((1, 1), (0, -2), (-1, 1))
+        for index in range(6)
+    )
+    return HexagonGeometry(
+        hex_coord_system="axial",
+        top="pointy",
+        vertex_orientation="clockwise",
+        cartesian=((2, 1), (0, -3)),
+        neighbour_offsets=((1, -1), (1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1)),
+        vertex_offsets=vertex_offsets,
+        vertex_adjency_offsets=vertex_adjency_offsets,
+        edge_adjency_offsets=_edge_adjency_offsets(vertex_offsets, vertex_adjency_offsets),
+        edge_rotations=tuple(
+            tuple(ADJENCY_TO_ROTATIONS_FUNCTIONS[index]) for index in range(6)
+        ),
+    )
+
+
+GEOMETRIES: Dict[Tuple[str], HexagonGeometry] = {
+    geometry.layout: geometry for geometry in (_pointy_axial_clockwise(),)
+}
+
+
+def get_geometry(
+    hex_coord_system: str = "axial", top: str = "pointy", vertex_orientation: str = "clockwise"
+) -> HexagonGeometry:
+    """Returns the shared geometry table of a layout.
+
+    Args:
+        hex_coord_system (str, optional): The hexagonal coordinate system. Defaults to "axial".
+        top (str, optional): The top of the hexagons. Defaults to "pointy".
+        vertex_orientation (str, optional): The vertex orientation. Defaults to "clockwise".
+
+    Raises:
+        NotImplementedError: There is no geometry table for the layout.
+
+    Returns:
+        HexagonGeometry: the precomputed offsets of the layout
+    """
+    try:
+        return GEOMETRIES[(hex_coord_system, top, vertex_orientation)]
+    except KeyError:
+        raise NotImplementedError(
+            f"The geometry is only implemented for the layouts {list(GEOMETRIES)}, got {(hex_coord_system, top, vertex_orientation)}"
+        ) from None
+
+
+# Array versions of the offsets of the pointy top, clockwise, axial layout, for the array computations on many hexagons
+_AXIAL_GEOMETRY = get_geometry("axial", "pointy", "clockwise")
+# Matrix mapping the hex coordinates to the cartesian coordinates of the centres
+CARTESIAN = np.array(_AXIAL_GEOMETRY.cartesian, dtype=np.int64)
+# Offsets of the 6 neighbouring hexagons, in hex coordinates
+HEXAGON_NEIGHBOUR_OFFSETS = np.array(_AXIAL_GEOMETRY.neighbour_offsets, dtype=np.int64)
+# Offsets of the 6 vertices from the centre, in cartesian coordinates
+VERTEX_OFFSETS = np.array(_AXIAL_GEOMETRY.vertex_offsets, dtype=np.int64)
+# Offsets of the 3 neighbouring vertices of each of the 6 vertices of a hexagon
+VERTEX_NEIGHBOUR_OFFSETS = np.array(_AXIAL_GEOMETRY.vertex_adjency_offsets, dtype=np.int64)
+
+
+def centres(coordinates: np.ndarray) -> np.ndarray:
+    """Cartesian coordinates of the centres of pointy top, axial hexagons, i.e (2q + r, -3r). It is the array version of ``HexagonGeometry.to_cartesian``.
+
+    Args:
+        coordinates (np.ndarray): (..., 2) array of axial coordinates
+
+    Returns:
+        np.ndarray: (..., 2) int64 array of the cartesian coordinates of the centres
+    """
+    return np.asarray(coordinates, dtype=np.int64) @ CARTESIAN.T
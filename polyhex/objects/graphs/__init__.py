@@ -1,4 +1,6 @@
 from .graphs_module import *
+from .hypergraphs import *
 
 __all__ = ()
-__all__ += graphs_module.__all__
\ No newline at end of file
+__all__ += graphs_module.__all__
+__all__ += hypergraphs.__all__
\ No newline at end of file
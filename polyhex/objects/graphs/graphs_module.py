@@ -6,14 +6,17 @@ Module that defines the abstract Graph class and different classes of Graphs tha
 # pylint: too-few-public-methods
 
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
 
-from polyhex.objects.hexagons import Hexagon
+from polyhex.objects.geometry import to_vertex_key, to_edge_key
+from polyhex.objects.hexagons import Hexagon, BorderHexagon
 from polyhex.objects.nodes import HexagonVertex
 from polyhex.objects.edges import HexagonEdge
 from polyhex.objects.polyhexes import Polyhex
 
 __all__ = (
+    "GraphChanges",
     "Graph",
     "HexagonGraph",
     "VertexGraph",
@@ -23,6 +26,52 @@ __all__ = (
 )
 
 
+@dataclass
+class GraphChanges:
+    """Changes of a graph since its last checkpoint.
+
+    Args:
+        added_nodes (Dict): the keys of the added nodes, in insertion order.
+        removed_nodes (Dict): the keys of the removed nodes, mapped to the index they had.
+        connected (Dict): the added connexions, as frozensets of the two keys, mapped to the (key, other_key) tuple.
+        disconnected (Dict): the removed connexions, as frozensets of the two keys, mapped to the (key, other_key) tuple.
+        reset (bool): whether the node indices were renumbered, by ``Graph.compact``. The other changes are then meaningless.
+
+    A node that is removed and added again in the same interval is both in `removed_nodes` and `added_nodes`: the removals are to be applied before the additions.
+    The changes that cancel out, such as a node added then removed, are not recorded.
+    """
+
+    added_nodes: Dict = field(default_factory=dict)
+    removed_nodes: Dict = field(default_factory=dict)
+    connected: Dict = field(default_factory=dict)
+    disconnected: Dict = field(default_factory=dict)
+    reset: bool = False
+
+    def __len__(self):
+        return len(self.added_nodes) + len(self.removed_nodes) + len(self.connected) + len(self.disconnected)
+
+    def _connect(self, key, other_key):
+        pair = frozenset((key, other_key))
+        if pair in self.disconnected and key not in self.added_nodes and other_key not in self.added_nodes:
+            # Reconnecting two nodes that were disconnected since the checkpoint
+            del self.disconnected[pair]
+        else:
+            self.connected[pair] = (key, other_key)
+
+    def _disconnect(self, key, other_key):
+        pair = frozenset((key, other_key))
+        if pair in self.connected:
+            del self.connected[pair]
+        else:
+            self.disconnected[pair] = (key, other_key)
+
+    def _remove_node(self, key, index: int):
+        if key in self.added_nodes:
+            del self.added_nodes[key]
+        else:
+            self.removed_nodes[key] = index
+
+
 class Graph(ABC):
     """
     Abstract Graph class
@@ -37,9 +86,16 @@ class Graph(ABC):
         By default, a graph has:
             name (str)     : name of the Graph
             n_nodes (int)  : number of nodes
-            nodes (dict)   : dictionnary with spatial coordinates as keys and objects (Hexagon, Edge...) as values. It refers to the nodes of the graph.
-            weights (dict) : dictionnary with spatial coordinates as keys and a list of objects (Hexagon, Edge...) as values. It refers to the connexions between the nodes of the graph
-            nodes (dict)   : the dictionnary with spatial coordinates as keys and integers as values. It refers to the indexing of each node in the graph
+            nodes (dict)   : dictionnary with spatial coordinates, or canonical integer ids for the vertex and edge graphs, as keys and objects (Hexagon, Edge...) as values. It refers to the nodes of the graph.
+            weights (dict) : dictionnary with spatial coordinates as keys and, as values, dictionnaries mapping the spatial coordinates of the neighbours to the neighbours (Hexagon, Edge...). It refers to the connexions between the nodes of the graph. The neighbours are kept in insertion order, so that the exports are reproducible.
+            node_to_index (dict)   : the dictionnary with spatial coordinates as keys and integers as values. It refers to the indexing of each node in the graph
+
+        The indices of removed nodes are recycled by the next added nodes, so that the indices of the live nodes never collide and stay below the number of indices ever handed out.
+        The ``compact`` method renumbers the indices from 0 to n_nodes-1, in the order of the `nodes` dictionnary.
+
+        Once ``track_changes`` is called, the nodes and connexions added and removed are recorded until the next ``checkpoint``.
+        The ``version`` counter changes with every mutation, so that the structures derived from a graph can tell when they are stale.
+        Indexing a graph, or testing if it contains a key, accepts the keys of the graph and the keys translated by ``to_key``, such as the spatial keys of the vertices and edges.
         """
         self.name = name
         self.n_nodes = 0
@@ -47,6 +103,18 @@ class Graph(ABC):
         self.nodes: Dict = {}
         self.weights: Dict = {}
         self.node_to_index: Dict = {}
+        # Index manager: the next never-used index and the free list of released indices
+        self._next_index = 0
+        self._free_indices: List[int] = []
+        # Whether the indices match the order of the `nodes` dict
+        self._ordered = True
+        # Dense array of the keys, and position of each key in it, for O(1) sampling
+        self._sample_keys: List = []
+        self._sample_positions: Dict = {}
+        # Changes since the last checkpoint, None when the changes are not tracked
+        self._changes: GraphChanges = None
+        # Number of mutations of the graph, see ``version``
+        self._version = 0
 
     @abstractmethod
     def append(self):
@@ -55,17 +123,220 @@ class Graph(ABC):
             "The `append` function is not implemented for the abstract `Graph` class"
         )
     
+    @staticmethod
+    def to_key(key):
+        """Translates a key into the key of the `nodes` dictionnary. The graphs keyed by spatial keys return it as is.
+
+        Args:
+            key: the key to translate
+
+        Returns:
+            The key of the `nodes` dictionnary
+        """
+        return key
+
+    def __getitem__(self, key):
+        return self.nodes[self.to_key(key)]
+
+    def __contains__(self, key) -> bool:
+        return self.to_key(key) in self.nodes
+
     def sample(self, random_generator):
-        return random_generator.choice(list(self.nodes.values()))
+        """Samples a node of the graph uniformly, in O(1)
+
+        Args:
+            random_generator (np.random.Generator): the random generator to draw from
+
+        Returns:
+            The sampled node (Hexagon, Edge...)
+        """
+        position = random_generator.integers(len(self._sample_keys))
+        return self.nodes[self._sample_keys[position]]
+
+    def track_changes(self):
+        """Starts recording the changes of the graph. It is a no-op if the changes are already recorded, so that the changes recorded so far are kept."""
+        if self._changes is None:
+            self._changes = GraphChanges()
+
+    def stop_tracking(self):
+        """Stops recording the changes of the graph, and drops the changes recorded so far"""
+        self._changes = None
+
+    @property
+    def version(self) -> int:
+        """Counter of the mutations of the graph. It is incremented whenever nodes or connexions are added or removed, or the indices are renumbered.
+
+        Unlike the number of nodes, it changes when a node is removed and another one added, or when only the connexions change.
+        """
+        return self._version
+
+    @property
+    def tracks_changes(self) -> bool:
+        """Whether the changes of the graph are recorded"""
+        return self._changes is not None
+
+    @property
+    def changes(self) -> GraphChanges:
+        """The changes recorded since the last checkpoint, None when the changes are not tracked.
+
+        Each ``checkpoint`` starts a new ``GraphChanges`` object: a consumer of the changes that shares the graph with others can tell, by identity, whether the changes were checkpointed by someone else since its own checkpoint.
+        """
+        return self._changes
+
+    @property
+    def index_capacity(self) -> int:
+        """The number of indices ever handed out: the node indices, live or recycled, are below it"""
+        return self._next_index
+
+    def checkpoint(self) -> GraphChanges:
+        """Returns the changes of the graph since the last checkpoint, and starts a new interval
+
+        Returns:
+            GraphChanges: the changes since the last checkpoint, or since ``track_changes`` was called
+        """
+        assert self._changes is not None, f"The changes of {self.name} are not tracked, please call `track_changes` first"
+        changes, self._changes = self._changes, GraphChanges()
+        return changes
+
+    def _allocate_index(self) -> int:
+        if self._free_indices:
+            return self._free_indices.pop()
+        index = self._next_index
+        self._next_index += 1
+        return index
+
+    @property
+    def is_compact(self) -> bool:
+        """Whether the node indices are 0 to n_nodes-1, in the order of the `nodes` dictionnary"""
+        return self._ordered
+
+    def compact(self):
+        """Renumbers the node indices from 0 to n_nodes-1, in the order of the `nodes` dictionnary.
+
+        It is a no-op if the graph is already compact.
+        """
+        if self._ordered:
+            return
+        self.node_to_index = {key: index for index, key in enumerate(self.nodes)}
+        self._next_index = self.n_nodes
+        self._free_indices = []
+        self._ordered = True
+        self._version += 1
+        if self._changes is not None:
+            self._changes.reset = True
+
+    def add_node(self, key, node):
+        """Adds a node, without any connexion, to the graph
+
+        Args:
+            key: spatial key of the node
+            node: the node (Hexagon, Edge...)
+        """
+        self.nodes[key] = node
+        self.weights[key] = {}
+        self.node_to_index[key] = self._allocate_index()
+        self._sample_positions[key] = len(self._sample_keys)
+        self._sample_keys.append(key)
+        self.n_nodes += 1
+        self._version += 1
+        if self._changes is not None:
+            self._changes.added_nodes[key] = None
+
+    def extend(self, keys: List, nodes: List, connexions):
+        """Adds nodes and their connexions to the graph in a single pass
+
+        Args:
+            keys (List): spatial keys of the nodes
+            nodes (List): the nodes (Hexagon, Edge...), in the order of the keys
+            connexions (Iterable[Tuple]): pairs of spatial keys of the nodes to connect
+        """
+        keys = list(keys)
+        if self._changes is not None:
+            for key, node in zip(keys, nodes):
+                self.add_node(key, node)
+            for key, other_key in connexions:
+                self.connect(key, other_key)
+            return
+        # Same bookkeeping as ``add_node`` and ``connect``, with one dictionnary update per attribute
+        n_sampled = len(self._sample_keys)
+        self.nodes.update(zip(keys, nodes))
+        self.weights.update((key, {}) for key in keys)
+        self.node_to_index.update((key, self._allocate_index()) for key in keys)
+        self._sample_positions.update(zip(keys, range(n_sampled, n_sampled + len(keys))))
+        self._sample_keys.extend(keys)
+        self.n_nodes += len(keys)
+        self._version += 1
+        all_nodes, weights = self.nodes, self.weights
+        for key, other_key in connexions:
+            weights[key][other_key] = all_nodes[other_key]
+            weights[other_key][key] = all_nodes[key]
+
+    def remove_node(self, key):
+        """Removes a node and all its connexions from the graph
+
+        Args:
+            key: spatial key of the node
+        """
+        self.nodes.pop(key)
+        index = self.node_to_index.pop(key)
+        self._free_indices.append(index)
+        self._ordered = False
+        # Swap-remove the key from the dense array of keys
+        position = self._sample_positions.pop(key)
+        last_key = self._sample_keys.pop()
+        if position < len(self._sample_keys):
+            self._sample_keys[position] = last_key
+            self._sample_positions[last_key] = position
+        for neighbour_key in self.weights.pop(key):
+            self.weights[neighbour_key].pop(key, None)
+            if self._changes is not None:
+                self._changes._disconnect(key, neighbour_key)
+        if self._changes is not None:
+            self._changes._remove_node(key, index)
+        self.n_nodes -= 1
+        self._version += 1
+
+    def connect(self, key, other_key):
+        """Connects two nodes of the graph, in both directions
+
+        Args:
+            key: spatial key of the first node
+            other_key: spatial key of the second node
+        """
+        if self._changes is not None and other_key not in self.weights[key]:
+            self._changes._connect(key, other_key)
+        self.weights[key][other_key] = self.nodes[other_key]
+        self.weights[other_key][key] = self.nodes[key]
+        self._version += 1
+
+    def disconnect(self, key, other_key):
+        """Removes the connexion between two nodes of the graph, if it exists
+
+        Args:
+            key: spatial key of the first node
+            other_key: spatial key of the second node
+        """
+        if other_key not in self.weights[key]:
+            return
+        if self._changes is not None:
+            self._changes._disconnect(key, other_key)
+        self.weights[key].pop(other_key)
+        self.weights[other_key].pop(key, None)
+        self._version += 1
 
 class VertexGraph(Graph):
     """
-    Graph of polyhex vertices
+    Graph of polyhex vertices, keyed by the canonical ids of the vertices (see ``polyhex.objects.geometry.vertex_key``)
     """
 
     def __init__(self, name="VertexGraph"):
         super().__init__(name)
 
+    @staticmethod
+    def to_key(key) -> int:
+        """Translates a vertex, or its (x, y) spatial key, into its id. Ids are returned as is."""
+        return to_vertex_key(key)
+
     def append(self, hexagon: Hexagon):
         """Append method of the VertexGraph
 
@@ -75,27 +346,28 @@ class VertexGraph(Graph):
         # Add the vertices to the list
         for vertex in hexagon.vertices_list:
             vertex: HexagonVertex
-            if vertex.spatial_key not in self.nodes:
-                self.nodes[vertex.spatial_key] = vertex
-                self.weights[vertex.spatial_key] = []
-                self.node_to_index[vertex.spatial_key] = self.n_nodes
-                self.n_nodes += 1
+            if vertex.key not in self.nodes:
+                self.add_node(vertex.key, vertex)
 
-                adjency = hexagon.get_vertex_adjency(vertex)
-                for coord in adjency:
-                    if coord in self.nodes:
-                        self.weights[vertex.spatial_key].append(self.nodes[coord])
-                        self.weights[coord].append(self.nodes[vertex.spatial_key])
+                adjency = hexagon.get_vertex_adjency_keys(vertex)
+                for key in adjency:
+                    if key in self.nodes:
+                        self.connect(vertex.key, key)
 
 
 class EdgeGraph(Graph):
     """
-    Graph of polyhex edges
+    Graph of polyhex edges, keyed by the canonical ids of the edges (see ``polyhex.objects.geometry.edge_key``)
     """
 
     def __init__(self, name="EdgeGraph"):
         super().__init__(name)
 
+    @staticmethod
+    def to_key(key) -> int:
+        """Translates an edge, or its frozenset spatial key, into its id. Ids are returned as is."""
+        return to_edge_key(key)
+
     def append(self, hexagon: Hexagon):
         """Append method of the EdgeGraph
 
@@ -105,17 +377,13 @@ class EdgeGraph(Graph):
         # Add the edges to the list
         for edge in hexagon.edges_list:
             edge: HexagonEdge
-            if edge.spatial_key not in self.nodes:
-                self.nodes[edge.spatial_key] = edge
-                self.weights[edge.spatial_key] = []
-                self.node_to_index[edge.spatial_key] = self.n_nodes
-                self.n_nodes += 1
+            if edge.key not in self.nodes:
+                self.add_node(edge.key, edge)
 
-                adjency = hexagon.get_edge_adjency(edge)
-                for coord in adjency:
-                    if coord in self.nodes:
-                        self.weights[edge.spatial_key].append(self.nodes[coord])
-                        self.weights[coord].append(self.nodes[edge.spatial_key])
+                adjency = hexagon.get_edge_adjency_keys(edge)
+                for key in adjency:
+                    if key in self.nodes:
+                        self.connect(edge.key, key)
 
 
 class HexagonGraph(Graph):
@@ -135,25 +403,26 @@ class HexagonGraph(Graph):
         coord = hexagon.spatial_key
         if coord in self.nodes:
             raise RuntimeError(f'There is already an hexagon at coordinates {coord}, the hexagons of a polyhex cannot overlap')
-        self.nodes[coord] = hexagon
-        self.node_to_index[coord] = self.n_nodes
-        self.weights[coord] = []
-        self.n_nodes += 1
+        self.add_node(coord, hexagon)
         # Make add all the connections from the new hex to the existing ones
         for adj in hexagon.adjency:
             if adj in self.nodes:
-                self.weights[coord].append(self.nodes[adj])
-                self.weights[adj].append(self.nodes[coord])
+                self.connect(coord, adj)
 
 
 class EdgeBorderGraph(Graph):
     """
-    Graph of polyhex edges border
+    Graph of polyhex edges border, keyed by the canonical ids of the edges (see ``polyhex.objects.geometry.edge_key``)
     """
 
     def __init__(self, name="EdgeBorderGraph"):
         super().__init__(name)
 
+    @staticmethod
+    def to_key(key) -> int:
+        """Translates an edge, or its frozenset spatial key, into its id. Ids are returned as is."""
+        return to_edge_key(key)
+
     def append(self, hexagon: Hexagon):
         """Append method of the EdgeBorderGraph.
         The border of a polyhex can be defined by its Edges of by its Hexagons. For Polyhex with varying edge features, it is important to know what edges are on the border
@@ -163,7 +432,7 @@ class EdgeBorderGraph(Graph):
         """
         for edge in hexagon.edges_list:
             edge: HexagonEdge
-            if edge.spatial_key in self.nodes:
+            if edge.key in self.nodes:
                 self.remove(hexagon, edge)
             else:
                 self.add(hexagon, edge)
@@ -175,17 +444,12 @@ class EdgeBorderGraph(Graph):
             hexagon (Hexagon): Hexagon to append to the border
             edge (HexagonEdge): Edge considered
         """
-        self.nodes[edge.spatial_key] = edge
-        self.node_to_index[edge.spatial_key] = self.n_nodes
-        self.weights[edge.spatial_key] = []
+        self.add_node(edge.key, edge)
         # Adding the edge to the weight dictionnary
-        adjency = hexagon.get_edge_adjency(edge)
-        for coord in adjency:
-            if coord in self.nodes:
-                self.weights[edge.spatial_key].append(self.nodes[coord])
-                self.weights[coord].append(self.nodes[edge.spatial_key])
-        # Updating the number of nodes
-        self.n_nodes += 1
+        adjency = hexagon.get_edge_adjency_keys(edge)
+        for key in adjency:
+            if key in self.nodes:
+                self.connect(edge.key, key)
 
     def remove(self, hexagon: Hexagon, edge: HexagonEdge):
         """Internal helper function to clarify the append code
@@ -194,16 +458,8 @@ class EdgeBorderGraph(Graph):
             hexagon (Hexagon): Hexagon to append to the border
             edge (HexagonEdge): Edge considered
         """
-        self.nodes.pop(edge.spatial_key)
-        self.node_to_index.pop(edge.spatial_key)
-        # Removing the edge from the weight dictionnary
-        self.weights.pop(edge.spatial_key)
-        adjency = hexagon.get_edge_adjency(edge)
-        for coord in adjency:
-            if coord in self.nodes and edge in self.weights[coord]:
-                self.weights[coord].remove(edge)
-        # Updating the number of nodes
-        self.n_nodes -= 1
+        # Removing the edge and its connexions from the weight dictionnary
+        self.remove_node(edge.key)
 
 
 class HexagonBorderGraph(Graph):
@@ -218,7 +474,7 @@ class HexagonBorderGraph(Graph):
         """Append method of the EdgeBorderGraph.
         The border of a polyhex can be defined by its Edges of by its Hexagons. When considering the Hexagon border, it is important to consider the following:
             1. the hexagon border is defined only against a hexagon graph
-            2. the hexagon border is made of placeholder hexagons, that look like the ones the polyhex would expect. This is why a `polyhex` object is required.
+            2. the hexagon border is made of ``BorderHexagon`` objects, that only create the placeholder hexagon the polyhex would expect when it is needed. This is why a `polyhex` object is required.
 
         Args:
             hexagon (Hexagon): The hexagon to append to the border.
@@ -229,18 +485,12 @@ class HexagonBorderGraph(Graph):
             for adj in hexagon.adjency:
                 self.add(polyhex, adj, hexagon_graph)
         else:
-            # 1. Remove the hex from the border
+            # 1. Remove the hex, and its connexions, from the border
             assert hexagon.spatial_key in self.nodes
-            self.nodes.pop(hexagon.spatial_key)
-            self.weights.pop(hexagon.spatial_key)
-            self.n_nodes -= 1
+            self.remove_node(hexagon.spatial_key)
+            # 2. Append the border
             for adj in hexagon.adjency:
-                phantom = polyhex.placeholder_hex(hex_coord=hexagon.spatial_key)
-                if adj in self.nodes:
-                    if phantom in self.weights[adj]:
-                        self.weights[adj].remove(phantom)
-                # 2. Append the border
-                else:
+                if adj not in self.nodes:
                     self.add(polyhex, adj, hexagon_graph)
 
     def add(self, polyhex: Polyhex, adj: Tuple[int], hexagon_graph: HexagonGraph):
@@ -251,16 +501,9 @@ class HexagonBorderGraph(Graph):
             adj (Tuple[int]): One of the adjency coordinate of the considered hexagon
             hexagon_graph (HexagonGraph): the hexagon graph representing the polyhex. The border cannot be defined without the HexagonGraph.
         """
-        border_hex = polyhex.placeholder_hex(hex_coord=adj)
         if adj not in hexagon_graph.nodes:
-            self.nodes[adj] = border_hex
-            self.weights[adj] = []
-            for phantom_adj in self.nodes[adj].adjency:
+            border_hex = BorderHexagon(adj, polyhex)
+            self.add_node(adj, border_hex)
+            for phantom_adj in border_hex.adjency:
                 if phantom_adj in self.nodes:
-                    self.weights[adj].append(
-                        polyhex.placeholder_hex(hex_coord=phantom_adj)
-                    )
-                    self.weights[phantom_adj].append(border_hex)
-
-            self.node_to_index[adj] = self.n_nodes
-            self.n_nodes += 1
+                    self.connect(adj, phantom_adj)
@@ -0,0 +1,130 @@
+"""
+Module that defines the LazyHypergraph, a hypergraph whose graphs are built on demand
+"""
+# pylint: disable=line-too-long
+
+from collections.abc import Mapping
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from polyhex.objects.builders import BulkBuilder
+from polyhex.objects.hexagons import Hexagon, BorderHexagon
+from polyhex.objects.graphs import graphs_module
+
+__all__ = ("LazyHypergraph",)
+
+GRAPH_NAMES: Tuple[str] = (
+    "HexagonGraph",
+    "HexagonBorderGraph",
+    "VertexGraph",
+    "EdgeGraph",
+    "EdgeBorderGraph",
+)
+
+
+class LazyHypergraph(Mapping):
+    """
+    Hypergraph that only records the cells of its polyhex.
+
+    It can be passed to the ``Polyhex`` creation methods and to ``Polyhex.append_hex`` in place of the usual dict of graphs.
+    The eager graphs are recorded as the hexagons are appended, as in a dict of graphs. The other graphs are built the first time they are read, in a single bulk pass over the cells, and cached until the next hexagon is appended.
+
+    Args:
+        graphs (Tuple[str], optional): the names of the graphs of the hypergraph, from ``polyhex.objects.graphs``. Defaults to all the graphs.
+        eager (Tuple[str], optional): the names of the graphs recorded as the hexagons are appended. Defaults to ("HexagonGraph",). The ``HexagonBorderGraph`` should be eager when the polyhex is created with ``Polyhex.create_from_number``, which samples it at every step.
+    """
+
+    def __init__(self, graphs: Tuple[str] = GRAPH_NAMES, eager: Tuple[str] = ("HexagonGraph",)):
+        for name in graphs:
+            assert hasattr(graphs_module, name), f"There is no graph named {name} in polyhex.objects.graphs"
+        for name in eager:
+            assert name in graphs, f"The eager graph {name} is not one of the graphs {graphs}"
+        if "HexagonBorderGraph" in eager:
+            assert "HexagonGraph" in eager, "The HexagonBorderGraph can only be eager if the HexagonGraph is eager too"
+        self.graph_names = tuple(graphs)
+        # The eager graphs, in the order of `graphs`, so that the HexagonGraph is appended to before the HexagonBorderGraph
+        self.eager: Dict = {
+            name: getattr(graphs_module, name)() for name in self.graph_names if name in eager
+        }
+        self.polyhex = None
+        # The cells of the polyhex, by coordinates, in the order in which they were appended
+        self.cells: Dict[Tuple[int], Hexagon] = {}
+        self._cache: Dict = {}
+
+    ######### Recording #########
+    def _record(self, hexagon: Hexagon):
+        coord = hexagon.spatial_key
+        if coord in self.cells:
+            raise RuntimeError(f'There is already an hexagon at coordinates {coord}, the hexagons of a polyhex cannot overlap')
+        self.cells[coord] = hexagon
+
+    def append(self, hexagon: Hexagon, polyhex):
+        """Appends a hexagon to the cells and to the eager graphs, and invalidates the other graphs
+
+        Args:
+            hexagon (Hexagon | BorderHexagon): The hexagon to append. A ``BorderHexagon`` is replaced by its full placeholder hexagon.
+            polyhex (Polyhex): the polyhex the hexagon is appended to
+        """
+        if isinstance(hexagon, BorderHexagon):
+            hexagon = hexagon.hexagon
+        self.polyhex = polyhex
+        self._record(hexagon)
+        polyhex.append_hex(hexagon, self.eager)
+        self._cache.clear()
+
+    def extend(self, hexagons: List[Hexagon], polyhex):
+        """Appends hexagons to the cells and to the eager graphs, and invalidates the other graphs.
+        When the hypergraph is empty, the eager graphs are filled in a single bulk pass.
+
+        Args:
+            hexagons (List[Hexagon]): The hexagons to append
+            polyhex (Polyhex): the polyhex the hexagons are appended to
+        """
+        if self.cells:
+            for hexagon in hexagons:
+                self.append(hexagon, polyhex)
+            return
+        self.polyhex = polyhex
+        coordinates = np.array([hexagon.hex_coord for hexagon in hexagons]).reshape(-1, 2)
+        BulkBuilder(polyhex).build(coordinates, self.eager, hexagons)
+        for hexagon in hexagons:
+            self._record(hexagon)
+        self._cache.clear()
+
+    def invalidate(self):
+        """Drops the cached graphs, which are rebuilt the next time they are read"""
+        self._cache.clear()
+
+    def is_built(self, name: str) -> bool:
+        """Whether the graph is up to date, i.e. if it is eager or cached"""
+        return name in self.eager or name in self._cache
+
+    ######### Mapping #########
+    def __getitem__(self, name: str):
+        if name in self.eager:
+            return self.eager[name]
+        if name not in self.graph_names:
+            raise KeyError(name)
+        if name not in self._cache:
+            graph = getattr(graphs_module, name)()
+            if self.cells:
+                hexagons = list(self.cells.values())
+                coordinates = np.array(list(self.cells)).reshape(-1, 2)
+                BulkBuilder(self.polyhex).build(coordinates, {name: graph}, hexagons)
+            self._cache[name] = graph
+        return self._cache[name]
+
+    def __contains__(self, name) -> bool:
+        # Does not build the graph
+        return name in self.graph_names
+
+    def __iter__(self):
+        return iter(self.graph_names)
+
+    def __len__(self):
+        return len(self.graph_names)
+
+    def __repr__(self):
+        built = [name for name in self.graph_names if self.is_built(name)]
+        return f"LazyHypergraph(graphs={self.graph_names}, built={built}, n_cells={len(self.cells)})"
@@ -8,39 +8,47 @@
 
 from typing import List, Dict, Tuple
 import math
+from functools import cache
 from dataclasses import dataclass, field
 
 from numpy.typing import ArrayLike
-import matplotlib.pyplot as plt
-from scipy.spatial import distance
 
 from polyhex.assets import loaders
-from polyhex.utilities import replicate_vector
+from polyhex.utilities import replicate_vector, pack_coordinates
 from polyhex.objects.decorators import (
     hex_coord_system_dependent,
     top_dependent,
-    vertex_orientation_dependent,
 )
+from polyhex.objects.geometry import HexagonGeometry, get_geometry
+from polyhex.objects.distances import hexagon_distance
 
-__all__ = ("Hexagon",)
+__all__ = ("Hexagon", "BorderHexagon")
 
-# Pointy top, axial ordering blablabla
-ADJENCY_TO_ROTATIONS_FUNCTIONS = {
-    # Edge index : N rotations of the neighbour hexagon to math edges.
-    # Example: consider a hexagon at (q,r) with a pointy top and clockwise vertex ordering and its first neighbour, at position (q+1, r-1). In order to match the first edge of (q,r) to the first edge of (q+1, r-1), the latter has to be rotated 3 times
-    0: [3, 2, 1, 0, 5, 4],
-    1: [4, 3, 2, 1, 0, 5],
-    2: [5, 4, 3, 2, 1, 0],
-    3: [0, 5, 4, 3, 2, 1],
-    4: [1, 0, 5, 4, 3, 2],
-    5: [2, 1, 0, 5, 4, 3],
-}
+# Small integer id of each (hex_coord_system, top, radius, vertex_orientation) layout met so far
+_LAYOUT_KEYS: Dict[Tuple, int] = {}
+# The packed axial coordinates take the 62 lower bits of the hexagon keys
+_LAYOUT_SHIFT = 62
 
 
-@dataclass
+def _layout_key(hex_coord_system: str, top: str, radius: int | float, vertex_orientation: str) -> int:
+    """Returns the id of a layout, allocated the first time the layout is met"""
+    return _LAYOUT_KEYS.setdefault((hex_coord_system, top, radius, vertex_orientation), len(_LAYOUT_KEYS))
+
+
+@cache
+def _node_classes() -> Tuple[type]:
+    """Returns the ``HexagonCentre``, ``HexagonVertex`` and ``HexagonEdge`` classes, imported on first use to avoid a circular import"""
+    from polyhex.objects.nodes import HexagonCentre, HexagonVertex
+    from polyhex.objects.edges import HexagonEdge
+
+    return HexagonCentre, HexagonVertex, HexagonEdge
+
+
+@dataclass(slots=True)
 class Hexagon:
     """Base class for creating a Hexagon.
     See https://www.redblobgames.com/grids/hexagons/ for a great explanation
+    The centre, vertices and edges of the hexagon are created on first access, so that a hexagon only used through its coordinates stays cheap.
 
     Arguments:
         hex_coord_system (str) : The hexagonal coordinate system. It can be `offset`, `cube`, `axial` or `doubled`Defaults to `axial`.
@@ -48,7 +56,7 @@ class Hexagon:
         top (str) : The top of the hexagon. Can only be `pointy` of `flat`. Defaults to `pointy`.
         radius (int|float) : The radius' value. For PolyHex, the `radius` refers to the radius of the circle to which all the hexagon's vertices belong.Defaults to `1`.
         vertex_orientation (str) : The vertex orientation. It is can be `clockwise` or `couterclockwise`. Important note: For hexagons with `pointy` top, We start counting the vertices by starting with the one at 12.00. For hexagons with `flat` top, We start counting the vertices by starting with the one at 3.00 Defaults to `clockwise`.
-        assets (Dict) : A big dictionnary holding all the information about rendering, token compatibility, etc, etc. Defaults to the defaults_assets.json file.
+        assets (Dict) : A big dictionnary holding all the information about rendering, token compatibility, etc, etc. It is converted to a read-only ``AssetTable``, pass the same ``AssetTable`` to several hexagons to share it. Defaults to the shared table of the defaults_assets.json file.
         hexagon_feature   (ArrayLike) : The feature of the hexagon as an entity. Defaults to 0.
         vertex_feature (ArrayLike) : The feature of the vertices Note: there is a bit of a misnomer here. There are 6 vertices per hexagon, so the attribute name should be 'vertices_feature' and an ArrayLike of size 6 should be the default. For ease of use, we deliberately offer to define all the vertices' feature by providing a single default argument, replicated accross all edges. However, if an ArrayLike is provided, the features will be allocated in the order defined by `vertex_orientation`. It also MUST be hashable by a `frozenset`. Defaults to 0.
         edge_feature   (ArrayLike) : The feature of the edges Note: there is a bit of a misnomer here. There are 6 edges per hexagon, so the attribute name should be 'edges_feature' and an ArrayLike of size 6 should be the default. For ease of use, we deliberately offer to define all the edges' feature by providing a single default argument, replicated accross all edges. However, if an ArrayLike is provided, the features will be allocated in the order defined by `vertex_orientation`. It also MUST be hashable by a `frozenset`. Defaults to 0.
@@ -60,30 +68,42 @@ class Hexagon:
     radius: int | float = 1
     vertex_orientation: str = "clockwise"
     assets: Dict = field(
-        default_factory=lambda: loaders.load_assets("default_assets.json")
+        default_factory=lambda: loaders.get_assets("default_assets.json")
     )
     hexagon_feature: ArrayLike = "placeholder"
     vertex_feature: ArrayLike = "placeholder"
     edge_feature: ArrayLike = "placeholder"
+    # Attributes set in __post_init__. Hexagons are slotted: the dimensions, the spatial key and the vertices and edges dictionnaries are derived on access.
+    geometry: HexagonGeometry = field(init=False, repr=False)
+    q: int = field(init=False, repr=False)
+    r: int = field(init=False, repr=False)
+    s: int = field(init=False, repr=False)
+    x: int = field(init=False, repr=False)
+    y: int = field(init=False, repr=False)
+    layout_key: int = field(init=False, repr=False)
+    key: int = field(init=False, repr=False)
+    _centre: object = field(init=False, repr=False)
+    _vertices: List = field(init=False, repr=False)
+    _edges: List = field(init=False, repr=False)
 
     def __post_init__(self):
         # Attributes' sanity check
         self._check_attributes()
-        # Computation of the useful dimensions of the hexagon, its width and height, based on its `top` and `radius`.
-        self._compute_dimensions()
+        # Shared offsets tables of the hexagon's layout
+        self.geometry = get_geometry(
+            self.hex_coord_system, self.top, self.vertex_orientation
+        )
         # Get the centre coordinate on the cartesian grid
         self._hex_coord_to_cartesian()
-        # Create centre node
-        # Lazy imports to avoir Circular Import Error
-        from polyhex.objects.nodes import HexagonCentre
-
-        self.centre = HexagonCentre(self, self.hexagon_feature)
-        # Create vertices
-        self._create_vertices()
-        # Create edges
-        self._create_edges()
-        # Allocate spatial_key, an alias of hex_coord for Hexagons
-        self.spatial_key = self.hex_coord
+        # The features are checked now, but the centre, vertices and edges are only created on first access, see ``centre``, ``vertex`` and ``edge``
+        self._parse_feature(self.vertex_feature)
+        self._parse_feature(self.edge_feature)
+        self._centre = None
+        self._vertices = [None] * 6
+        self._edges = [None] * 6
+        # Integer keys used for the equality and the hashing: the id of the layout, and the layout id followed by the packed axial coordinates, i.e the key of the centre
+        self.layout_key = _layout_key(self.hex_coord_system, self.top, self.radius, self.vertex_orientation)
+        self.key = (self.layout_key << _LAYOUT_SHIFT) | pack_coordinates(int(self.q), int(self.r))
 
     ######### Checking the variables passed to the class constructor #########
     ######### Called in the __post_init__ method #########
@@ -124,34 +144,10 @@ class Hexagon:
     ):
         assert "render" in self.assets, "Please provide a `render` dict"
         assert "compatibility" in self.assets, "Please provide a `compatibility` dict"
+        self.assets = loaders.as_asset_table(self.assets)
 
-    @top_dependent
-    def _compute_dimensions(self):
-        if self.top == "pointy":
-            self.height = 2 * self.radius
-            self.width = math.sqrt(3) * self.radius
-            self.min_h = self.radius / 2
-            self.min_w = self.width
-
-    @hex_coord_system_dependent
-    @top_dependent
     def _hex_coord_to_cartesian(self):
-        if self.hex_coord_system == "axial" and self.top == "pointy":
-            self.x = 2 * self.q + self.r
-            self.y = -3 * self.r
-
-    @top_dependent
-    @vertex_orientation_dependent
-    def _vertex_coord_factory(self):
-        if self.top == "pointy" and self.vertex_orientation == "clockwise":
-            return [
-                (self.x, self.y + 2),
-                (self.x + 1, self.y + 1),
-                (self.x + 1, self.y - 1),
-                (self.x, self.y - 2),
-                (self.x - 1, self.y - 1),
-                (self.x - 1, self.y + 1),
-            ]
+        self.x, self.y = self.geometry.to_cartesian(self.q, self.r)
 
     @staticmethod
     def _parse_feature(feature):
@@ -172,69 +168,137 @@ class Hexagon:
             )
         return feature
 
-    def _create_vertices(self):
-        # Lazy import
-        from polyhex.objects.nodes import HexagonVertex
-
-        vertex_features = self._parse_feature(self.vertex_feature)
-        self.vertices_list = []
-        self.vertices_dict = {}
-        for index, feature in enumerate(vertex_features):
-            vertex = HexagonVertex(self, index, feature)
-            self.vertices_dict[vertex.spatial_key] = vertex
-            self.vertices_list.append(vertex)
-
-    def _create_edges(self):
-        edge_features = self._parse_feature(self.edge_feature)
-        self.edges_list = []
-        self.edges_dict = {}
-        self.edges_to_rotations = {}
-        from polyhex.objects.edges import HexagonEdge
-
-        for index, feature in enumerate(edge_features):
-            edge = HexagonEdge(
+    @staticmethod
+    def _feature_at(feature, index: int):
+        # The feature of the node `index`, for a feature already checked by ``_parse_feature``
+        if isinstance(feature, (tuple, list)):
+            return feature[0] if len(feature) == 1 else feature[index]
+        return feature
+
+    def vertex(self, index: int):
+        """Returns the vertex of the given index, created on first access
+
+        Args:
+            index (int): the index of the vertex, in the order defined by `vertex_orientation`
+
+        Returns:
+            HexagonVertex: the vertex
+        """
+        vertex = self._vertices[index]
+        if vertex is None:
+            vertex = _node_classes()[1](self, index, self._feature_at(self.vertex_feature, index))
+            self._vertices[index] = vertex
+        return vertex
+
+    def edge(self, index: int):
+        """Returns the edge of the given index, created on first access with its two vertices
+
+        Args:
+            index (int): the index of the edge, in the order defined by `vertex_orientation`
+
+        Returns:
+            HexagonEdge: the edge from the vertex `index` to the next one
+        """
+        edge = self._edges[index]
+        if edge is None:
+            edge = _node_classes()[2](
                 self,
-                self.vertices_list[index],
-                self.vertices_list[(index + 1) % 6],
+                self.vertex(index),
+                self.vertex((index + 1) % 6),
                 index,
-                feature,
+                self._feature_at(self.edge_feature, index),
             )
-            self.edges_dict[edge.spatial_key] = edge
-            self.edges_list.append(edge)
-            self.edges_to_rotations[edge.spatial_key] = ADJENCY_TO_ROTATIONS_FUNCTIONS[
-                index
-            ]
+            self._edges[index] = edge
+        return edge
 
     ######### Properties #########
     @property
-    def adjency(self) -> List[Tuple[int]]:
-        """Get a hexagon adjency, i.e the coordinates of neighbouring hexagons.
+    def spatial_key(self) -> Tuple[int]:
+        """The spatial key of the hexagon, an alias of its `hex_coord`"""
+        return self.hex_coord
 
-        Raises:
-            NotImplementedError: is only implemented for the `axial` coordinates system.
-            NotImplementedError: is only implemented for the `clockwise` vertex ordering.
+    @property
+    @top_dependent
+    def height(self) -> int | float:
+        """The height of the hexagon, from its top vertex to its bottom vertex"""
+        return 2 * self.radius
+
+    @property
+    @top_dependent
+    def width(self) -> float:
+        """The width of the hexagon, between two opposite edges"""
+        return math.sqrt(3) * self.radius
+
+    @property
+    @top_dependent
+    def min_h(self) -> float:
+        """Half of the length of an edge"""
+        return self.radius / 2
+
+    @property
+    @top_dependent
+    def min_w(self) -> float:
+        """The width of the hexagon"""
+        return self.width
+
+    @property
+    def centre(self):
+        """The centre node of the hexagon, created on first access
 
         Returns:
-            List[Tuple[int]] : [(coord_hex_0), ..., (coord_hex_5)]
+            HexagonCentre: the centre
         """
-        if self.hex_coord_system == "axial":
-            if self.vertex_orientation == "clockwise":
-                return [
-                    (self.q + 1, self.r - 1),
-                    (self.q + 1, self.r),
-                    (self.q, self.r + 1),
-                    (self.q - 1, self.r + 1),
-                    (self.q - 1, self.r),
-                    (self.q, self.r - 1),
-                ]
+        if self._centre is None:
+            self._centre = _node_classes()[0](self, self.hexagon_feature)
+        return self._centre
 
-            raise NotImplementedError(
-                f"The `adjency` attribute is not implemented for {self.vertex_orientation}. Please use `clockwise` orientation instead."
-            )
+    @property
+    def vertices_list(self) -> List:
+        """The 6 vertices of the hexagon, in the order defined by `vertex_orientation`
 
-        raise NotImplementedError(
-            f"The `adjency` attribute is not implemented for {self.hex_coord_system}. Please use `axial` coordinate system instead."
-        )
+        Returns:
+            List[HexagonVertex]: the vertices
+        """
+        if not all(self._vertices):
+            for index in range(6):
+                self.vertex(index)
+        return self._vertices
+
+    @property
+    def edges_list(self) -> List:
+        """The 6 edges of the hexagon, the edge `index` going from the vertex `index` to the next one
+
+        Returns:
+            List[HexagonEdge]: the edges
+        """
+        if not all(self._edges):
+            for index in range(6):
+                self.edge(index)
+        return self._edges
+
+    @property
+    def vertices_dict(self) -> Dict:
+        """The vertices of the hexagon, keyed by their spatial keys"""
+        return {vertex.spatial_key: vertex for vertex in self.vertices_list}
+
+    @property
+    def edges_dict(self) -> Dict:
+        """The edges of the hexagon, keyed by their spatial keys"""
+        return {edge.spatial_key: edge for edge in self.edges_list}
+
+    @property
+    def edges_to_rotations(self) -> Dict:
+        """The rotation of each edge of the hexagon, keyed by the spatial keys of the edges"""
+        return {edge.spatial_key: self.geometry.edge_rotations[edge.index] for edge in self.edges_list}
+
+    @property
+    def adjency(self) -> List[Tuple[int]]:
+        """Get a hexagon adjency, i.e the coordinates of neighbouring hexagons.
+
+        Returns:
+            List[Tuple[int]] : [(coord_hex_0), ..., (coord_hex_5)]
+        """
+        return self.geometry.neighbours(self.q, self.r)
 
     @property
     def encoding(self):
@@ -275,16 +339,9 @@ class Hexagon:
         Returns:
             bool: Boolean result of the compatibility assessment
         """
-        return (
-            isinstance(other, Hexagon)
-            and self.hex_coord_system == other.hex_coord_system
-            and self.radius == other.radius
-            and self.top == other.top
-            and self.vertex_orientation == other.vertex_orientation
-        )
+        # The layout keys are equal if and only if the hex_coord_system, radius, top and vertex_orientation are
+        return isinstance(other, Hexagon) and self.layout_key == other.layout_key
 
-    @top_dependent
-    @vertex_orientation_dependent
     def get_vertex_adjency(self, vertex):
         """Method to get the vertex adjency, i.e the neighbouring vertices, in and outside of the ``Hexagon``
 
@@ -294,17 +351,8 @@ class Hexagon:
         Returns:
             List[Tuple[int]]: length-3 size adjency coordinates
         """
-        if self.vertex_orientation == "clockwise" and self.top == "pointy":
-            x, y = (
-                self.vertices_list[vertex.index].x,
-                self.vertices_list[vertex.index].y,
-            )
-            if vertex.index % 2 == 0:
-                adj = [(x, y + 2), (x + 1, y - 1), (x - 1, y - 1)]
-            else:
-                adj = [(x + 1, y + 1), (x, y - 2), (x - 1, y + 1)]
-        assert len(adj) == 3
-        return adj
+        vertex = self.vertices_list[vertex.index]
+        return self.geometry.vertex_adjency(vertex.x, vertex.y, vertex.index)
 
     def get_edge_adjency(self, edge):
         """Method to get the edge adjency, i.e the neighbouring edges, in and outside of the ``Hexagon``
@@ -313,20 +361,32 @@ class Hexagon:
             vertex (HexagonEdge): edge to get the adjency of.
 
         Returns:
-            List[Tuple[int]]: length-4 size adjency coordinates
+            List[frozenset]: length-4 size adjency spatial keys
         """
-        # 1 We get the edge's index and define the adjency list
-        edge = self.edges_list[edge.index]
-        adj = []
-        # We iterate on the
-        for root in [edge.start, edge.end]:
-            adjency = self.get_vertex_adjency(root)
-            for coord in adjency:
-                candidate_key = frozenset((root.spatial_key, coord))
-                if candidate_key != edge.spatial_key:
-                    adj.append(candidate_key)
-        assert len(adj) == 4
-        return adj
+        return self.geometry.edge_adjency(self.x, self.y, edge.index)
+
+    def get_vertex_adjency_keys(self, vertex) -> List[int]:
+        """Method to get the ids of the neighbouring vertices, in and outside of the ``Hexagon``, see ``polyhex.objects.geometry.vertex_key``
+
+        Args:
+            vertex (HexagonVertex): vertex to get the adjency of.
+
+        Returns:
+            List[int]: length-3 size adjency ids
+        """
+        vertex = self.vertices_list[vertex.index]
+        return self.geometry.vertex_adjency_keys(vertex.x, vertex.y, vertex.index)
+
+    def get_edge_adjency_keys(self, edge) -> List[int]:
+        """Method to get the ids of the neighbouring edges, in and outside of the ``Hexagon``, see ``polyhex.objects.geometry.edge_key``
+
+        Args:
+            edge (HexagonEdge): edge to get the adjency of.
+
+        Returns:
+            List[int]: length-4 size adjency ids
+        """
+        return self.geometry.edge_adjency_keys(self.x, self.y, edge.index)
 
     def render(self, axes):
         """Method to render a hexagon.
@@ -347,6 +407,9 @@ class Hexagon:
         Args:
             buffer_object: savepath or buffer for image saving
         """
+        # matplotlib is an optional dependency, only imported for rendering
+        import matplotlib.pyplot as plt
+
         fig = plt.figure()
         axes = fig.gca()
         axes.axis("off")
@@ -360,27 +423,184 @@ class Hexagon:
 
         Args:
             other (_type_): other ``Hexagon``
-            kwd (str, optional): Identifier of the distance. Defaults to "euclidian".
+            kwd (str, optional): Identifier of the distance: `euclidian` between the hex coordinates, `hex` for the number of steps between the hexagons, or `display` between their centres in display space, see ``polyhex.objects.distances``. Defaults to "euclidian".
 
         Raises:
-            NotImplementedError: This method is currently only implemented for the `euclidian` distance.
+            NotImplementedError: The distance is not implemented for this keyword.
 
         Returns:
-            np.ndarray: float distance value
+            int | float: distance value
         """
         assert isinstance(other, Hexagon)
-        if kwd == "euclidian":
-            return distance.euclidean(self.spatial_key, other.spatial_key)
-        raise NotImplementedError(
-            f"The distance method is only implemented for the `euclidian` distance. Got {kwd}"
-        )
+        return hexagon_distance(self.spatial_key, other.spatial_key, kwd, self.radius)
+
+    ######### Dunder methods #########
+    def __str__(self):
+        return f"{self.hex_coord} \n"
+
+    def __eq__(self, other):
+        # Same layout and same centre. A border hexagon shares the key of the placeholder hexagon at its coordinates.
+        return isinstance(other, (Hexagon, BorderHexagon)) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __getstate__(self):
+        # Hexagons are slotted: the state is the dict of the attributes that are set
+        return {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+
+    def __setstate__(self, state):
+        # The layout ids are allocated per process: they are reallocated when unpickling
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.layout_key = _layout_key(self.hex_coord_system, self.top, self.radius, self.vertex_orientation)
+        self.key = (self.layout_key << _LAYOUT_SHIFT) | pack_coordinates(int(self.q), int(self.r))
+
+
+class BorderHexagon:
+    """Lightweight hexagon on the border of a polyhex.
+
+    It only stores its hex coordinates and a reference to the polyhex it borders: all the other layout attributes (``top``, ``radius``...) are read from the polyhex.
+    The full placeholder ``Hexagon`` is only created when an attribute that requires it, such as ``vertices_list`` or ``edges_list``, is read. It is then cached, so that tokens added to it are kept.
+    A border hexagon compares and hashes as any ``Hexagon`` with the same layout and coordinates, e.g the hexagon later appended at its place.
+
+    Args:
+        hex_coord (Tuple[int]) : The coordinates of the border hexagon.
+        polyhex (Polyhex) : The polyhex the hexagon borders.
+    """
+
+    __slots__ = ("hex_coord", "polyhex", "key", "_hexagon")
+
+    def __init__(self, hex_coord: Tuple[int], polyhex):
+        self.hex_coord = hex_coord
+        self.polyhex = polyhex
+        self._hexagon = None
+        self.key = self._key()
+
+    def _key(self) -> int:
+        # The key of the ``Hexagon`` at the same coordinates, in the layout of the polyhex
+        layout_key = _layout_key(self.polyhex.hex_coord_system, self.polyhex.top, self.polyhex.radius, self.polyhex.vertex_orientation)
+        return (layout_key << _LAYOUT_SHIFT) | pack_coordinates(int(self.hex_coord[0]), int(self.hex_coord[1]))
+
+    ######### Properties #########
+    @property
+    def spatial_key(self) -> Tuple[int]:
+        """The spatial key of the border hexagon, an alias of its `hex_coord`"""
+        return self.hex_coord
+
+    @property
+    def q(self) -> int:
+        """The first hex coordinate"""
+        return self.hex_coord[0]
+
+    @property
+    def r(self) -> int:
+        """The second hex coordinate"""
+        return self.hex_coord[1]
+
+    @property
+    def hex_coord_system(self) -> str:
+        """The hexagonal coordinate system of the polyhex"""
+        return self.polyhex.hex_coord_system
+
+    @property
+    def top(self) -> str:
+        """The top of the polyhex's hexagons"""
+        return self.polyhex.top
+
+    @property
+    def radius(self) -> int | float:
+        """The radius of the polyhex's hexagons"""
+        return self.polyhex.radius
+
+    @property
+    def vertex_orientation(self) -> str:
+        """The vertex orientation of the polyhex's hexagons"""
+        return self.polyhex.vertex_orientation
+
+    @property
+    def geometry(self) -> HexagonGeometry:
+        """The shared offsets tables of the polyhex's layout"""
+        return get_geometry(self.hex_coord_system, self.top, self.vertex_orientation)
+
+    @property
+    def x(self):
+        """The first coordinate of the hexagon's centre on the cartesian grid"""
+        return self.geometry.to_cartesian(self.q, self.r)[0]
+
+    @property
+    def y(self):
+        """The second coordinate of the hexagon's centre on the cartesian grid"""
+        return self.geometry.to_cartesian(self.q, self.r)[1]
+
+    adjency = Hexagon.adjency
+
+    @property
+    def encoding(self):
+        """Returns the border hexagon's encoding, without creating the full ``Hexagon`` if it does not exist yet.
+
+        Returns:
+            List: vector representation of the Hexagon's attribute
+        """
+        if self._hexagon is not None:
+            return self._hexagon.encoding
+        encoding_assets = self.polyhex.assets.sections["HexagonCentre"]["encoding"]
+        return [
+            encoding_assets["feature"]["placeholder"],
+            encoding_assets["token"]["placeholder"],
+        ]
+
+    @property
+    def hexagon(self) -> Hexagon:
+        """The full placeholder ``Hexagon``, created on first access.
+
+        Returns:
+            Hexagon: the placeholder hexagon at the border hexagon's coordinates
+        """
+        if self._hexagon is None:
+            self._hexagon = self.polyhex.placeholder_hex(hex_coord=self.hex_coord)
+        return self._hexagon
+
+    ######### Methods #########
+    def distance(self, other, kwd="euclidian"):
+        """Method to compute the distance between the border hexagon and another hexagon
+
+        Args:
+            other (BorderHexagon | Hexagon): other hexagon
+            kwd (str, optional): Identifier of the distance: `euclidian` between the hex coordinates, `hex` for the number of steps between the hexagons, or `display` between their centres in display space, see ``polyhex.objects.distances``. Defaults to "euclidian".
+
+        Raises:
+            NotImplementedError: The distance is not implemented for this keyword.
+
+        Returns:
+            int | float: distance value
+        """
+        assert isinstance(other, (BorderHexagon, Hexagon))
+        return hexagon_distance(self.spatial_key, other.spatial_key, kwd, self.radius)
 
     ######### Dunder methods #########
+    def __getattr__(self, name):
+        # Only called for the attributes that are not defined above: they require the full hexagon
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.hexagon, name)
+
     def __str__(self):
         return f"{self.hex_coord} \n"
 
+    def __repr__(self):
+        return f"BorderHexagon : {self.hex_coord}"
+
     def __eq__(self, other):
-        return self.is_compatible(other) and self.centre == other.centre
+        return isinstance(other, (BorderHexagon, Hexagon)) and self.key == other.key
 
     def __hash__(self):
-        return hash((type(self), self.centre))
+        return hash(self.key)
+
+    def __getstate__(self):
+        return (self.hex_coord, self.polyhex, self._hexagon)
+
+    def __setstate__(self, state):
+        # The layout ids are allocated per process: the key is recomputed when unpickling
+        self.hex_coord, self.polyhex, self._hexagon = state
+        self.key = self._key()
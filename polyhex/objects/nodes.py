@@ -2,29 +2,35 @@
 
 # pylint: disable=line-too-long
 # pylint: disable=possibly-used-before-assignment
+# pylint: disable=import-outside-toplevel
 
 from abc import ABC
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, ClassVar, List, Tuple
 from math import sqrt
 
 from numpy.typing import ArrayLike
-from scipy.spatial import distance
-import matplotlib.pyplot as plt
-from matplotlib.patches import Ellipse
-from matplotlib.artist import Artist
 
 from polyhex.objects.hexagons import Hexagon
 from polyhex.objects.decorators import top_dependent
+from polyhex.objects.geometry import vertex_key
+from polyhex.objects.distances import euclidean, hexagon_distance
+from polyhex.utilities import pack_coordinates
+
+if TYPE_CHECKING:
+    from matplotlib.artist import Artist
 
 __all__ = ("HexagonCentre", "HexagonVertex")
 
 
-@dataclass
+@dataclass(slots=True)
 class Node(ABC):
     """Node Abstract class.
     The HexagonCentre and HexagonVertex inherit from it.
 
+    Nodes are slotted: they only store their hexagon, feature, token, cartesian coordinates, spatial key and integer key. The layout (`top`) and the assets are read from their hexagon.
+    The integer `key` packs the spatial key into a single int, it is used for the equality and the hashing.
+
     Args:
         hexagon (Hexagon): The Hexagon to which the nodes belonrg.
         feature (ArrayLike): The feature identifies what can be placed on the node or what it is compatible with. Defaults to 0.
@@ -32,73 +38,63 @@ class Node(ABC):
         token (ArrayLike): Identifies what is on the node. Defaults to None
     """
 
-    # pylint: disable=too-many-instance-attributes
     hexagon: Hexagon
     feature: ArrayLike = "placeholder"
+    # Current token
+    token: str = field(init=False, default="placeholder")
+    # Coordinates on the cartesian grid and spatial key, set by the children classes
+    x: int = field(init=False, default=None)
+    y: int = field(init=False, default=None)
+    spatial_key: Tuple = field(init=False, default=None)
+    key: int = field(init=False, default=None)
+    # The name attribute is a string representation of the class' name. Example: HexagonCentre, HexagonVertex...
+    name: ClassVar[str] = "Node"
 
-    def __post_init__(self):
-        # Unpack useful hexagon attributes
-        self.top = self.hexagon.top
-        # Assets
-        self.render_assets = self.hexagon.assets["render"][self.name]
-        self.compat_assets = self.hexagon.assets["compatibility"][self.name]
-        self.encoding_assets = self.hexagon.assets["encoding"][self.name]
-        # Current token
-        self.token = "placeholder"
-        # Display coordinates on the cartesian grid
-        if self.top == "pointy":
-            self.display_coordinates = [
-                self.x * (self.hexagon.radius * sqrt(3) / 2),
-                self.y / (self.hexagon.radius * 2),
-            ]
-        else:
-            raise NotImplementedError
+    @property
+    def top(self) -> str:
+        """The top of the node's hexagon"""
+        return self.hexagon.top
 
     @property
-    def encoding(self) -> List:
-        """The encoding is an attribute of a node: it turns the string representation of the `feature` and the `token` into a list.
+    def assets(self):
+        """The assets table shared by all the hexagons"""
+        return self.hexagon.assets
 
-        Returns:
-            (list): vector encoding of the node's representation
-        """
+    @property
+    @top_dependent
+    def display_coordinates(self) -> List[float]:
+        """Display coordinates of the node on the cartesian grid"""
         return [
-            self.encoding_assets["feature"][self.feature],
-            self.encoding_assets["token"][self.token],
+            self.x * (self.hexagon.radius * sqrt(3) / 2),
+            self.y / (self.hexagon.radius * 2),
         ]
 
     @property
-    def name(self):
-        """The name attribute is a string representation of the class' name. Example: HexagonCentre, HexagonVertex...
-
-        Returns:
-            _type_: _description_
-        """
-        return self._name
-
-    @name.setter
-    def name(self, name):
-        """setter method for the name attribute"""
-        self._name = name
+    def render_assets(self):
+        """The rendering assets of the node, shared with all the nodes of the same name."""
+        return self.assets.sections[self.name]["render"]
 
     @property
-    def x(self):
-        """The x attribute is the second coordinate of the node on a cartesian grid."""
-        return self._x
+    def compat_assets(self):
+        """The token compatibility assets of the node, shared with all the nodes of the same name."""
+        return self.assets.sections[self.name]["compatibility"]
 
-    @x.setter
-    def x(self, x):
-        """setter method for the x attribute"""
-        self._x = x
+    @property
+    def encoding_assets(self):
+        """The encoding assets of the node, shared with all the nodes of the same name."""
+        return self.assets.sections[self.name]["encoding"]
 
     @property
-    def y(self):
-        """The y attribute is the second coordinate of the node on a cartesian grid."""
-        return self._y
+    def encoding(self) -> List:
+        """The encoding is an attribute of a node: it turns the string representation of the `feature` and the `token` into a list.
 
-    @y.setter
-    def y(self, y):
-        """setter method for the y attribute"""
-        self._y = y
+        Returns:
+            (list): vector encoding of the node's representation
+        """
+        return [
+            self.encoding_assets["feature"][self.feature],
+            self.encoding_assets["token"][self.token],
+        ]
 
     def draw(self, save=True):
         """The draw function is a convenience function that wraps the `render` function. It is used for standalone drawing and generates a figure which is saved based on the save boolean argument
@@ -106,6 +102,9 @@ class Node(ABC):
         Args:
             save (bool, optional): _description_. Defaults to True.
         """
+        # matplotlib is an optional dependency, only imported for rendering
+        import matplotlib.pyplot as plt
+
         fig = plt.figure(figsize=(2, 2))
         axes = fig.gca()
         axes.axis("off")
@@ -117,7 +116,7 @@ class Node(ABC):
         else:
             plt.show(axes)
 
-    def _render(self, axes: Artist):
+    def _render(self, axes: "Artist"):
         """The `_render` method is a private method of the `Node` abstract class. It differs from the `render` public method as it is only implemented in the children classes.
         Args:
             axes (Artist): matplotlib.Artist on which to draw
@@ -129,7 +128,7 @@ class Node(ABC):
             "The _render() Method is not implemented for the abstract `Node` class."
         )
 
-    def render(self, axes: Artist, **kwargs):
+    def render(self, axes: "Artist", **kwargs):
         """The `render` method is a public method of the `Node` abstract class.
         It differs from ``draw`` as it requires a matplotlib.axe and returns a matplotlib.axe
         Args:
@@ -163,6 +162,9 @@ class HexagonCentre(Node):
         a feature (``ArrayLike``)
     """
 
+    __slots__ = ()
+    name = "HexagonCentre"
+
     def __init__(self, hexagon: Hexagon, feature: ArrayLike = "placeholder"):
         """Constructor of the ``HexagonCentre`` class
 
@@ -175,17 +177,22 @@ class HexagonCentre(Node):
             hexagon (Hexagon): Hexagon the ``HexagonCentre`` is the centre of.
             feature (ArrayLike, optional): Feature of the ``HexagonCentre``
         """
-        self.hex_coordinates = hexagon.hex_coord
+        super().__init__(hexagon, feature)
         self.x, self.y = hexagon.x, hexagon.y
-        self.name = "HexagonCentre"
         # Spatial key, used to uniquely identify the location of the hexagon's centre, coincides with the hexagon's spatial key
         self.spatial_key = hexagon.hex_coord
+        self.key = pack_coordinates(int(hexagon.q), int(hexagon.r))
 
-        super().__init__(hexagon, feature)
+    @property
+    def hex_coordinates(self) -> Tuple[int]:
+        """The hex coordinates of the ``HexagonCentre``, an alias of its spatial key"""
+        return self.spatial_key
 
     #### Private Methods ####
     @top_dependent
-    def _render(self, axes: Artist, **kwargs):
+    def _render(self, axes: "Artist", **kwargs):
+        from matplotlib.patches import Ellipse
+
         scaling = 0.1
         if self.top == "pointy":
             circle = Ellipse(
@@ -196,16 +203,13 @@ class HexagonCentre(Node):
 
     #### Dunder methods ####
     def __eq__(self, other):
-        return (
-            isinstance(other, HexagonCentre)
-            and self.hex_coordinates == other.hex_coordinates
-        )
+        return isinstance(other, HexagonCentre) and self.key == other.key
 
     def __repr__(self):
         return f"{self.name} : {self.spatial_key}"
 
     def __hash__(self):
-        return hash((type(self), self.spatial_key))
+        return hash(self.key)
 
     ### Public method ###
     def distance(self, other, kwd="euclidian"):
@@ -213,21 +217,16 @@ class HexagonCentre(Node):
 
         Args:
             other (_type_): other ``HexagonCentre``
-            kwd (str, optional): Identifier of the distance. Defaults to "euclidian".
+            kwd (str, optional): Identifier of the distance: `euclidian` between the hex coordinates, `hex` for the number of steps between the hexagons, or `display` between the centres in display space, see ``polyhex.objects.distances``. Defaults to "euclidian".
 
         Raises:
-            NotImplementedError: This method is currently only implemented for the `euclidian` distance.
+            NotImplementedError: The distance is not implemented for this keyword.
 
         Returns:
-            np.ndarray: float distance value
+            int | float: distance value
         """
         assert isinstance(other, HexagonCentre)
-        if kwd == "euclidian":
-            return distance.euclidean(self.hex_coordinates, other.hex_coordinates)
-
-        raise NotImplementedError(
-            f"The distance function for {self.name} is not implemented for distance keyword {kwd}. It can only be `euclidian`."
-        )
+        return hexagon_distance(self.hex_coordinates, other.hex_coordinates, kwd, self.hexagon.radius)
 
 
 class HexagonVertex(Node):
@@ -243,6 +242,9 @@ class HexagonVertex(Node):
         Unlike ``HexagonCentre``, vertices can spatially coincide hence they need more information to be distinguished from one another.
     """
 
+    __slots__ = ("index", "feature_key")
+    name = "HexagonVertex"
+
     def __init__(
         self,
         hexagon: Hexagon,
@@ -262,18 +264,22 @@ class HexagonVertex(Node):
             feature (ArrayLike, optional): Feature of the ``HexagonVertex``
             index (int) : the index of the vertex in the considered Hexagon
         """
-        cartesian_coordinates = hexagon._vertex_coord_factory()[index]
+        super().__init__(hexagon, feature)
+        offset_x, offset_y = hexagon.geometry.vertex_offsets[index]
+        cartesian_coordinates = (hexagon.x + offset_x, hexagon.y + offset_y)
         self.x, self.y = cartesian_coordinates
         self.index = index
-        self.name = "HexagonVertex"
         # Unlike the HexagonCentre, the spatial key of a HexagonVertex is its cartesian coordinates vector
         self.spatial_key = cartesian_coordinates
         self.feature_key = (cartesian_coordinates, feature)
-        super().__init__(hexagon, feature)
+        # Canonical id of the vertex, the key of the vertex graphs
+        self.key = vertex_key(*cartesian_coordinates)
 
     #### Private Methods ####
     @top_dependent
-    def _render(self, axes: Artist, **kwargs):
+    def _render(self, axes: "Artist", **kwargs):
+        from matplotlib.patches import Ellipse
+
         scaling = 0.2
         if self.top == "pointy":
             circle = Ellipse(
@@ -286,12 +292,16 @@ class HexagonVertex(Node):
 
     #### Dunder methods ####
     def __eq__(self, other):
+        # Same position and same feature, as the feature_key
         return (
-            isinstance(other, HexagonVertex) and self.feature_key == other.feature_key
+            isinstance(other, HexagonVertex)
+            and self.key == other.key
+            and self.feature == other.feature
         )
 
     def __hash__(self):
-        return hash((type(self), self.feature_key))
+        # The vertices that only differ by their feature share the same hash
+        return hash(self.key)
 
     def __repr__(self):
         return f"{self.name} : {self.feature_key}"
@@ -308,11 +318,11 @@ class HexagonVertex(Node):
             NotImplementedError: This is currently not implemented for any distance but the `euclidian`.
 
         Returns:
-            np.ndarray: float distance value
+            float: distance value
         """
         assert isinstance(other, HexagonVertex)
         if kwd == "euclidian":
-            return distance.euclidean(self.spatial_key, other.spatial_key)
+            return euclidean(self.spatial_key, other.spatial_key)
 
         raise NotImplementedError(
             f"The distance function for {self.name} is not implemented for distance keyword {kwd}. It can only be `euclidian`."
@@ -5,14 +5,18 @@
 from typing import List, Dict
 from dataclasses import dataclass, field
 import numpy as np
-import matplotlib.pyplot as plt
 
 from polyhex.assets import loaders
 from polyhex.objects.decorators import hex_coord_system_dependent
-from polyhex.objects.hexagons import Hexagon
+from polyhex.objects.geometry import get_geometry
+from polyhex.objects.hexagons import Hexagon, BorderHexagon
+from polyhex.objects.builders import BulkBuilder
 
 __all__ = ("Polyhex",)
 
+# Style of the border edges, shared by ``Polyhex.render``, the ``BatchedRenderer`` and the ``Rasterizer``
+BORDER_STYLE = {"color": "black", "linewidth": 3}
+
 
 @dataclass
 class Polyhex:
@@ -29,12 +33,13 @@ class Polyhex:
     radius: int | float = 1
     vertex_orientation: str = "clockwise"
     assets: Dict = field(
-        default_factory=lambda: loaders.load_assets("default_assets.json")
+        default_factory=lambda: loaders.get_assets("default_assets.json")
     )
 
     def __post_init__(
         self,
     ):
+        self.assets = loaders.as_asset_table(self.assets)
         self.random_generator = np.random.default_rng()
 
     def _check_iterable_consistency(self, hexagons: List[Hexagon]):
@@ -45,6 +50,13 @@ class Polyhex:
             first_hex.is_compatible(other_hex) for other_hex in hexagons[1:]
         ) and len(hexagons) == len(set(hexagons))
 
+    @staticmethod
+    def _is_lazy(hypergraph) -> bool:
+        # Lazy imports to avoir Circular Import Error
+        from polyhex.objects.graphs import LazyHypergraph
+
+        return isinstance(hypergraph, LazyHypergraph)
+
     def _create_from_list(self, hexagons: List[Hexagon], hypergraph):
         # Extract the properties of the polyhex from the first hexagon
         self.hex_coord_system = hexagons[0].hex_coord_system
@@ -52,9 +64,41 @@ class Polyhex:
         self.top = hexagons[0].top
         self.vertex_orientation = hexagons[0].vertex_orientation
         self.assets = hexagons[0].assets
-        for hexagon in hexagons:
-            # Add the hexagon to the list of polyhexes
-            self.append_hex(hexagon, hypergraph)
+        if self._is_lazy(hypergraph):
+            hypergraph.extend(hexagons, self)
+        elif all(graph.n_nodes == 0 for graph in hypergraph.values()):
+            # Empty graphs are filled in a single pass
+            coordinates = np.array([hexagon.hex_coord for hexagon in hexagons])
+            BulkBuilder(self).build(coordinates, hypergraph, hexagons)
+        else:
+            for hexagon in hexagons:
+                # Add the hexagon to the list of polyhexes
+                self.append_hex(hexagon, hypergraph)
+
+    def _create_from_coordinates(self, coordinates: np.ndarray, hypergraph: Dict):
+        if self._is_lazy(hypergraph):
+            hexagons = [
+                self.placeholder_hex(hex_coord=coord)
+                for coord in map(tuple, np.asarray(coordinates).reshape(-1, 2).tolist())
+            ]
+            hypergraph.extend(hexagons, self)
+        else:
+            BulkBuilder(self).build(coordinates, hypergraph)
+
+    @classmethod
+    def create_from_coordinates(cls, coordinates: np.ndarray, hypergraph: Dict):
+        """Class method to create a polyhex of placeholder hexagons from their coordinates, in a single vectorized pass
+
+        Args:
+            coordinates (np.ndarray): (N, 2) array of the hex coordinates of the hexagons, in the order in which they are appended
+            hypergraph (Dict): Graphs to be recorded. They must be empty.
+
+        Returns:
+            polyhex: Polyhex
+        """
+        polyhex = cls()
+        polyhex._create_from_coordinates(np.asarray(coordinates).reshape(-1, 2), hypergraph)
+        return polyhex
 
     @classmethod
     def create_from_iterable(cls, hexagons: List[Hexagon], hypergraph):
@@ -80,12 +124,13 @@ class Polyhex:
         return polyhex
 
     @classmethod
-    def create_from_number(cls, n_hexagons: int, hypergraph: Dict):
+    def create_from_number(cls, n_hexagons: int, hypergraph: Dict, random_generator: np.random.Generator = None):
         """Class method to create a polyhex from a number of hexagons
 
         Args:
             n_hexagons (int): number of hexagons in the polyhex
             hypergraph (Dict): Graphs to be recorded. It requires the HexagonBorderGraph to be recorded.
+            random_generator (np.random.Generator, optional): the random generator used to sample the border hexagons. Pass a seeded generator for reproducible polyhexes. Defaults to None, i.e to a fresh, unseeded, generator.
 
         Raises:
             ValueError: A valueError is raised when the hypergraph does not have a ``HexagonBorderGraph`` key
@@ -96,6 +141,8 @@ class Polyhex:
         if not "HexagonBorderGraph" in hypergraph:
             raise ValueError("To use the ``create_from_number`` method, it is necessary to record a HexagonBorderGraph, but none were not found")
         polyhex = cls()
+        if random_generator is not None:
+            polyhex.random_generator = random_generator
         assert isinstance(n_hexagons, int)
         polyhex._create_from_list([Hexagon()], hypergraph)
         for _ in range(n_hexagons - 1):
@@ -110,26 +157,35 @@ class Polyhex:
 
         Args:
             radius (int): Radius of the spiral tiling
-            hypergraph (Dict): Graphs to be recorded. It requires the HexagonBorderGraph to be recorded.
-
-        Raises:
-            ValueError: A valueError is raised when the hypergraph does not have a ``HexagonBorderGraph`` key
+            hypergraph (Dict): Graphs to be recorded.
 
         Returns:
             polyhex: Polyhex
         """
-        if not "HexagonBorderGraph" in hypergraph:
-            raise ValueError("To use the ``create_spiral`` method, it is necessary to record a HexagonBorderGraph, but none were not found")
         polyhex = cls()
         assert isinstance(radius, int)
-        polyhex._create_from_list([Hexagon()], hypergraph)
-        for _ in range(1, radius + 1):
-            # We create a list out of the border because a simple reference to it points to the actual border, which would be changed during the process of appending tiles, which is not good.
-            border = list(hypergraph["HexagonBorderGraph"].nodes.values())
-            for hexagon in border:
-                polyhex.append_hex(hexagon, hypergraph)
+        polyhex._create_from_coordinates(polyhex._spiral_coordinates(radius), hypergraph)
         return polyhex
 
+    def _spiral_coordinates(self, radius: int) -> np.ndarray:
+        """Coordinates of the hexagons within `radius` of the centre, ring by ring.
+        Each ring is walked in the order of the ``HexagonBorderGraph`` when the ring starts, so that the graphs are the ones of appending the border hexagons one at a time
+        """
+        geometry = get_geometry(self.hex_coord_system, self.top, self.vertex_orientation)
+        placed = {(0, 0)}
+        coordinates = [(0, 0)]
+        # Insertion-ordered border, as the nodes of the HexagonBorderGraph
+        border = dict.fromkeys(geometry.neighbours(0, 0))
+        for _ in range(radius):
+            for hex_coord in list(border):
+                del border[hex_coord]
+                placed.add(hex_coord)
+                coordinates.append(hex_coord)
+                for adj in geometry.neighbours(*hex_coord):
+                    if adj not in border and adj not in placed:
+                        border[adj] = None
+        return np.array(coordinates, dtype=np.int64).reshape(-1, 2)
+
     @classmethod
     def create_tiling(cls, n: int, m: int, name: str, hypergraph: Dict, **kwargs):
         """Class method to create a polyhex tiling of size n*m
@@ -147,34 +203,29 @@ class Polyhex:
         Returns:
             polyhex: Polyhex tiling (hextille) (see https://en.wikipedia.org/wiki/Hexagonal_tiling)
         """
-        coordinates = []
         if name == "rectangular":
             offset = kwargs.pop("offset", "odd-r")
-            for r in range(m):
-                if offset == "even-r":
-                    offset_val = -(r // 2 + r % 2)
-                elif offset == "odd-r":
-                    offset_val = -(r // 2)
-                else:
-                    raise ValueError(
-                        f"The offset can only be `even-r` or `odd-r`, got {offset}"
-                    )
-                for q in range(n):
-                    coordinates.append((q + offset_val, r))
+            r = np.repeat(np.arange(m), n)
+            q = np.tile(np.arange(n), m)
+            if offset == "even-r":
+                q = q - (r // 2 + r % 2)
+            elif offset == "odd-r":
+                q = q - r // 2
+            else:
+                raise ValueError(
+                    f"The offset can only be `even-r` or `odd-r`, got {offset}"
+                )
 
         elif name == "tilted":
-            for i in range(1, n):
-                for j in range(1, m):
-                    coordinates.append((i, j))
+            q = np.repeat(np.arange(1, n), max(m - 1, 0))
+            r = np.tile(np.arange(1, m), max(n - 1, 0))
         else:
             raise NotImplementedError(
                 f"The tiling can only be `rectangular` or `tilted`, not {name}."
             )
 
         polyhex = cls()
-        polyhex._create_from_list(
-            [Hexagon(hex_coord=c) for c in coordinates], hypergraph
-        )
+        polyhex._create_from_coordinates(np.stack([q, r], axis=1), hypergraph)
 
         return polyhex
 
@@ -212,12 +263,17 @@ class Polyhex:
         The Polyhex being an Orchestrator, it is its role to read the graph to record, make sure that all graphs are recorded using the right ``graph.append()`` calls.
 
         Args:
-            hexagon (Hexagon): The hexagon to append to the polyhex
-            hypergraph (Dict): The dict of graphs
+            hexagon (Hexagon | BorderHexagon): The hexagon to append to the polyhex. A ``BorderHexagon`` is replaced by its full placeholder hexagon.
+            hypergraph (Dict | LazyHypergraph): The dict of graphs. A ``LazyHypergraph`` records the hexagon and only appends it to its eager graphs.
 
         Returns:
             dict: updated graph
         """
+        if self._is_lazy(hypergraph):
+            hypergraph.append(hexagon, self)
+            return hypergraph
+        if isinstance(hexagon, BorderHexagon):
+            hexagon = hexagon.hexagon
         for name, graph in hypergraph.items():
             if name == "HexagonBorderGraph":
                 assert "HexagonGraph" in hypergraph
@@ -226,7 +282,7 @@ class Polyhex:
                 graph.append(hexagon)
         return graph
 
-    def render(self, axes, hypergraph:Dict):
+    def render(self, axes, hypergraph:Dict, batched: bool = False):
         """The method to render a polyhex using a hypergraph. 
 
         Note:
@@ -235,7 +291,14 @@ class Polyhex:
         Args:            
             axes (matplotlib.axis): axis on which to render the figure
             hypergraph (Dict): dict of recorded graphs 
+            batched (bool, optional): Whether to draw the polyhex with one matplotlib collection per rendering style, see ``BatchedRenderer``, instead of several artists per hexagon. Use it for large polyhexes. Defaults to False.
         """
+        if batched:
+            # matplotlib is an optional dependency, only imported for rendering
+            from polyhex.objects.rendering import BatchedRenderer
+
+            return BatchedRenderer(self).render(axes, hypergraph)
+
         if "HexagonGraph" in hypergraph:
             for hexagon in hypergraph["HexagonGraph"].nodes.values():
                 axes = hexagon.render(axes)
@@ -246,11 +309,11 @@ class Polyhex:
 
         if "EdgeBorderGraph" in hypergraph:
             for edge in hypergraph["EdgeBorderGraph"].nodes.values():
-                axes = edge.render_line(axes, color="black", linewidth="3")
+                axes = edge.render_line(axes, **BORDER_STYLE)
 
         return axes
 
-    def draw(self, hypergraph :Dict, save_path="./image.png", buffer=False):
+    def draw(self, hypergraph :Dict, save_path="./image.png", buffer=False, batched: bool = False):
         """The method to draw a polyhex using a hypergraph. 
 
         Note:
@@ -260,12 +323,15 @@ class Polyhex:
             hypergraph (Dict): dict of recorded graphs 
             save_path (str, optional): Where to save the drawn image. Defaults to "./image.png".
             buffer (bool, optional): Useful for pygame dynamic rendering. Defaults to False.
+            batched (bool, optional): Whether to draw the polyhex with one matplotlib collection per rendering style, see ``render``. Defaults to False.
         """
+        import matplotlib.pyplot as plt
+
         fig = plt.figure()
         axes = fig.gca()
         axes.axis("off")
 
-        axes = self.render(axes, hypergraph)
+        axes = self.render(axes, hypergraph, batched=batched)
 
         if buffer:
             plt.savefig(buffer, format="png", dpi=150, bbox_inches="tight")
@@ -0,0 +1,275 @@
+"""Module for the headless rendering of a polyhex into a NumPy image.
+
+The ``Rasterizer`` draws the hexagons of a polyhex straight into a preallocated (H, W, 3) ``uint8`` array, without matplotlib artists nor image encoding.
+The geometry is computed once, as a map from each pixel to a slot of a cell: one of the 6 triangles of the hexagon (its fill), one of its 6 edge lines, or its centre marker.
+A frame is then a single colour lookup, from the colours of the slots, into the reused buffer. When only a few cells change, only their pixels are redrawn.
+
+The colours are read from the rendering assets, as in ``Polyhex.render``, and parsed the first time a style is met. The hex strings, the RGB(A) tuples and the common names are parsed without matplotlib, which is only imported for the other named colours.
+"""
+
+# pylint: disable=line-too-long
+
+import re
+from math import sqrt
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from polyhex.objects.decorators import (
+    hex_coord_system_dependent,
+    top_dependent,
+    vertex_orientation_dependent,
+)
+from polyhex.objects.geometry import centres
+from polyhex.objects.hexagons import Hexagon
+from polyhex.objects.polyhexes import BORDER_STYLE
+from polyhex.objects.spatial import SpatialIndex, points_to_hexes
+from polyhex.utilities.lazy import import_optional
+
+__all__ = ("Rasterizer",)
+
+# Slots of a cell: the 6 triangles, the 6 edge lines and the centre marker
+N_SLOTS = 13
+LINE_SLOT = 6
+CENTRE_SLOT = 12
+# Scaling of the cartesian grid into euclidian units, in which the radius of the hexagons is 1
+_EUCLIDIAN_SCALING = np.array([sqrt(3) / 2, 1 / 2])
+_APOTHEM = sqrt(3) / 2
+# Hex codes of the matplotlib base colours, of the tableau palette and of the common CSS names
+_NAMED_COLOURS = {
+    "b": "#0000ff", "g": "#008000", "r": "#ff0000", "c": "#00bfbf", "m": "#bf00bf", "y": "#bfbf00", "k": "#000000", "w": "#ffffff",
+    "black": "#000000", "white": "#ffffff", "red": "#ff0000", "green": "#008000", "blue": "#0000ff", "grey": "#808080", "gray": "#808080",
+    "tab:blue": "#1f77b4", "tab:orange": "#ff7f0e", "tab:green": "#2ca02c", "tab:red": "#d62728", "tab:purple": "#9467bd",
+    "tab:brown": "#8c564b", "tab:pink": "#e377c2", "tab:grey": "#7f7f7f", "tab:gray": "#7f7f7f", "tab:olive": "#bcbd22", "tab:cyan": "#17becf",
+}
+_HEX_COLOUR = re.compile(r"#([0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})")
+
+
+def _style_colour(style, keys: Tuple[str], default: str):
+    """First colour of the style among `keys`"""
+    for key in keys:
+        if key in style:
+            return style[key]
+    return default
+
+
+class Rasterizer:
+    """
+    Rasterizer class: draws the hexagons of a polyhex into a reused (H, W, 3) uint8 NumPy image.
+
+    The image shows the fill of the hexagons, as the triangles of their edges, the edge lines, with the border edges of the polyhex drawn as in ``Polyhex.render``, and the centre markers.
+    The image is sized to fit the hexagons of the polyhex when the rasterizer is created; pass an `extent` to keep the same view while the polyhex grows. The pixel map is rebuilt on the first render after the ``HexagonGraph`` changed, see ``Graph.version``.
+    The border hexagons are not drawn.
+
+    Args:
+        polyhex (Polyhex): the polyhex, which defines the layout of the hexagons.
+        hypergraph (Dict): its graphs. It must record a ``HexagonGraph``.
+        scale (float, optional): the number of pixels per hexagon radius. Defaults to 16.
+        extent (Tuple[float], optional): the (x_min, y_min, x_max, y_max) rectangle of the cartesian grid shown in the image. Defaults to None, i.e to the bounding box of the hexagons.
+        line_width (float, optional): the width of the edge lines, in pixels. Defaults to 1.
+        border_width (float, optional): the width of the border edge lines, in pixels. Defaults to 3.
+        centre_radius (float, optional): the radius of the centre markers, in hexagon radius. Defaults to 0.1.
+        background (str, optional): the colour of the pixels outside of the polyhex. Defaults to "white".
+    """
+
+    def __init__(
+        self,
+        polyhex,
+        hypergraph: Dict,
+        scale: float = 16,
+        extent: Tuple[float] = None,
+        line_width: float = 1,
+        border_width: float = 3,
+        centre_radius: float = 0.1,
+        background: str = "white",
+    ):
+        self.hex_coord_system = polyhex.hex_coord_system
+        self.top = polyhex.top
+        self.vertex_orientation = polyhex.vertex_orientation
+        self._check_layout()
+        self.index = SpatialIndex(polyhex, hypergraph)
+        self.scale = scale
+        self.extent = extent
+        self.line_width = line_width
+        self.border_width = border_width
+        self.centre_radius = centre_radius
+        self.background = self._rgb(background)
+        # Palette of the parsed colours, and palette index of each colour and of each style
+        self.palette = np.zeros((0, 3), dtype=np.uint8)
+        self._palette_index: Dict = {}
+        self._style_index: Dict[Tuple, int] = {}
+        self.image: np.ndarray = None
+        # Version of the HexagonGraph the pixel map was built from, see ``Graph.version``
+        self._mapped_version = None
+
+    @hex_coord_system_dependent
+    @top_dependent
+    @vertex_orientation_dependent
+    def _check_layout(self):
+        pass
+
+    ######### Colours #########
+    @staticmethod
+    def _rgb(colour) -> np.ndarray:
+        """uint8 RGB triplet of a matplotlib colour, the alpha channel being dropped"""
+        if isinstance(colour, str):
+            name = _NAMED_COLOURS.get(colour.lower(), colour)
+            match = _HEX_COLOUR.fullmatch(name)
+            if match is not None:
+                digits = match.group(1)
+                if len(digits) <= 4:
+                    digits = "".join(2 * digit for digit in digits)
+                return np.array([int(digits[i : i + 2], 16) for i in (0, 2, 4)], dtype=np.uint8)
+            try:
+                # Grayscale level, as in matplotlib
+                level = float(colour)
+            except ValueError:
+                # Other named colours: the CSS4 and xkcd tables are only loaded from matplotlib when needed
+                mcolors = import_optional("matplotlib.colors")
+                return np.round(np.array(mcolors.to_rgb(colour)) * 255).astype(np.uint8)
+            if not 0 <= level <= 1:
+                raise ValueError(f"Invalid grayscale colour {colour!r}, it must be between 0 and 1")
+            rgb = np.full(3, level)
+        else:
+            rgb = np.asarray(colour, dtype=np.float64)[:3]
+            if rgb.shape != (3,) or not ((0 <= rgb) & (rgb <= 1)).all():
+                raise ValueError(f"Invalid RGB(A) colour {colour!r}, its channels must be between 0 and 1")
+        return np.round(rgb * 255).astype(np.uint8)
+
+    def colour_index(self, colour) -> int:
+        """Returns the index of a matplotlib colour in the palette, parsing it on first use
+
+        Args:
+            colour (str | Tuple[float]): a matplotlib colour
+
+        Returns:
+            int: the index of its uint8 RGB triplet in `palette`
+        """
+        key = colour if isinstance(colour, str) else tuple(colour)
+        if key not in self._palette_index:
+            self._palette_index[key] = len(self.palette)
+            self.palette = np.concatenate([self.palette, self._rgb(colour)[None]])
+        return self._palette_index[key]
+
+    def _style_colour_index(self, style, keys: Tuple[str], default: str) -> int:
+        # The styles are shared by the nodes through the assets tables, they are cached by identity
+        key = (id(style), keys)
+        if key not in self._style_index:
+            self._style_index[key] = self.colour_index(_style_colour(style, keys, default))
+        return self._style_index[key]
+
+    def _cell_colours(self, hexagon: Hexagon, is_border: np.ndarray) -> List[int]:
+        """Palette indices of the colours of the slots of a cell"""
+        colours = [0] * N_SLOTS
+        for edge in hexagon.edges_list:
+            style = edge.render_assets["feature"][edge.token]
+            colours[edge.index] = self._style_colour_index(style["triangle"], ("facecolor", "color"), "white")
+            line = BORDER_STYLE if is_border[edge.index] else style["line"]
+            colours[LINE_SLOT + edge.index] = self._style_colour_index(line, ("color", "c"), "black")
+        centre = hexagon.centre
+        style = centre.render_assets["feature"][f"{centre.token}"]
+        colours[CENTRE_SLOT] = self._style_colour_index(style, ("facecolor", "color"), "white")
+        return colours
+
+    def _colour_cells(self, positions: List[int]):
+        """Writes the colours of the slots of the cells at the given positions"""
+        indices = np.array(
+            [self._cell_colours(self.index.hexagons[position], self._is_border[position]) for position in positions],
+            dtype=np.int64,
+        ).reshape(-1, N_SLOTS)
+        rows = (np.array(positions, dtype=np.int64)[:, None] * N_SLOTS + np.arange(N_SLOTS)).reshape(-1)
+        self.colours[rows] = self.palette[indices.reshape(-1)]
+
+    ######### Pixel map #########
+    def _bounds(self) -> Tuple[float]:
+        if self.extent is not None:
+            return self.extent
+        coordinates = self.index.coordinates
+        if len(coordinates) == 0:
+            return (-2, -2, 2, 2)
+        x, y = centres(coordinates).T
+        # The vertices are at most 1 and 2 units away from the centres
+        return (x.min() - 1, y.min() - 2, x.max() + 1, y.max() + 2)
+
+    def refresh(self):
+        """Rebuilds the pixel map, the colours of all the cells and the image from the ``HexagonGraph``"""
+        self.index.refresh()
+        x_min, y_min, x_max, y_max = self._bounds()
+        # Euclidian bounds of the view, the rows go downwards
+        (left, bottom), (right, top) = np.array([x_min, y_min]) * _EUCLIDIAN_SCALING, np.array([x_max, y_max]) * _EUCLIDIAN_SCALING
+        width = max(1, int(np.ceil((right - left) * self.scale)))
+        height = max(1, int(np.ceil((top - bottom) * self.scale)))
+        if self.image is None or self.image.shape != (height, width, 3):
+            self.image = np.empty((height, width, 3), dtype=np.uint8)
+
+        columns, rows = np.meshgrid(np.arange(width), np.arange(height))
+        points = np.stack(
+            [left + (columns.reshape(-1) + 0.5) / self.scale, top - (rows.reshape(-1) + 0.5) / self.scale], axis=1
+        )
+        coordinates = points_to_hexes(points / _EUCLIDIAN_SCALING)
+        positions = self.index.positions(coordinates)
+        delta = points - centres(coordinates) * _EUCLIDIAN_SCALING
+        # The edge i goes from the vertex at 90 - 60i degrees to the vertex at 30 - 60i degrees, clockwise
+        angles = np.degrees(np.arctan2(delta[:, 1], delta[:, 0]))
+        sectors = (np.floor(np.mod(90 - angles, 360) / 60).astype(np.int64)) % 6
+        normals = np.radians(60 - 60 * sectors)
+        to_edge = _APOTHEM - (delta[:, 0] * np.cos(normals) + delta[:, 1] * np.sin(normals))
+
+        is_border = self.index.border_edges()
+        cells = np.maximum(positions, 0)
+        widths = np.where(is_border[cells, sectors], self.border_width, self.line_width) / (2 * self.scale)
+        slots = np.where(to_edge < widths, LINE_SLOT + sectors, sectors)
+        radius = max(self.centre_radius, 1 / self.scale)
+        slots = np.where((delta**2).sum(axis=1) < radius**2, CENTRE_SLOT, slots)
+        # The background pixels point to the last row of the colour table
+        self.pixel_slots = np.where(positions >= 0, positions * N_SLOTS + slots, -1)
+
+        self._is_border = is_border
+        self.colours = np.empty((len(self.index.hexagons) * N_SLOTS + 1, 3), dtype=np.uint8)
+        self.colours[-1] = self.background
+        self._colour_cells(list(range(len(self.index.hexagons))))
+        self._cell_pixels = None
+        self._mapped_version = self.index.hexagon_graph.version
+        np.take(self.colours, self.pixel_slots, axis=0, out=self.image.reshape(-1, 3))
+
+    def _pixels_of(self, position: int) -> np.ndarray:
+        """Flat indices of the pixels of a cell"""
+        if self._cell_pixels is None:
+            # Pixels sorted by cell, the background pixels first
+            cells = np.where(self.pixel_slots >= 0, self.pixel_slots // N_SLOTS, -1)
+            order = np.argsort(cells, kind="stable")
+            bounds = np.searchsorted(cells[order], np.arange(len(self.index.hexagons) + 1))
+            self._cell_pixels = (order, bounds)
+        order, bounds = self._cell_pixels
+        return order[bounds[position] : bounds[position + 1]]
+
+    ######### Rendering #########
+    def render(self, hexagons: Iterable[Hexagon] = None) -> np.ndarray:
+        """Draws the polyhex into the image
+
+        Args:
+            hexagons (Iterable[Hexagon], optional): the hexagons whose tokens changed since the last render. Only their pixels are redrawn. Defaults to None, i.e to redrawing all the colours.
+
+        Returns:
+            np.ndarray: the (H, W, 3) uint8 image. It is the same array from one render to the next, copy it to keep a frame.
+        """
+        if self._mapped_version != self.index.hexagon_graph.version:
+            # The HexagonGraph changed: the map and all the colours are rebuilt
+            self.refresh()
+            return self.image
+        if hexagons is None:
+            self._colour_cells(list(range(len(self.index.hexagons))))
+            np.take(self.colours, self.pixel_slots, axis=0, out=self.image.reshape(-1, 3))
+            return self.image
+        flat_image = self.image.reshape(-1, 3)
+        positions: List[int] = self.index.positions(
+            np.array([hexagon.hex_coord for hexagon in hexagons], dtype=np.int64).reshape(-1, 2)
+        ).tolist()
+        positions = [position for position in positions if position >= 0]
+        if not positions:
+            return self.image
+        self._colour_cells(positions)
+        for position in positions:
+            pixels = self._pixels_of(position)
+            flat_image[pixels] = self.colours[self.pixel_slots[pixels]]
+        return self.image
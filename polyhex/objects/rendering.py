@@ -0,0 +1,166 @@
+"""Module for the batched rendering of a polyhex.
+
+``Polyhex.render`` creates one matplotlib artist per centre, per edge line and per edge triangle, i.e more than 10 artists per hexagon.
+The ``BatchedRenderer`` draws the same figure with a handful of artists: the centres, the edge lines and the edge triangles are gathered in one ``EllipseCollection``, ``LineCollection`` and ``PolyCollection`` per rendering style of the assets.
+"""
+
+# pylint: disable=line-too-long
+
+from math import sqrt
+from typing import Dict, List
+
+import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.collections import EllipseCollection, LineCollection, PolyCollection
+
+from polyhex.objects.decorators import (
+    hex_coord_system_dependent,
+    top_dependent,
+    vertex_orientation_dependent,
+)
+from polyhex.objects.geometry import VERTEX_OFFSETS
+from polyhex.objects.polyhexes import BORDER_STYLE
+
+__all__ = ("BatchedRenderer",)
+
+# Diameter of the centres, as in ``HexagonCentre._render``
+CENTRE_SCALING = 0.1
+# Keyword arguments of ``axes.plot`` and their equivalent for a ``LineCollection``
+_LINE_ALIASES = {
+    "c": "colors",
+    "color": "colors",
+    "lw": "linewidths",
+    "linewidth": "linewidths",
+    "ls": "linestyles",
+    "linestyle": "linestyles",
+}
+# Keyword arguments of ``axes.plot`` that have no meaning for a ``LineCollection``
+_MARKER_KEYWORDS = ("marker", "markersize", "ms", "markeredgecolor", "mec", "markerfacecolor", "mfc", "markeredgewidth", "mew")
+
+
+def _line_kwargs(style) -> Dict:
+    """Translates the keyword arguments of ``axes.plot`` into the ones of a ``LineCollection``"""
+    kwargs = {"zorder": 2}
+    for key, value in style.items():
+        if key in _MARKER_KEYWORDS:
+            continue
+        key = _LINE_ALIASES.get(key, key)
+        kwargs[key] = float(value) if key == "linewidths" else value
+    return kwargs
+
+
+class _Group:
+    """Items sharing the same rendering style"""
+
+    def __init__(self, style):
+        self.style = style
+        self.items: List = []
+
+
+class BatchedRenderer:
+    """
+    BatchedRenderer class: renders the graphs of a polyhex with one matplotlib collection per rendering style.
+
+    It draws the same elements as ``Polyhex.render``: the centres and edges of the ``HexagonGraph``, the centres of the ``HexagonBorderGraph`` and the lines of the ``EdgeBorderGraph``.
+    The marker keyword arguments of the edge line styles, which a ``LineCollection`` cannot draw, are ignored.
+
+    Args:
+        polyhex (Polyhex): the polyhex, which defines the layout and the radius of the hexagons.
+    """
+
+    def __init__(self, polyhex):
+        self.polyhex = polyhex
+        self.hex_coord_system = polyhex.hex_coord_system
+        self.top = polyhex.top
+        self.vertex_orientation = polyhex.vertex_orientation
+        # Scaling of the cartesian coordinates into display coordinates, as in ``Node.display_coordinates``
+        self.display_scaling = np.array([polyhex.radius * sqrt(3) / 2, 1 / (polyhex.radius * 2)])
+
+    @staticmethod
+    def _group(groups: Dict[int, _Group], style, item):
+        # The styles are shared by the nodes through the assets tables, they are grouped by identity
+        if id(style) not in groups:
+            groups[id(style)] = _Group(style)
+        groups[id(style)].items.append(item)
+
+    def _centres(self, hexagons) -> np.ndarray:
+        """(N, 2) array of the display coordinates of the centres of the hexagons"""
+        centres = np.array([(hexagon.x, hexagon.y) for hexagon in hexagons], dtype=np.float64).reshape(-1, 2)
+        return centres * self.display_scaling
+
+    def _add_centres(self, axes: Artist, hexagons: List):
+        groups: Dict[int, _Group] = {}
+        for position, hexagon in enumerate(hexagons):
+            centre = hexagon.centre
+            self._group(groups, centre.render_assets["feature"][f"{centre.token}"], position)
+        centres = self._centres(hexagons)
+        for group in groups.values():
+            offsets = centres[group.items]
+            size = np.full(len(offsets), CENTRE_SCALING)
+            axes.add_collection(
+                EllipseCollection(
+                    size, size, np.zeros(len(offsets)),
+                    units="xy", offsets=offsets, offset_transform=axes.transData,
+                    **{"zorder": 1, **group.style},
+                ),
+                autolim=True,
+            )
+
+    def _add_edges(self, axes: Artist, hexagons: List):
+        line_groups: Dict[int, _Group] = {}
+        triangle_groups: Dict[int, _Group] = {}
+        for position, hexagon in enumerate(hexagons):
+            for edge in hexagon.edges_list:
+                style = edge.render_assets["feature"][edge.token]
+                self._group(line_groups, style["line"], (position, edge.index))
+                self._group(triangle_groups, style["triangle"], (position, edge.index))
+        centres = self._centres(hexagons)
+        # (N, 6, 2) display coordinates of the vertices
+        vertices = centres[:, None, :] + VERTEX_OFFSETS * self.display_scaling
+        for group in line_groups.values():
+            positions, indices = np.array(group.items, dtype=np.int64).reshape(-1, 2).T
+            segments = np.stack(
+                [vertices[positions, indices], vertices[positions, (indices + 1) % 6]], axis=1
+            )
+            axes.add_collection(LineCollection(segments, **_line_kwargs(group.style)), autolim=True)
+        for group in triangle_groups.values():
+            positions, indices = np.array(group.items, dtype=np.int64).reshape(-1, 2).T
+            triangles = np.stack(
+                [vertices[positions, indices], vertices[positions, (indices + 1) % 6], centres[positions]], axis=1
+            )
+            axes.add_collection(PolyCollection(triangles, **{"zorder": 1, **group.style}), autolim=True)
+
+    def _add_border_edges(self, axes: Artist, edges: List):
+        segments = np.array(
+            [[(edge.start.x, edge.start.y), (edge.end.x, edge.end.y)] for edge in edges], dtype=np.float64
+        ).reshape(-1, 2, 2)
+        axes.add_collection(
+            LineCollection(segments * self.display_scaling, **_line_kwargs(BORDER_STYLE)), autolim=True
+        )
+
+    @hex_coord_system_dependent
+    @top_dependent
+    @vertex_orientation_dependent
+    def render(self, axes: Artist, hypergraph: Dict):
+        """Renders the graphs of a polyhex on an axis
+
+        Args:
+            axes (Artist): matplotlib axis on which to render the figure
+            hypergraph (Dict): dict of recorded graphs
+
+        Returns:
+            Artist: the axis
+        """
+        if "HexagonGraph" in hypergraph:
+            hexagons = list(hypergraph["HexagonGraph"].nodes.values())
+            self._add_centres(axes, hexagons)
+            self._add_edges(axes, hexagons)
+
+        if "HexagonBorderGraph" in hypergraph:
+            self._add_centres(axes, list(hypergraph["HexagonBorderGraph"].nodes.values()))
+
+        if "EdgeBorderGraph" in hypergraph:
+            self._add_border_edges(axes, list(hypergraph["EdgeBorderGraph"].nodes.values()))
+
+        axes.autoscale_view()
+        return axes
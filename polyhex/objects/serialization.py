@@ -0,0 +1,264 @@
+"""Module for the binary serialization of polyhexes.
+
+A polyhex file holds one or several polyhexes sharing the same layout and assets. It is made of:
+    -> a prefix: the magic bytes, the format version and the length of the header, <br>
+    -> a JSON header: the layout, the assets (by the name of their asset file when they have one), the vocabularies of the feature and token codes, the names of the recorded graphs and the description of the arrays, <br>
+    -> the arrays, each aligned on 8 bytes: the axial coordinates and the feature and token codes of the hexagons, as in ``HexagonStore``, and the `ptr` offsets of the polyhexes. <br>
+
+Only the hexagons are stored, in the order in which they were appended: the graphs are rebuilt on loading by the ``BulkBuilder``, in a single pass.
+"""
+
+# pylint: disable=line-too-long
+
+import json
+import struct
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from polyhex.assets import loaders
+from polyhex.objects import graphs as graphs_module
+from polyhex.objects.builders import BulkBuilder
+from polyhex.objects.polyhexes import Polyhex
+from polyhex.objects.stores import COLUMN_NAMES, COLUMNS, HexagonStore
+
+__all__ = (
+    "FORMAT_VERSION",
+    "save_polyhexes",
+    "save_polyhex",
+    "load_stores",
+    "load_polyhexes",
+    "load_polyhex",
+)
+
+MAGIC = b"POLYHEX\x00"
+FORMAT_VERSION = 1
+# Magic bytes, format version, header length
+_PREFIX = struct.Struct("<8sII")
+_ALIGNMENT = 8
+# The cartesian coordinates are recomputed from the axial ones
+_SAVED_COLUMNS: Tuple[str] = tuple(name for name in COLUMNS if name not in ("x", "y"))
+# Code column: (object name, kind)
+_CODE_COLUMNS: Dict[str, Tuple[str]] = {
+    f"{prefix}_{kind}": (name, kind)
+    for prefix, name in COLUMN_NAMES.items()
+    for kind in ("feature", "token")
+}
+_LAYOUT: Tuple[str] = ("hex_coord_system", "top", "radius", "vertex_orientation")
+
+
+def _padding(offset: int) -> int:
+    return -offset % _ALIGNMENT
+
+
+def _to_json(value):
+    # Tuples, such as tuple features, are not distinguished from lists by JSON
+    if isinstance(value, tuple):
+        return {"tuple": [_to_json(item) for item in value]}
+    return value
+
+
+def _from_json(value):
+    if isinstance(value, dict) and "tuple" in value:
+        return tuple(_from_json(item) for item in value["tuple"])
+    return value
+
+
+def _encode_assets(assets: loaders.AssetTable) -> Dict:
+    if assets.source is not None:
+        return {"source": assets.source}
+    return {"table": assets.to_dict()}
+
+
+def _decode_assets(header: Dict) -> loaders.AssetTable:
+    if "source" in header:
+        return loaders.get_assets(header["source"])
+    return loaders.as_asset_table(header["table"])
+
+
+def _store_of(polyhex: Polyhex, hypergraph: Dict) -> HexagonStore:
+    if "HexagonGraph" not in hypergraph:
+        raise ValueError("To save a polyhex, it is necessary to record a HexagonGraph, but none were found")
+    hexagons = list(hypergraph["HexagonGraph"].nodes.values())
+    if not hexagons:
+        return HexagonStore(**{key: getattr(polyhex, key) for key in _LAYOUT}, assets=polyhex.assets)
+    return HexagonStore.from_hexagons(hexagons)
+
+
+def save_polyhexes(file: str | Path | BinaryIO, polyhexes: Iterable[Tuple[Polyhex, Dict]]):
+    """Saves polyhexes, with the names of their recorded graphs, to a binary file
+
+    Args:
+        file (str | Path | BinaryIO): the path of the file, or a binary file object
+        polyhexes (Iterable[Tuple[Polyhex, Dict]]): the (polyhex, hypergraph) pairs to save. The hypergraphs must record a ``HexagonGraph``, and the polyhexes must share the same layout and assets.
+
+    Raises:
+        ValueError: A ValueError is raised when the polyhexes do not share the same layout and assets, or when a hypergraph does not record a ``HexagonGraph``.
+    """
+    polyhexes = list(polyhexes)
+    assert polyhexes, "There are no polyhexes to save"
+    first, first_hypergraph = polyhexes[0]
+    layout = {key: getattr(first, key) for key in _LAYOUT}
+    stores = []
+    for polyhex, hypergraph in polyhexes:
+        if {key: getattr(polyhex, key) for key in _LAYOUT} != layout or polyhex.assets is not first.assets:
+            raise ValueError("The polyhexes saved in the same file must share the same layout and assets")
+        stores.append(_store_of(polyhex, hypergraph))
+
+    # The codes of all the polyhexes are translated into a single vocabulary per (name, kind)
+    merged = HexagonStore(**layout, assets=first.assets)
+    columns = {name: [] for name in _SAVED_COLUMNS}
+    for store in stores:
+        for name in _SAVED_COLUMNS:
+            column = getattr(store, name)
+            if name in _CODE_COLUMNS:
+                object_name, kind = _CODE_COLUMNS[name]
+                table = np.array(
+                    [merged.code(object_name, kind, string) for string in store.vocabularies[(object_name, kind)]],
+                    dtype=column.dtype,
+                )
+                column = table[column]
+            columns[name].append(column)
+    arrays = {name: np.concatenate(parts) for name, parts in columns.items()}
+    arrays["ptr"] = np.concatenate([[0], np.cumsum([len(store) for store in stores])]).astype(np.int64)
+
+    header = {
+        "layout": layout,
+        "assets": _encode_assets(first.assets),
+        "vocabularies": [
+            {"name": name, "kind": kind, "strings": [_to_json(string) for string in vocabulary]}
+            for (name, kind), vocabulary in merged.vocabularies.items()
+        ],
+        "graphs": list(first_hypergraph),
+        "arrays": [],
+    }
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+        arrays[name] = array
+        header["arrays"].append(
+            {"name": name, "dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        )
+        offset += array.nbytes + _padding(array.nbytes)
+    header_bytes = json.dumps(header).encode("utf-8")
+    header_bytes += b" " * _padding(_PREFIX.size + len(header_bytes))
+
+    def write(stream: BinaryIO):
+        stream.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+        stream.write(header_bytes)
+        for array in arrays.values():
+            stream.write(array.tobytes())
+            stream.write(b"\x00" * _padding(array.nbytes))
+
+    if isinstance(file, (str, Path)):
+        with open(file, "wb") as stream:
+            write(stream)
+    else:
+        write(file)
+
+
+def save_polyhex(file: str | Path | BinaryIO, polyhex: Polyhex, hypergraph: Dict):
+    """Saves a polyhex, with the names of its recorded graphs, to a binary file
+
+    Args:
+        file (str | Path | BinaryIO): the path of the file, or a binary file object
+        polyhex (Polyhex): the polyhex to save
+        hypergraph (Dict): its graphs. It must record a ``HexagonGraph``.
+    """
+    save_polyhexes(file, [(polyhex, hypergraph)])
+
+
+def _read(file: str | Path | BinaryIO | bytes):
+    if isinstance(file, (str, Path)):
+        data = Path(file).read_bytes()
+    elif isinstance(file, (bytes, bytearray, memoryview)):
+        data = file
+    else:
+        data = file.read()
+    magic, version, header_length = _PREFIX.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("The file is not a polyhex file")
+    if version > FORMAT_VERSION:
+        raise ValueError(f"The file has the format version {version}, but this version of polyhex only reads versions up to {FORMAT_VERSION}")
+    header = json.loads(bytes(data[_PREFIX.size : _PREFIX.size + header_length]))
+    start = _PREFIX.size + header_length
+    arrays = {}
+    for description in header["arrays"]:
+        dtype = np.dtype(description["dtype"])
+        count = int(np.prod(description["shape"], dtype=np.int64))
+        arrays[description["name"]] = np.frombuffer(
+            data, dtype=dtype, count=count, offset=start + description["offset"]
+        ).reshape(description["shape"])
+    return header, arrays
+
+
+def load_stores(file: str | Path | BinaryIO | bytes) -> List[HexagonStore]:
+    """Loads the hexagons of the polyhexes of a binary file, as ``HexagonStore`` objects, without creating any ``Hexagon``
+
+    Args:
+        file (str | Path | BinaryIO | bytes): the path of the file, a binary file object or the content of the file
+
+    Raises:
+        ValueError: A ValueError is raised when the file is not a polyhex file, or when its format version is too recent.
+
+    Returns:
+        List[HexagonStore]: one store per polyhex, in the order in which they were saved
+    """
+    return _stores(*_read(file))
+
+
+def _stores(header: Dict, arrays: Dict[str, np.ndarray]) -> List[HexagonStore]:
+    assets = _decode_assets(header["assets"])
+    vocabularies = {
+        (vocabulary["name"], vocabulary["kind"]): [_from_json(string) for string in vocabulary["strings"]]
+        for vocabulary in header["vocabularies"]
+    }
+    ptr = arrays["ptr"]
+    return [
+        HexagonStore.from_columns(
+            {name: arrays[name][start:stop] for name in _SAVED_COLUMNS},
+            vocabularies,
+            **header["layout"],
+            assets=assets,
+        )
+        for start, stop in zip(ptr[:-1].tolist(), ptr[1:].tolist())
+    ]
+
+
+def load_polyhexes(file: str | Path | BinaryIO | bytes, graphs: Iterable[str] = None) -> List[Tuple[Polyhex, Dict]]:
+    """Loads the polyhexes of a binary file and rebuilds their graphs
+
+    Note:
+        The hexagons keep their features and tokens. The ``BorderHexagon`` objects of the ``HexagonBorderGraph`` are rebuilt as placeholders.
+
+    Args:
+        file (str | Path | BinaryIO | bytes): the path of the file, a binary file object or the content of the file
+        graphs (Iterable[str], optional): the names of the graphs to rebuild, from ``polyhex.objects.graphs``. Defaults to None, i.e to the graphs recorded when saving.
+
+    Returns:
+        List[Tuple[Polyhex, Dict]]: the (polyhex, hypergraph) pairs, in the order in which they were saved
+    """
+    header, arrays = _read(file)
+    names = header["graphs"] if graphs is None else list(graphs)
+    result = []
+    for store in _stores(header, arrays):
+        polyhex = Polyhex(**header["layout"], assets=store.assets)
+        hypergraph = {name: getattr(graphs_module, name)() for name in names}
+        if hypergraph:
+            BulkBuilder(polyhex).build(store.coordinates, hypergraph, store.to_hexagons())
+        result.append((polyhex, hypergraph))
+    return result
+
+
+def load_polyhex(file: str | Path | BinaryIO | bytes, graphs: Iterable[str] = None) -> Tuple[Polyhex, Dict]:
+    """Loads the first polyhex of a binary file and rebuilds its graphs, see ``load_polyhexes``
+
+    Args:
+        file (str | Path | BinaryIO | bytes): the path of the file, a binary file object or the content of the file
+        graphs (Iterable[str], optional): the names of the graphs to rebuild. Defaults to None, i.e to the graphs recorded when saving.
+
+    Returns:
+        Tuple[Polyhex, Dict]: the polyhex and its hypergraph
+    """
+    return load_polyhexes(file, graphs)[0]
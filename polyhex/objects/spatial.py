@@ -0,0 +1,485 @@
+"""Module for the spatial queries on a polyhex.
+
+The queries are answered on the axial lattice rather than by scanning the hexagons:
+    -> a point of the cartesian grid is located in its hexagon by rounding its fractional axial coordinates, in O(1), <br>
+    -> the hexagons within a range, or whose centre is in a rectangle, are enumerated from the bounds of their axial coordinates, <br>
+    -> the nearest vertex and the nearest edge of a point are among the 6 vertices and edges of the hexagon containing it. When this hexagon is not in the polyhex, they are found by brute force over the vertices and edges of the polyhex. <br>
+
+The points are given on the cartesian grid of the ``Hexagon`` class, on which the centre of the hexagon (q, r) is (2q + r, -3r). It is an affine image of the euclidian plane: the euclidian distances are computed after scaling the first coordinate by sqrt(3).
+Each query has a batch variant, which takes a (N, 2) array of points.
+"""
+
+# pylint: disable=line-too-long
+
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from polyhex.objects.decorators import (
+    hex_coord_system_dependent,
+    top_dependent,
+    vertex_orientation_dependent,
+)
+from polyhex.objects.distances import CHUNK_PAIRS
+from polyhex.objects.geometry import VERTEX_OFFSETS, centres, vertex_key, edge_key
+from polyhex.objects.hexagons import Hexagon
+from polyhex.objects.nodes import HexagonVertex
+from polyhex.objects.edges import HexagonEdge
+from polyhex.utilities import pack_coordinates
+
+__all__ = (
+    "hex_round",
+    "point_to_hex",
+    "points_to_hexes",
+    "display_to_cartesian",
+    "hex_range",
+    "hex_rectangle",
+    "SpatialIndex",
+)
+
+# Scaling of the first cartesian coordinate that makes the grid euclidian
+_X_SCALE = math.sqrt(3)
+
+
+######### Lattice #########
+def hex_round(q: float, r: float) -> Tuple[int]:
+    """Rounds fractional axial coordinates to the coordinates of the hexagon containing them, through the cube coordinates
+
+    Args:
+        q (float): fractional first axial coordinate
+        r (float): fractional second axial coordinate
+
+    Returns:
+        Tuple[int]: the axial coordinates of the hexagon
+    """
+    s = -q - r
+    round_q, round_r, round_s = round(q), round(r), round(s)
+    delta_q, delta_r, delta_s = abs(round_q - q), abs(round_r - r), abs(round_s - s)
+    # The coordinate with the largest rounding error is recomputed from the two others
+    if delta_q > delta_r and delta_q > delta_s:
+        round_q = -round_r - round_s
+    elif delta_r > delta_s:
+        round_r = -round_q - round_s
+    return (int(round_q), int(round_r))
+
+
+def point_to_hex(x: float, y: float) -> Tuple[int]:
+    """Returns the axial coordinates of the hexagon containing a point of the cartesian grid
+
+    Args:
+        x (float): first cartesian coordinate of the point
+        y (float): second cartesian coordinate of the point
+
+    Returns:
+        Tuple[int]: the axial coordinates of the hexagon
+    """
+    return hex_round(x / 2 + y / 6, -y / 3)
+
+
+def points_to_hexes(points: np.ndarray) -> np.ndarray:
+    """Batch variant of ``point_to_hex``
+
+    Args:
+        points (np.ndarray): (N, 2) array of points of the cartesian grid
+
+    Returns:
+        np.ndarray: (N, 2) int64 array of the axial coordinates of the hexagons containing them
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    q = points[:, 0] / 2 + points[:, 1] / 6
+    r = -points[:, 1] / 3
+    s = -q - r
+    round_q, round_r, round_s = np.rint(q), np.rint(r), np.rint(s)
+    delta_q, delta_r, delta_s = np.abs(round_q - q), np.abs(round_r - r), np.abs(round_s - s)
+    fix_q = (delta_q > delta_r) & (delta_q > delta_s)
+    fix_r = ~fix_q & (delta_r > delta_s)
+    round_q = np.where(fix_q, -round_r - round_s, round_q)
+    round_r = np.where(fix_r, -round_q - round_s, round_r)
+    return np.stack([round_q, round_r], axis=1).astype(np.int64)
+
+
+def display_to_cartesian(points: np.ndarray, radius: int | float = 1) -> np.ndarray:
+    """Maps display coordinates, as in ``Node.display_coordinates``, back to the cartesian grid
+
+    Args:
+        points (np.ndarray): (N, 2) array of display coordinates
+        radius (int | float, optional): the radius of the hexagons. Defaults to 1.
+
+    Returns:
+        np.ndarray: (N, 2) float64 array of points of the cartesian grid
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    return np.stack(
+        [points[:, 0] / (radius * math.sqrt(3) / 2), points[:, 1] * (radius * 2)], axis=1
+    )
+
+
+def hex_range(hex_coord: Tuple[int], radius: int) -> np.ndarray:
+    """Returns the axial coordinates of the hexagons within `radius` steps of a hexagon, from the bounds of their cube coordinates
+
+    Args:
+        hex_coord (Tuple[int]): the axial coordinates of the central hexagon
+        radius (int): the number of steps
+
+    Returns:
+        np.ndarray: (3 * radius * (radius + 1) + 1, 2) int64 array of axial coordinates, sorted by q then r
+    """
+    steps = np.arange(-radius, radius + 1)
+    delta_q, delta_r = np.meshgrid(steps, steps, indexing="ij")
+    # |dq| <= radius and |dr| <= radius by construction, the third cube coordinate is bounded too
+    inside = np.abs(delta_q + delta_r) <= radius
+    return np.stack(
+        [delta_q[inside] + hex_coord[0], delta_r[inside] + hex_coord[1]], axis=1
+    ).astype(np.int64)
+
+
+def hex_rectangle(x_min: float, y_min: float, x_max: float, y_max: float) -> np.ndarray:
+    """Returns the axial coordinates of the hexagons whose centre is in a rectangle of the cartesian grid
+
+    Args:
+        x_min (float): lower bound of the first cartesian coordinate
+        y_min (float): lower bound of the second cartesian coordinate
+        x_max (float): upper bound of the first cartesian coordinate
+        y_max (float): upper bound of the second cartesian coordinate
+
+    Returns:
+        np.ndarray: (M, 2) int64 array of axial coordinates, sorted by r then q
+    """
+    # y = -3r and x = 2q + r
+    r = np.arange(math.ceil(-y_max / 3), math.floor(-y_min / 3) + 1, dtype=np.int64)
+    q_min = np.ceil((x_min - r) / 2).astype(np.int64)
+    q_max = np.floor((x_max - r) / 2).astype(np.int64)
+    counts = np.maximum(q_max - q_min + 1, 0)
+    rows = np.repeat(r, counts)
+    starts = np.repeat(q_min, counts)
+    # Position of each hexagon in its row
+    ranks = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.stack([starts + ranks, rows], axis=1)
+
+
+######### Distances #########
+def _squared_distances(x, y, other_x, other_y):
+    """Euclidian squared distances between points of the cartesian grid, up to a constant factor"""
+    return ((x - other_x) * _X_SCALE) ** 2 + (y - other_y) ** 2
+
+
+def _segment_squared_distances(x, y, start_x, start_y, end_x, end_y):
+    """Euclidian squared distances between points and segments of the cartesian grid, up to a constant factor"""
+    x, start_x, end_x = x * _X_SCALE, start_x * _X_SCALE, end_x * _X_SCALE
+    delta_x, delta_y = end_x - start_x, end_y - start_y
+    length = delta_x**2 + delta_y**2
+    ratio = np.clip(((x - start_x) * delta_x + (y - start_y) * delta_y) / length, 0, 1)
+    return (x - start_x - ratio * delta_x) ** 2 + (y - start_y - ratio * delta_y) ** 2
+
+
+def _lookup(sorted_codes: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Returns the positions of `codes` in `sorted_codes`, -1 for the codes that are absent"""
+    if len(sorted_codes) == 0:
+        return np.full(codes.shape, -1, dtype=np.int64)
+    positions = np.minimum(np.searchsorted(sorted_codes, codes), len(sorted_codes) - 1)
+    return np.where(sorted_codes[positions] == codes, positions, -1)
+
+
+class SpatialIndex:
+    """
+    SpatialIndex class: answers the point-location and range queries on the hexagons, vertices and edges of a polyhex.
+
+    The index reads the ``HexagonGraph`` of the hypergraph. Its arrays are rebuilt on the first query after the graph changed, i.e after hexagons were appended or removed, see ``Graph.version``, or after a call to ``refresh``.
+    The vertices and the edges are returned from the ``VertexGraph`` and ``EdgeGraph`` of the hypergraph when they are recorded, and from the hexagons otherwise. The batch queries return their canonical ids, see ``polyhex.objects.geometry``.
+
+    Args:
+        polyhex (Polyhex): the polyhex, which defines the layout of the hexagons.
+        hypergraph (Dict): its graphs. It must record a ``HexagonGraph``.
+    """
+
+    def __init__(self, polyhex, hypergraph: Dict):
+        if "HexagonGraph" not in hypergraph:
+            raise ValueError("The spatial index requires a HexagonGraph, but none were found")
+        self.hex_coord_system = polyhex.hex_coord_system
+        self.top = polyhex.top
+        self.vertex_orientation = polyhex.vertex_orientation
+        self._check_layout()
+        self.hypergraph = hypergraph
+        self.hexagon_graph = hypergraph["HexagonGraph"]
+        # Version of the HexagonGraph the arrays were built from, see ``Graph.version``
+        self._indexed_version = None
+        self._tables: Dict = {}
+
+    @hex_coord_system_dependent
+    @top_dependent
+    @vertex_orientation_dependent
+    def _check_layout(self):
+        pass
+
+    ######### Index #########
+    def refresh(self):
+        """Rebuilds the arrays of the index from the ``HexagonGraph``"""
+        self.hexagons: List[Hexagon] = list(self.hexagon_graph.nodes.values())
+        self.coordinates = np.array(list(self.hexagon_graph.nodes), dtype=np.int64).reshape(-1, 2)
+        codes = pack_coordinates(self.coordinates[:, 0], self.coordinates[:, 1])
+        self._sorter = np.argsort(codes, kind="stable")
+        self._sorted_codes = codes[self._sorter]
+        # The vertex and edge tables are built on first use
+        self._tables = {}
+        self._indexed_version = self.hexagon_graph.version
+
+    def _ensure_index(self):
+        if self._indexed_version != self.hexagon_graph.version:
+            self.refresh()
+
+    def positions(self, coordinates: np.ndarray) -> np.ndarray:
+        """Returns the positions in `hexagons` of the hexagons at the given axial coordinates
+
+        Args:
+            coordinates (np.ndarray): (..., 2) array of axial coordinates
+
+        Returns:
+            np.ndarray: (...) int64 array of the positions, -1 for the coordinates outside of the polyhex
+        """
+        self._ensure_index()
+        positions = _lookup(self._sorted_codes, pack_coordinates(coordinates[..., 0], coordinates[..., 1]))
+        return np.where(positions >= 0, self._sorter[np.maximum(positions, 0)], -1)
+
+    def _vertex_table(self):
+        """Unique vertices of the polyhex: ids, (V, 2) coordinates and flat source (6 * hexagon position + vertex index)"""
+        if "vertex" not in self._tables:
+            vertices = (centres(self.coordinates)[:, None, :] + VERTEX_OFFSETS).reshape(-1, 2)
+            ids, first = np.unique(vertex_key(vertices[:, 0], vertices[:, 1]), return_index=True)
+            self._tables["vertex"] = (ids, vertices[first], first)
+        return self._tables["vertex"]
+
+    def _edge_table(self):
+        """Unique edges of the polyhex: ids, (E, 2) start and end coordinates, flat source (6 * hexagon position + edge index) and, for each flat index, the position of its edge in the ids"""
+        if "edge" not in self._tables:
+            starts = centres(self.coordinates)[:, None, :] + VERTEX_OFFSETS
+            ends = np.roll(starts, -1, axis=1)
+            starts, ends = starts.reshape(-1, 2), ends.reshape(-1, 2)
+            ids, first, inverse = np.unique(
+                edge_key(starts[:, 0], starts[:, 1], ends[:, 0], ends[:, 1]), return_index=True, return_inverse=True
+            )
+            self._tables["edge"] = (ids, starts[first], ends[first], first, inverse.reshape(-1))
+        return self._tables["edge"]
+
+    def border_edges(self) -> np.ndarray:
+        """Returns the edges of the hexagons that belong to a single hexagon of the polyhex
+
+        Returns:
+            np.ndarray: (N, 6) boolean array, for the N hexagons of `hexagons` and their 6 edges
+        """
+        self._ensure_index()
+        ids, _, _, _, inverse = self._edge_table()
+        return (np.bincount(inverse, minlength=len(ids))[inverse] == 1).reshape(-1, 6)
+
+    def _vertex(self, key: int, hexagon: Hexagon, index: int) -> HexagonVertex:
+        if "VertexGraph" in self.hypergraph:
+            return self.hypergraph["VertexGraph"].nodes[key]
+        return hexagon.vertices_list[index]
+
+    def _edge(self, key: int, hexagon: Hexagon, index: int) -> HexagonEdge:
+        if "EdgeGraph" in self.hypergraph:
+            return self.hypergraph["EdgeGraph"].nodes[key]
+        return hexagon.edges_list[index]
+
+    ######### Hexagons #########
+    def hexagon_at(self, x: float, y: float) -> Hexagon:
+        """Returns the hexagon containing a point of the cartesian grid
+
+        Args:
+            x (float): first cartesian coordinate of the point
+            y (float): second cartesian coordinate of the point
+
+        Returns:
+            Hexagon: the hexagon, or None if it is not in the polyhex
+        """
+        return self.hexagon_graph.nodes.get(point_to_hex(x, y))
+
+    def hexagons_at(self, points: np.ndarray) -> np.ndarray:
+        """Batch variant of ``hexagon_at``
+
+        Args:
+            points (np.ndarray): (N, 2) array of points of the cartesian grid
+
+        Returns:
+            np.ndarray: (N,) int64 array of the positions of the hexagons in `hexagons`, -1 for the points outside of the polyhex
+        """
+        self._ensure_index()
+        return self.positions(points_to_hexes(points))
+
+    def _select(self, candidates: np.ndarray, inside) -> List[Hexagon]:
+        """Hexagons of the polyhex among the candidates coordinates, or among the hexagons of the polyhex for which `inside` is True, whichever is smaller"""
+        if len(candidates) <= len(self.hexagons):
+            positions = self.positions(candidates)
+            positions = positions[positions >= 0]
+        else:
+            positions = np.flatnonzero(inside(self.coordinates))
+        return [self.hexagons[position] for position in np.sort(positions).tolist()]
+
+    def hexagons_in_range(self, hex_coord: Tuple[int], radius: int) -> List[Hexagon]:
+        """Returns the hexagons of the polyhex within `radius` steps of a hexagon
+
+        Args:
+            hex_coord (Tuple[int]): the axial coordinates of the central hexagon, which does not need to be in the polyhex
+            radius (int): the number of steps
+
+        Returns:
+            List[Hexagon]: the hexagons, in the order in which they were appended
+        """
+        self._ensure_index()
+
+        def inside(coordinates):
+            delta_q, delta_r = coordinates[:, 0] - hex_coord[0], coordinates[:, 1] - hex_coord[1]
+            return (np.abs(delta_q) + np.abs(delta_r) + np.abs(delta_q + delta_r)) <= 2 * radius
+
+        return self._select(hex_range(hex_coord, radius), inside)
+
+    def hexagons_in_rectangle(self, x_min: float, y_min: float, x_max: float, y_max: float) -> List[Hexagon]:
+        """Returns the hexagons of the polyhex whose centre is in a rectangle of the cartesian grid
+
+        Args:
+            x_min (float): lower bound of the first cartesian coordinate
+            y_min (float): lower bound of the second cartesian coordinate
+            x_max (float): upper bound of the first cartesian coordinate
+            y_max (float): upper bound of the second cartesian coordinate
+
+        Returns:
+            List[Hexagon]: the hexagons, in the order in which they were appended
+        """
+        self._ensure_index()
+
+        def inside(coordinates):
+            x, y = centres(coordinates).T
+            return (x_min <= x) & (x <= x_max) & (y_min <= y) & (y <= y_max)
+
+        return self._select(hex_rectangle(x_min, y_min, x_max, y_max), inside)
+
+    ######### Vertices #########
+    def nearest_vertex(self, x: float, y: float) -> HexagonVertex:
+        """Returns the vertex of the polyhex nearest to a point of the cartesian grid
+
+        Args:
+            x (float): first cartesian coordinate of the point
+            y (float): second cartesian coordinate of the point
+
+        Returns:
+            HexagonVertex: the nearest vertex, or None if the polyhex is empty
+        """
+        hexagon = self.hexagon_at(x, y)
+        if hexagon is not None:
+            index = min(
+                range(6),
+                key=lambda i: _squared_distances(x, y, hexagon.vertices_list[i].x, hexagon.vertices_list[i].y),
+            )
+            return self._vertex(hexagon.vertices_list[index].key, hexagon, index)
+        key = int(self.nearest_vertices(np.array([[x, y]]))[0])
+        if key < 0:
+            return None
+        ids, _, sources = self._vertex_table()
+        source = int(sources[np.searchsorted(ids, key)])
+        return self._vertex(key, self.hexagons[source // 6], source % 6)
+
+    def nearest_vertices(self, points: np.ndarray) -> np.ndarray:
+        """Batch variant of ``nearest_vertex``
+
+        Args:
+            points (np.ndarray): (N, 2) array of points of the cartesian grid
+
+        Returns:
+            np.ndarray: (N,) int64 array of the ids of the nearest vertices, -1 if the polyhex is empty
+        """
+        self._ensure_index()
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        result = np.full(len(points), -1, dtype=np.int64)
+        if not self.hexagons:
+            return result
+        # The nearest vertex is one of the vertices of the hexagon containing the point
+        coordinates = points_to_hexes(points)
+        inside = self.positions(coordinates) >= 0
+        vertices = centres(coordinates[inside])[:, None, :] + VERTEX_OFFSETS
+        distances = _squared_distances(
+            points[inside, 0, None], points[inside, 1, None], vertices[..., 0], vertices[..., 1]
+        )
+        nearest = vertices[np.arange(len(vertices)), np.argmin(distances, axis=1)]
+        result[inside] = vertex_key(nearest[:, 0], nearest[:, 1])
+        # Brute force for the points outside of the polyhex
+        outside = np.flatnonzero(~inside)
+        if len(outside):
+            ids, coordinates, _ = self._vertex_table()
+            chunk = max(1, CHUNK_PAIRS // len(ids))
+            for start in range(0, len(outside), chunk):
+                rows = outside[start : start + chunk]
+                distances = _squared_distances(
+                    points[rows, 0, None], points[rows, 1, None], coordinates[:, 0], coordinates[:, 1]
+                )
+                result[rows] = ids[np.argmin(distances, axis=1)]
+        return result
+
+    ######### Edges #########
+    def nearest_edge(self, x: float, y: float) -> HexagonEdge:
+        """Returns the edge of the polyhex nearest to a point of the cartesian grid
+
+        Args:
+            x (float): first cartesian coordinate of the point
+            y (float): second cartesian coordinate of the point
+
+        Returns:
+            HexagonEdge: the nearest edge, or None if the polyhex is empty
+        """
+        hexagon = self.hexagon_at(x, y)
+        if hexagon is not None:
+            index = min(
+                range(6),
+                key=lambda i: _segment_squared_distances(
+                    x, y,
+                    hexagon.edges_list[i].start.x, hexagon.edges_list[i].start.y,
+                    hexagon.edges_list[i].end.x, hexagon.edges_list[i].end.y,
+                ),
+            )
+            return self._edge(hexagon.edges_list[index].key, hexagon, index)
+        key = int(self.nearest_edges(np.array([[x, y]]))[0])
+        if key < 0:
+            return None
+        ids, _, _, sources, _ = self._edge_table()
+        source = int(sources[np.searchsorted(ids, key)])
+        return self._edge(key, self.hexagons[source // 6], source % 6)
+
+    def nearest_edges(self, points: np.ndarray) -> np.ndarray:
+        """Batch variant of ``nearest_edge``
+
+        Args:
+            points (np.ndarray): (N, 2) array of points of the cartesian grid
+
+        Returns:
+            np.ndarray: (N,) int64 array of the ids of the nearest edges, -1 if the polyhex is empty
+        """
+        self._ensure_index()
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        result = np.full(len(points), -1, dtype=np.int64)
+        if not self.hexagons:
+            return result
+        # The nearest edge is one of the edges of the hexagon containing the point
+        coordinates = points_to_hexes(points)
+        inside = self.positions(coordinates) >= 0
+        starts = centres(coordinates[inside])[:, None, :] + VERTEX_OFFSETS
+        ends = np.roll(starts, -1, axis=1)
+        distances = _segment_squared_distances(
+            points[inside, 0, None], points[inside, 1, None],
+            starts[..., 0], starts[..., 1], ends[..., 0], ends[..., 1],
+        )
+        rows, nearest = np.arange(len(starts)), np.argmin(distances, axis=1)
+        result[inside] = edge_key(
+            starts[rows, nearest, 0], starts[rows, nearest, 1], ends[rows, nearest, 0], ends[rows, nearest, 1]
+        )
+        # Brute force for the points outside of the polyhex
+        outside = np.flatnonzero(~inside)
+        if len(outside):
+            ids, starts, ends, _, _ = self._edge_table()
+            chunk = max(1, CHUNK_PAIRS // len(ids))
+            for start in range(0, len(outside), chunk):
+                rows = outside[start : start + chunk]
+                distances = _segment_squared_distances(
+                    points[rows, 0, None], points[rows, 1, None],
+                    starts[:, 0], starts[:, 1], ends[:, 0], ends[:, 1],
+                )
+                result[rows] = ids[np.argmin(distances, axis=1)]
+        return result
@@ -0,0 +1,661 @@
+"""Module for the columnar storage of hexagons.
+
+A ``HexagonStore`` keeps all the hexagons of a board in NumPy arrays (struct-of-arrays) instead of one ``Hexagon`` object, with its 13 children, per cell.
+The features and tokens are stored as integer codes in the vocabularies of the store.
+``HexagonView``, ``VertexView`` and ``EdgeView`` are thin views on one row of the store, created on demand. A full ``Hexagon`` can be created from a row with ``HexagonStore.to_hexagon``.
+"""
+
+# pylint: disable=line-too-long
+# pylint: disable=too-many-instance-attributes
+
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from polyhex.assets import loaders
+from polyhex.objects.decorators import (
+    hex_coord_system_dependent,
+    top_dependent,
+    vertex_orientation_dependent,
+)
+from polyhex.objects.geometry import get_geometry, vertex_key, edge_key
+from polyhex.objects.hexagons import Hexagon
+from polyhex.utilities import pack_coordinates
+
+__all__ = ("HexagonStore", "HexagonView", "VertexView", "EdgeView")
+
+# Name of the column: (shape of a row, dtype)
+COLUMNS: Dict[str, Tuple] = {
+    "q": ((), np.int32),
+    "r": ((), np.int32),
+    "x": ((), np.int32),
+    "y": ((), np.int32),
+    "centre_feature": ((), np.int16),
+    "centre_token": ((), np.int16),
+    "vertex_feature": ((6,), np.int16),
+    "vertex_token": ((6,), np.int16),
+    "edge_feature": ((6,), np.int16),
+    "edge_token": ((6,), np.int16),
+}
+
+# Object name for the columns prefix
+COLUMN_NAMES: Dict[str, str] = {
+    "centre": "HexagonCentre",
+    "vertex": "HexagonVertex",
+    "edge": "HexagonEdge",
+}
+
+
+class HexagonStore:
+    """Columnar storage of hexagons.
+
+    Args:
+        hex_coord_system (str): The hexagonal coordinate system. Defaults to `axial`.
+        top (str): The top of the hexagons. Defaults to `pointy`.
+        radius (int|float): The radius of the hexagons. Defaults to `1`.
+        vertex_orientation (str): The vertex orientation. Defaults to `clockwise`.
+        assets (Dict): The assets of the hexagons. Defaults to the shared table of the defaults_assets.json file.
+        capacity (int): The number of hexagons to allocate memory for. The store grows when needed. Defaults to `0`.
+
+    The columns are exposed as arrays of length ``len(store)``: ``store.q``, ``store.r``, ``store.x``, ``store.y``, ``store.centre_feature``, ``store.centre_token`` and the (N, 6) ``store.vertex_feature``, ``store.vertex_token``, ``store.edge_feature``, ``store.edge_token``.
+    The feature and token columns hold codes, which are the indices of the strings in ``store.vocabularies[(name, kind)]``, with `name` the object name (e.g. `HexagonVertex`) and `kind` either `feature` or `token`.
+    """
+
+    def __init__(
+        self,
+        hex_coord_system: str = "axial",
+        top: str = "pointy",
+        radius: int | float = 1,
+        vertex_orientation: str = "clockwise",
+        assets: Dict = None,
+        capacity: int = 0,
+    ):
+        self.hex_coord_system = hex_coord_system
+        self.top = top
+        self.radius = radius
+        self.vertex_orientation = vertex_orientation
+        self._check_layout()
+        # Shared offsets tables of the layout
+        self.geometry = get_geometry(hex_coord_system, top, vertex_orientation)
+        self.assets = loaders.as_asset_table(
+            loaders.get_assets("default_assets.json") if assets is None else assets
+        )
+        self._size = 0
+        self._columns = {
+            name: np.zeros((capacity,) + shape, dtype=dtype)
+            for name, (shape, dtype) in COLUMNS.items()
+        }
+        # The vocabularies start with the strings known to the encoding assets, so that the codes do not depend on the order of the hexagons
+        self.vocabularies: Dict[Tuple[str], List[str]] = {}
+        self._codes: Dict[Tuple[str], Dict[str, int]] = {}
+        for name in COLUMN_NAMES.values():
+            for kind in ("feature", "token"):
+                self.vocabularies[(name, kind)] = []
+                self._codes[(name, kind)] = {}
+                for string in self.assets.sections[name]["encoding"][kind]:
+                    self.code(name, kind, string)
+        # Sorted packed coordinates, for the coordinates lookups. Invalidated when hexagons are added.
+        self._sorted_index = None
+
+    @hex_coord_system_dependent
+    @top_dependent
+    @vertex_orientation_dependent
+    def _check_layout(self):
+        pass
+
+    ######### Columns #########
+    def __getattr__(self, name):
+        # Only called for the attributes that are not found otherwise: the columns
+        if name in COLUMNS:
+            return self._columns[name][: self._size]
+        raise AttributeError(name)
+
+    def __len__(self):
+        return self._size
+
+    def _reserve(self, size: int):
+        capacity = len(self._columns["q"])
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity, 16)
+        for name, column in self._columns.items():
+            grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            self._columns[name] = grown
+
+    ######### Vocabularies #########
+    def code(self, name: str, kind: str, string) -> int:
+        """Returns the code of a feature or token string, adding it to the vocabulary if needed
+
+        Args:
+            name (str): the object name, `HexagonCentre`, `HexagonVertex` or `HexagonEdge`
+            kind (str): `feature` or `token`
+            string: the feature or token
+
+        Returns:
+            int: the code of the string
+        """
+        codes = self._codes[(name, kind)]
+        if string not in codes:
+            codes[string] = len(codes)
+            self.vocabularies[(name, kind)].append(string)
+        return codes[string]
+
+    def encoding_table(self, name: str, kind: str) -> np.ndarray:
+        """Returns the array that maps the codes of a vocabulary to their encoding value
+
+        Args:
+            name (str): the object name, `HexagonCentre`, `HexagonVertex` or `HexagonEdge`
+            kind (str): `feature` or `token`
+
+        Returns:
+            np.ndarray: the encoding values, indexed by code
+        """
+        encoding_assets = self.assets.sections[name]["encoding"][kind]
+        return np.array(
+            [encoding_assets[string] for string in self.vocabularies[(name, kind)]]
+        )
+
+    def encodings(self, prefix: str = "centre") -> np.ndarray:
+        """Vectorized encodings of the hexagons' nodes or edges
+
+        Args:
+            prefix (str, optional): `centre`, `vertex` or `edge`. Defaults to "centre".
+
+        Returns:
+            np.ndarray: (N, 2) array for the centres, (N, 6, 2) arrays for the vertices and edges. The last dimension is [feature, token] as in ``Node.encoding``.
+        """
+        name = COLUMN_NAMES[prefix]
+        return np.stack(
+            [
+                self.encoding_table(name, "feature")[getattr(self, f"{prefix}_feature")],
+                self.encoding_table(name, "token")[getattr(self, f"{prefix}_token")],
+            ],
+            axis=-1,
+        )
+
+    ######### Adding hexagons #########
+    def _parse_codes(self, name: str, feature) -> np.ndarray:
+        return np.array(
+            [self.code(name, "feature", item) for item in Hexagon._parse_feature(feature)]
+        )
+
+    def append(
+        self,
+        hex_coord: Tuple[int],
+        hexagon_feature="placeholder",
+        vertex_feature="placeholder",
+        edge_feature="placeholder",
+    ) -> int:
+        """Appends a hexagon to the store
+
+        Args:
+            hex_coord (Tuple[int]): the coordinates of the hexagon
+            hexagon_feature (optional): the feature of the hexagon. Defaults to "placeholder".
+            vertex_feature (optional): the feature(s) of the vertices, as for ``Hexagon``. Defaults to "placeholder".
+            edge_feature (optional): the feature(s) of the edges, as for ``Hexagon``. Defaults to "placeholder".
+
+        Returns:
+            int: the index of the hexagon in the store
+        """
+        index = self._size
+        self._reserve(index + 1)
+        q, r = hex_coord
+        columns = self._columns
+        columns["q"][index], columns["r"][index] = q, r
+        columns["x"][index], columns["y"][index] = self.geometry.to_cartesian(q, r)
+        columns["centre_feature"][index] = self.code("HexagonCentre", "feature", hexagon_feature)
+        columns["centre_token"][index] = self.code("HexagonCentre", "token", "placeholder")
+        columns["vertex_feature"][index] = self._parse_codes("HexagonVertex", vertex_feature)
+        columns["vertex_token"][index] = self.code("HexagonVertex", "token", "placeholder")
+        columns["edge_feature"][index] = self._parse_codes("HexagonEdge", edge_feature)
+        columns["edge_token"][index] = self.code("HexagonEdge", "token", "placeholder")
+        self._size += 1
+        self._sorted_index = None
+        return index
+
+    def extend(self, coordinates: np.ndarray):
+        """Appends placeholder hexagons at the given coordinates, in a single vectorized pass
+
+        Args:
+            coordinates (np.ndarray): (N, 2) array of the coordinates of the hexagons
+        """
+        coordinates = np.asarray(coordinates).reshape(-1, 2)
+        start, stop = self._size, self._size + len(coordinates)
+        self._reserve(stop)
+        columns = self._columns
+        columns["q"][start:stop], columns["r"][start:stop] = coordinates[:, 0], coordinates[:, 1]
+        centres = coordinates.astype(np.int64) @ np.array(self.geometry.cartesian).T
+        columns["x"][start:stop], columns["y"][start:stop] = centres[:, 0], centres[:, 1]
+        for prefix, name in COLUMN_NAMES.items():
+            columns[f"{prefix}_feature"][start:stop] = self.code(name, "feature", "placeholder")
+            columns[f"{prefix}_token"][start:stop] = self.code(name, "token", "placeholder")
+        self._size = stop
+        self._sorted_index = None
+
+    @classmethod
+    def from_coordinates(cls, coordinates: np.ndarray, **kwargs):
+        """Creates a store of placeholder hexagons at the given coordinates
+
+        Args:
+            coordinates (np.ndarray): (N, 2) array of the coordinates of the hexagons
+            kwargs: the layout and assets arguments of ``HexagonStore``
+
+        Returns:
+            HexagonStore: the store
+        """
+        coordinates = np.asarray(coordinates).reshape(-1, 2)
+        store = cls(capacity=len(coordinates), **kwargs)
+        store.extend(coordinates)
+        return store
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Dict[str, np.ndarray],
+        vocabularies: Dict[Tuple[str], List] = None,
+        **kwargs,
+    ):
+        """Creates a store from arrays of coordinates and codes, for instance the columns of another store
+
+        Args:
+            columns (Dict[str, np.ndarray]): the `q` and `r` columns, and optionally the feature and token columns. The `x` and `y` columns are recomputed.
+            vocabularies (Dict[Tuple[str], List], optional): the vocabularies the codes of `columns` refer to. Defaults to None, i.e to the vocabularies of the new store.
+            kwargs: the layout and assets arguments of ``HexagonStore``
+
+        Returns:
+            HexagonStore: the store
+        """
+        coordinates = np.stack([np.asarray(columns["q"]), np.asarray(columns["r"])], axis=1)
+        store = cls.from_coordinates(coordinates, **kwargs)
+        for prefix, name in COLUMN_NAMES.items():
+            for kind in ("feature", "token"):
+                column = f"{prefix}_{kind}"
+                if column not in columns:
+                    continue
+                codes = np.asarray(columns[column])
+                if vocabularies is not None:
+                    # Translates the codes into the vocabulary of the new store
+                    table = np.array(
+                        [store.code(name, kind, string) for string in vocabularies[(name, kind)]],
+                        dtype=COLUMNS[column][1],
+                    )
+                    codes = table[codes] if len(table) else codes
+                store._columns[column][: len(store)] = codes
+        return store
+
+    @classmethod
+    def from_hexagons(cls, hexagons: Iterable[Hexagon]):
+        """Creates a store from hexagons, keeping their features and tokens
+
+        Args:
+            hexagons (Iterable[Hexagon]): the hexagons, for instance the nodes of a ``HexagonGraph``. They must share the same layout.
+
+        Returns:
+            HexagonStore: the store
+        """
+        hexagons = list(hexagons)
+        if not hexagons:
+            return cls()
+        first = hexagons[0]
+        store = cls(
+            hex_coord_system=first.hex_coord_system,
+            top=first.top,
+            radius=first.radius,
+            vertex_orientation=first.vertex_orientation,
+            assets=first.assets,
+            capacity=len(hexagons),
+        )
+        for hexagon in hexagons:
+            index = store.append(
+                hexagon.hex_coord,
+                hexagon.centre.feature,
+                [vertex.feature for vertex in hexagon.vertices_list],
+                [edge.feature for edge in hexagon.edges_list],
+            )
+            columns = store._columns
+            columns["centre_token"][index] = store.code("HexagonCentre", "token", hexagon.centre.token)
+            columns["vertex_token"][index] = [
+                store.code("HexagonVertex", "token", vertex.token) for vertex in hexagon.vertices_list
+            ]
+            columns["edge_token"][index] = [
+                store.code("HexagonEdge", "token", edge.token) for edge in hexagon.edges_list
+            ]
+        return store
+
+    ######### Queries #########
+    @property
+    def coordinates(self) -> np.ndarray:
+        """(N, 2) array of the hex coordinates"""
+        return np.stack([self.q, self.r], axis=1)
+
+    def vertex_coordinates(self) -> np.ndarray:
+        """(N, 6, 2) array of the cartesian coordinates of the vertices"""
+        centres = np.stack([self.x, self.y], axis=1).astype(np.int64)
+        return centres[:, None, :] + np.array(self.geometry.vertex_offsets)
+
+    def vertex_keys(self) -> np.ndarray:
+        """(N, 6) array of the canonical ids of the vertices, see ``polyhex.objects.geometry.vertex_key``"""
+        vertices = self.vertex_coordinates()
+        return vertex_key(vertices[..., 0], vertices[..., 1])
+
+    def edge_keys(self) -> np.ndarray:
+        """(N, 6) array of the canonical ids of the edges, see ``polyhex.objects.geometry.edge_key``"""
+        vertices = self.vertex_coordinates()
+        ends = np.roll(vertices, -1, axis=1)
+        return edge_key(vertices[..., 0], vertices[..., 1], ends[..., 0], ends[..., 1])
+
+    def index_of(self, hex_coord: Tuple[int]) -> int:
+        """Returns the index of the hexagon at the given coordinates
+
+        Args:
+            hex_coord (Tuple[int]): the coordinates of the hexagon
+
+        Raises:
+            KeyError: A KeyError is raised when there is no hexagon at these coordinates.
+
+        Returns:
+            int: the index of the hexagon in the store
+        """
+        if self._sorted_index is None:
+            codes = pack_coordinates(self.q.astype(np.int64), self.r.astype(np.int64))
+            sorter = np.argsort(codes, kind="stable")
+            self._sorted_index = (codes[sorter], sorter)
+        sorted_codes, sorter = self._sorted_index
+        code = pack_coordinates(int(hex_coord[0]), int(hex_coord[1]))
+        position = int(np.searchsorted(sorted_codes, code))
+        if position == len(sorted_codes) or sorted_codes[position] != code:
+            raise KeyError(f"There is no hexagon at coordinates {hex_coord}")
+        return int(sorter[position])
+
+    def __getitem__(self, index: int) -> "HexagonView":
+        if not -self._size <= index < self._size:
+            raise IndexError(f"Index {index} out of range for a store of {self._size} hexagons")
+        return HexagonView(self, index % self._size)
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield HexagonView(self, index)
+
+    def _placeholder_code(self, name: str, kind: str) -> int:
+        # Code of the default feature or token of the hexagons and their nodes, -1 when the vocabulary does not know it
+        return self._codes[(name, kind)].get("placeholder", -1)
+
+    def to_hexagon(self, index: int) -> Hexagon:
+        """Creates the full ``Hexagon`` of a row of the store, with its features and tokens
+
+        Note:
+            Only the nodes whose token differs from the placeholder default are created, the others are left to be created on first access, see ``Hexagon.vertex`` and ``Hexagon.edge``.
+
+        Args:
+            index (int): the index of the hexagon in the store
+
+        Returns:
+            Hexagon: the hexagon
+        """
+        columns = self._columns
+
+        def features(name, prefix):
+            codes = columns[f"{prefix}_feature"][index].tolist()
+            vocabulary = self.vocabularies[(name, "feature")]
+            if isinstance(codes, int):
+                return vocabulary[codes]
+            placeholder = self._placeholder_code(name, "feature")
+            if all(code == placeholder for code in codes):
+                return "placeholder"
+            return [vocabulary[code] for code in codes]
+
+        def set_tokens(name, prefix, get_node):
+            codes = columns[f"{prefix}_token"][index].tolist()
+            vocabulary = self.vocabularies[(name, "token")]
+            placeholder = self._placeholder_code(name, "token")
+            for node_index, code in enumerate(codes if isinstance(codes, list) else [codes]):
+                if code != placeholder:
+                    get_node(node_index).token = vocabulary[code]
+
+        hexagon = Hexagon(
+            hex_coord_system=self.hex_coord_system,
+            hex_coord=(int(columns["q"][index]), int(columns["r"][index])),
+            top=self.top,
+            radius=self.radius,
+            vertex_orientation=self.vertex_orientation,
+            assets=self.assets,
+            hexagon_feature=features("HexagonCentre", "centre"),
+            vertex_feature=features("HexagonVertex", "vertex"),
+            edge_feature=features("HexagonEdge", "edge"),
+        )
+        set_tokens("HexagonCentre", "centre", lambda _: hexagon.centre)
+        set_tokens("HexagonVertex", "vertex", hexagon.vertex)
+        set_tokens("HexagonEdge", "edge", hexagon.edge)
+        return hexagon
+
+    def to_hexagons(self) -> List[Hexagon]:
+        """Creates the full ``Hexagon`` of every row of the store
+
+        Returns:
+            List[Hexagon]: the hexagons
+        """
+        # The rows whose codes are all the placeholder defaults are plain hexagons, found with one array comparison per column
+        plain = np.ones(self._size, dtype=bool)
+        for prefix, name in COLUMN_NAMES.items():
+            for kind in ("feature", "token"):
+                codes = getattr(self, f"{prefix}_{kind}").reshape(self._size, -1)
+                plain &= (codes == self._placeholder_code(name, kind)).all(axis=1)
+        layout = {
+            "hex_coord_system": self.hex_coord_system,
+            "top": self.top,
+            "radius": self.radius,
+            "vertex_orientation": self.vertex_orientation,
+            "assets": self.assets,
+        }
+        return [
+            Hexagon(hex_coord=(q, r), **layout) if is_plain else self.to_hexagon(index)
+            for index, (q, r, is_plain) in enumerate(zip(self.q.tolist(), self.r.tolist(), plain.tolist()))
+        ]
+
+    def nbytes(self) -> int:
+        """Returns the number of bytes used by the columns of the store"""
+        return sum(column[: self._size].nbytes for column in self._columns.values())
+
+
+class _StoreView:
+    """Base class of the views: a feature and a token stored in the `prefix` columns of a row of the store"""
+
+    __slots__ = ("store", "index")
+    prefix: str = ""
+    name: str = ""
+
+    def _column_index(self):
+        return self.index
+
+    @property
+    def feature(self):
+        """The feature of the viewed object"""
+        code = self.store._columns[f"{self.prefix}_feature"][self._column_index()]
+        return self.store.vocabularies[(self.name, "feature")][code]
+
+    @property
+    def token(self):
+        """The token of the viewed object"""
+        code = self.store._columns[f"{self.prefix}_token"][self._column_index()]
+        return self.store.vocabularies[(self.name, "token")][code]
+
+    @property
+    def encoding(self) -> List:
+        """The encoding of the viewed object, as in ``Node.encoding``"""
+        encoding_assets = self.store.assets.sections[self.name]["encoding"]
+        return [
+            encoding_assets["feature"][self.feature],
+            encoding_assets["token"][self.token],
+        ]
+
+    def add_token(self, new_token: str):
+        """Method to add a token on the viewed object. The token is written in the store.
+
+        Args:
+            new_token (str): str identifier of the token.
+        """
+        assert (
+            new_token in self.store.assets.sections[self.name]["compatibility"][self.feature]
+        ), f"The token {new_token} is not compatible with the slot {self.feature} for {self.name} nodes"
+        self.store._columns[f"{self.prefix}_token"][self._column_index()] = self.store.code(
+            self.name, "token", new_token
+        )
+
+    def __eq__(self, other):
+        return (
+            type(self) is type(other)
+            and self.store is other.store
+            and self._column_index() == other._column_index()
+        )
+
+    def __hash__(self):
+        return hash((type(self), id(self.store), self._column_index()))
+
+
+class HexagonView(_StoreView):
+    """View on a hexagon of a ``HexagonStore``.
+
+    Args:
+        store (HexagonStore): the store
+        index (int): the index of the hexagon in the store
+    """
+
+    __slots__ = ()
+    prefix = "centre"
+    name = "HexagonCentre"
+
+    def __init__(self, store: HexagonStore, index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def hex_coord(self) -> Tuple[int]:
+        """The coordinates of the hexagon"""
+        columns = self.store._columns
+        return (int(columns["q"][self.index]), int(columns["r"][self.index]))
+
+    spatial_key = hex_coord
+
+    @property
+    def x(self) -> int:
+        """The first coordinate of the hexagon's centre on the cartesian grid"""
+        return int(self.store._columns["x"][self.index])
+
+    @property
+    def y(self) -> int:
+        """The second coordinate of the hexagon's centre on the cartesian grid"""
+        return int(self.store._columns["y"][self.index])
+
+    @property
+    def vertices(self) -> List["VertexView"]:
+        """Views on the 6 vertices of the hexagon"""
+        return [VertexView(self.store, self.index, position) for position in range(6)]
+
+    @property
+    def edges(self) -> List["EdgeView"]:
+        """Views on the 6 edges of the hexagon"""
+        return [EdgeView(self.store, self.index, position) for position in range(6)]
+
+    def to_hexagon(self) -> Hexagon:
+        """Creates the full ``Hexagon`` of the view"""
+        return self.store.to_hexagon(self.index)
+
+    def __repr__(self):
+        return f"HexagonView : {self.hex_coord}"
+
+
+class VertexView(_StoreView):
+    """View on a vertex of a hexagon of a ``HexagonStore``.
+
+    Args:
+        store (HexagonStore): the store
+        index (int): the index of the hexagon in the store
+        position (int): the index of the vertex in the hexagon
+    """
+
+    __slots__ = ("position",)
+    prefix = "vertex"
+    name = "HexagonVertex"
+
+    def __init__(self, store: HexagonStore, index: int, position: int):
+        self.store = store
+        self.index = index
+        self.position = position
+
+    def _column_index(self):
+        return (self.index, self.position)
+
+    @property
+    def spatial_key(self) -> Tuple[int]:
+        """The cartesian coordinates of the vertex"""
+        columns = self.store._columns
+        offset = self.store.geometry.vertex_offsets[self.position]
+        return (
+            int(columns["x"][self.index] + offset[0]),
+            int(columns["y"][self.index] + offset[1]),
+        )
+
+    @property
+    def key(self) -> int:
+        """The canonical id of the vertex, as in ``HexagonVertex``"""
+        return vertex_key(*self.spatial_key)
+
+    @property
+    def x(self) -> int:
+        """The first coordinate of the vertex on the cartesian grid"""
+        return self.spatial_key[0]
+
+    @property
+    def y(self) -> int:
+        """The second coordinate of the vertex on the cartesian grid"""
+        return self.spatial_key[1]
+
+    def __repr__(self):
+        return f"VertexView : {self.spatial_key}"
+
+
+class EdgeView(_StoreView):
+    """View on an edge of a hexagon of a ``HexagonStore``.
+
+    Args:
+        store (HexagonStore): the store
+        index (int): the index of the hexagon in the store
+        position (int): the index of the edge in the hexagon
+    """
+
+    __slots__ = ("position",)
+    prefix = "edge"
+    name = "HexagonEdge"
+
+    def __init__(self, store: HexagonStore, index: int, position: int):
+        self.store = store
+        self.index = index
+        self.position = position
+
+    def _column_index(self):
+        return (self.index, self.position)
+
+    @property
+    def start(self) -> VertexView:
+        """View on the start vertex of the edge"""
+        return VertexView(self.store, self.index, self.position)
+
+    @property
+    def end(self) -> VertexView:
+        """View on the end vertex of the edge"""
+        return VertexView(self.store, self.index, (self.position + 1) % 6)
+
+    @property
+    def spatial_key(self) -> frozenset:
+        """The spatial key of the edge, as in ``HexagonEdge``"""
+        return frozenset((self.start.spatial_key, self.end.spatial_key))
+
+    @property
+    def key(self) -> int:
+        """The canonical id of the edge, as in ``HexagonEdge``"""
+        start, end = self.start.spatial_key, self.end.spatial_key
+        return edge_key(start[0], start[1], end[0], end[1])
+
+    def __repr__(self):
+        return f"EdgeView : {self.start.spatial_key} -> {self.end.spatial_key}"
@@ -1,3 +1,3 @@
-from .utils import replicate_vector
+from .utils import replicate_vector, pack_coordinates
 
-__all__ = ('replicate_vector',)
\ No newline at end of file
+__all__ = ('replicate_vector', 'pack_coordinates')
@@ -0,0 +1,73 @@
+"""Lazy loading of the modules that depend on optional dependencies.
+
+The rendering depends on matplotlib, the exporters and the datasets on torch and torch_geometric.
+The packages only import these modules on the first access to their attributes, so that importing polyhex to build boards does not pay for them.
+"""
+
+# pylint: disable=line-too-long
+
+from importlib import import_module
+from types import ModuleType
+from typing import Callable, Dict, Tuple
+
+__all__ = ("OPTIONAL_DEPENDENCIES", "import_optional", "lazy_attributes")
+
+# Optional dependency: extra of the polyhex distribution that installs it
+OPTIONAL_DEPENDENCIES: Dict[str, str] = {
+    "matplotlib": "render",
+    "torch": "pyg",
+    "torch_geometric": "pyg",
+}
+
+
+def import_optional(name: str, package: str = None) -> ModuleType:
+    """Imports a module, naming the extra to install when an optional dependency is missing
+
+    Args:
+        name (str): the name of the module, relative to `package` if it starts with a dot
+        package (str, optional): the package of a relative name. Defaults to None.
+
+    Raises:
+        ModuleNotFoundError: the module, or one of its dependencies, is not installed
+
+    Returns:
+        ModuleType: the module
+    """
+    try:
+        return import_module(name, package)
+    except ModuleNotFoundError as error:
+        dependency = (error.name or "").split(".")[0]
+        if dependency not in OPTIONAL_DEPENDENCIES:
+            raise
+        extra = OPTIONAL_DEPENDENCIES[dependency]
+        raise ModuleNotFoundError(
+            f"The {dependency} package is needed by {name if package is None else package + name}. Install it with `pip install polyhex[{extra}]`",
+            name=error.name,
+        ) from error
+
+
+def lazy_attributes(package: str, attributes: Dict[str, str], namespace: Dict) -> Tuple[Callable]:
+    """Returns the module-level ``__getattr__`` and ``__dir__`` of a package whose attributes are imported on first access
+
+    Args:
+        package (str): the name of the package, i.e its ``__name__``
+        attributes (Dict[str, str]): the lazy attributes, mapped to the name of the module that defines them, relative to the package. An attribute that has the name of its module is the module itself.
+        namespace (Dict): the namespace of the package, i.e its ``globals()``
+
+    Returns:
+        Tuple[Callable]: the ``__getattr__`` and ``__dir__`` functions of the package
+    """
+
+    def __getattr__(name: str):
+        if name not in attributes:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = import_optional(attributes[name], package)
+        value = module if module.__name__.rsplit(".", 1)[-1] == name else getattr(module, name)
+        # Stored in the namespace, so that ``__getattr__`` is only called on the first access
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
@@ -1,5 +1,24 @@
+PACK_OFFSET = 1 << 30
+PACK_SHIFT = 31
+
+
 def replicate_vector(vector, n:int):
     if isinstance(vector, (list)):
         return n * vector
     else:
-        raise NotImplementedError(f'The function `replicate_vector` is not implemented for lists, got {type(vector)}')
\ No newline at end of file
+        raise NotImplementedError(f'The function `replicate_vector` is not implemented for lists, got {type(vector)}')
+
+
+def pack_coordinates(first, second):
+    """Packs a pair of integer coordinates into a single integer.
+
+    It works on python integers and on numpy int64 arrays alike. The coordinates must be in [-2**30, 2**30), the packed integers are then non-negative and fit in an int64.
+
+    Args:
+        first (int | np.ndarray): first coordinates
+        second (int | np.ndarray): second coordinates
+
+    Returns:
+        int | np.ndarray: the packed integers
+    """
+    return ((first + PACK_OFFSET) << PACK_SHIFT) | (second + PACK_OFFSET)
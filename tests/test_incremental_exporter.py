@@ -0,0 +1,52 @@
+"""Tests of the incremental export of the polyhex graphs"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("torch_geometric")
+
+# pylint: disable=wrong-import-position
+from polyhex.objects import Polyhex, IncrementalPyGExporter
+from polyhex.objects.graphs import HexagonGraph, HexagonBorderGraph, EdgeGraph
+
+
+def _hypergraph():
+    return {"HexagonGraph": HexagonGraph(), "HexagonBorderGraph": HexagonBorderGraph(), "EdgeGraph": EdgeGraph()}
+
+
+def _assert_matches(graph, data):
+    """The exported tensors hold the live nodes and the connexions of the graph"""
+    node_to_index = graph.node_to_index
+    node_mask = data.node_mask.numpy()
+    assert node_mask.sum() == graph.n_nodes
+    assert all(node_mask[index] for index in node_to_index.values())
+    expected = sorted(
+        (node_to_index[key], node_to_index[other_key]) for key in graph.nodes for other_key in graph.weights[key]
+    )
+    assert sorted(zip(*data.edge_index.tolist())) == expected
+
+
+def test_exporters_sharing_a_graph():
+    hypergraph = _hypergraph()
+    polyhex = Polyhex.create_spiral(1, hypergraph)
+    first, second = IncrementalPyGExporter(), IncrementalPyGExporter()
+    first.export_graphs(hypergraph)
+    border_hexagon = next(iter(hypergraph["HexagonBorderGraph"].nodes.values()))
+    polyhex.append_hex(border_hexagon, hypergraph)
+    # The second exporter checkpoints the changes the first exporter has not applied yet
+    second.export_graphs(hypergraph)
+    for exporter in (first, second):
+        exported = exporter.export_graphs(hypergraph)
+        for name, graph in hypergraph.items():
+            _assert_matches(graph, exported[name])
+
+
+def test_exports_follow_the_changes():
+    hypergraph = _hypergraph()
+    polyhex = Polyhex.create_from_number(1, hypergraph, random_generator=np.random.default_rng(0))
+    exporter = IncrementalPyGExporter()
+    for _ in range(20):
+        exported = exporter.export_graphs(hypergraph)
+        for name, graph in hypergraph.items():
+            _assert_matches(graph, exported[name])
+        polyhex.append_hex(hypergraph["HexagonBorderGraph"].sample(polyhex.random_generator), hypergraph)